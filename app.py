@@ -1,121 +1,684 @@
-from django.contrib.auth import get_user_model
-from django.test import LiveServerTestCase
+from contextlib import contextmanager
+from django.contrib import admin
+from django.db import connection
+from django.test import LiveServerTestCase, modify_settings
 from django.urls import reverse
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
+import inspect
+import logging
+import threading
 import time
+import unittest
 
+from django_admin_tester.actions import ActionChecker
+from django_admin_tester.artifacts import artifact_store
+from django_admin_tester.async_checker import AsyncChecker
+from django_admin_tester.browsers import BrowserFactory
+from django_admin_tester.auth import (
+    add_session_cookie,
+    create_session,
+    ensure_admin_user,
+)
+from django_admin_tester.changelist import changelist_path, changelist_urls
+from django_admin_tester.client import ClientChecker
+from django_admin_tester.crawler import ParallelCrawler
+from django_admin_tester.devtools import collect_metrics
+from django_admin_tester.fingerprint import ResultCache, admin_fingerprint
+from django_admin_tester.fixtures import seed_model
+from django_admin_tester.forms import FormChecker
+from django_admin_tester.indexes import IndexAdvisor, summarize_advice, write_advice
+from django_admin_tester.load import LoadTester, LockMonitor, load_mix
+from django_admin_tester.pagination import PaginationChecker
+from django_admin_tester.queries import format_fingerprints, repeated_queries
+from django_admin_tester.registry import discover_models, registry_urls
+from django_admin_tester.reporting import ResultRecord, ResultStream
+from django_admin_tester.settings import admin_tester_settings
+from django_admin_tester.sharding import (
+    current_shard,
+    recorded_durations,
+    report_path,
+    shard_groups,
+    timings_path,
+)
+from django_admin_tester.timing import (
+    Interaction,
+    ServerTiming,
+    TimingReport,
+    request_key,
+    server_timings,
+)
+from django_admin_tester.waits import CHANGELIST_MARKER, NavigationWaiter
 
+logger = logging.getLogger(__name__)
+
+# Failure messages shown when a test fails; the result stream has them all.
+MAX_FAILURE_MESSAGES = 50
+
+
+def log_summary(title, path, body):
+    """Log a report's summary and where its full report was written."""
+    logger.info("%s, full report in %s\n%s", title, path, body)
+
+
+@modify_settings(
+    MIDDLEWARE={'append': 'django_admin_tester.middleware.ServerTimingMiddleware'}
+)
 class AdminPageTest(LiveServerTestCase):
+    site = admin.site
     model_class = None
     test_filters = []
+    parallel_workers = None
+    changelist_engine = None
+    browser_type = None
+    browser_profile = None
+    fixture_rows = 0
+    fixture_distributions = {}
+    max_queries = None
+    query_budgets = {}
+    filter_combinations = None
+    index_advice = None
+    action_sizes = None
 
     @classmethod
     def setUpClass(cls):
+        cls.check_configuration()
+        cls.result_cache = ResultCache()
+        cls.fingerprints = {}
+        cls.models_to_test = cls.stale_models(cls.get_model_classes())
+        if not cls.models_to_test:
+            raise unittest.SkipTest("Admins unchanged since their last passing run")
         super().setUpClass()
-        if not cls.model_class:
-            raise ValueError("model_class attribute must be set")
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        cls.selenium = webdriver.Chrome(options=chrome_options)
-        cls.selenium.implicitly_wait(10)
+        cls.selenium = BrowserFactory.acquire_browser(
+            cls.browser_type, profile=cls.browser_profile
+        )
+        cls.selenium.implicitly_wait(admin_tester_settings.IMPLICIT_WAIT)
+        cls.waiter = NavigationWaiter(cls.selenium)
+        cls.timing_report = TimingReport()
+        cls.index_suggestions = []
+        cls.result_stream = ResultStream(
+            report_path(cls.__name__, 'results', extension=None)
+        )
 
     @classmethod
     def tearDownClass(cls):
-        cls.selenium.quit()
+        logger.info("%s: %s", cls.__name__, cls.waiter.report())
+        if cls.timing_report.interactions:
+            path = cls.timing_report.write_json(timings_path(cls.__name__))
+            log_summary(
+                f"{cls.__name__} latency (seconds)",
+                path,
+                cls.timing_report.format_summary(),
+            )
+        if cls.index_suggestions:
+            path = write_advice(
+                cls.index_suggestions, report_path(cls.__name__, 'indexes')
+            )
+            lines = []
+            for model, suggestions in summarize_advice(cls.index_suggestions).items():
+                lines.append(model)
+                lines.extend(f"    {suggestion}" for suggestion in suggestions)
+            log_summary(f"{cls.__name__} index suggestions", path, '\n'.join(lines))
+        cls.result_stream.close()
+        BrowserFactory.release_browser(cls.selenium)
         super().tearDownClass()
 
+    @classmethod
+    def check_configuration(cls):
+        if not cls.model_class:
+            raise ValueError("model_class attribute must be set")
+
+    @classmethod
+    def get_model_classes(cls):
+        return [cls.model_class]
+
+    @classmethod
+    def cache_label(cls, model_class):
+        return f"{cls.__module__}.{cls.__qualname__}:{model_class._meta.label}"
+
+    @classmethod
+    def stale_models(cls, model_classes):
+        """Return the models whose admin changed since it last passed.
+
+        Every model is stale unless ``INCREMENTAL`` is on; ``FORCE_FULL_RUN``
+        still fingerprints the admins so later runs can skip them.
+        """
+        if not admin_tester_settings.INCREMENTAL:
+            return list(model_classes)
+        try:
+            source = inspect.getsource(cls)
+        except (OSError, TypeError):
+            source = cls.__qualname__
+        for model_class in model_classes:
+            cls.fingerprints[model_class] = admin_fingerprint(
+                model_class, cls.site, extra=source
+            )
+        if admin_tester_settings.FORCE_FULL_RUN:
+            return list(model_classes)
+        return [
+            model_class
+            for model_class in model_classes
+            if not cls.result_cache.is_fresh(
+                cls.cache_label(model_class), cls.fingerprints[model_class]
+            )
+        ]
+
+    def record_results(self, failed_models, model_classes=None):
+        """Store the fingerprint of every tested admin that passed."""
+        if not self.fingerprints:
+            return
+        if model_classes is None:
+            model_classes = self.models_to_test
+        for model_class in model_classes:
+            self.result_cache.record(
+                self.cache_label(model_class),
+                self.fingerprints[model_class],
+                model_class not in failed_models,
+            )
+        self.result_cache.save()
+
     def setUp(self):
-        User = get_user_model()
-        self.admin_user = User.objects.create_superuser(
-            username='admin', email='admin@example.com', password='admin123'
-        )
+        if self.fixture_rows:
+            seed_model(
+                self.model_class, self.fixture_rows, self.fixture_distributions
+            )
+        self.admin_user = ensure_admin_user()
+        self.session_key = None
         self.failed_actions = []
+        self.failure_count = 0
+        self.failed_labels = set()
+        # Crawler workers report from their own threads.
+        self.failure_lock = threading.Lock()
+
+    @staticmethod
+    def shares_database_connection():
+        """Whether the live server serves every thread from one connection.
+
+        Django hands the test thread's connection to the live server for
+        in-memory SQLite, which breaks under concurrent requests.
+        """
+        return connection.vendor == 'sqlite' and connection.is_in_memory_db()
+
+    def model_label(self, model=None):
+        if model is None:
+            model = self.model_class._meta.label if self.model_class else ''
+        return model
 
-    def login_admin(self):
-        self.selenium.get(f"{self.live_server_url}/admin/")
-        username_input = self.selenium.find_element(By.NAME, "username")
-        password_input = self.selenium.find_element(By.NAME, "password")
-        username_input.send_keys("admin")
-        password_input.send_keys("admin123")
-        self.selenium.find_element(By.CSS_SELECTOR, "input[type='submit']").click()
+    def report(
+        self,
+        kind,
+        target,
+        label='',
+        url='',
+        duration=None,
+        message=None,
+        model=None,
+        server=None,
+        artifacts=(),
+        browser=None,
+    ):
+        """Stream the outcome of one check to the result files.
+
+        Failed checks also fail the test; only the first
+        ``MAX_FAILURE_MESSAGES`` messages are kept for its failure message.
+        Safe to call from crawler worker threads.
+        """
+        model = self.model_label(model)
+        record = self.result_stream.write(
+            ResultRecord(
+                model,
+                kind,
+                str(target),
+                str(label),
+                url,
+                'failed' if message else 'passed',
+                duration,
+                server.duration if server else None,
+                server.queries if server else None,
+                message or '',
+                tuple(artifacts),
+                browser=browser,
+            )
+        )
+        if message:
+            with self.failure_lock:
+                self.failure_count += 1
+                self.failed_labels.add(model)
+                if len(self.failed_actions) < MAX_FAILURE_MESSAGES:
+                    self.failed_actions.append(message)
+        return record
+
+    def record_interaction(
+        self,
+        kind,
+        target,
+        label,
+        duration,
+        url=None,
+        model=None,
+        message=None,
+        artifacts=(),
+        browser=None,
+    ):
+        """Add an interaction to the timing report and stream its result.
+
+        Query budget and N+1 problems, measured by the server, fail the
+        interaction along with ``message``.
+        """
+        url = url or self.selenium.current_url
+        model = self.model_label(model)
+        server = server_timings.pop(url)
+        messages = [message] if message else []
+        if server is not None:
+            messages.extend(
+                self.check_queries(kind, label or target, url, server.statements)
+            )
+        if duration is not None:
+            self.timing_report.add(
+                Interaction(
+                    model,
+                    kind,
+                    str(target),
+                    str(label),
+                    url,
+                    duration,
+                    server.duration if server else None,
+                    server.queries if server else None,
+                )
+            )
+        return self.report(
+            kind,
+            target,
+            label,
+            url,
+            duration,
+            '\n'.join(messages) or None,
+            model,
+            server,
+            artifacts,
+            browser,
+        )
+
+    def check_queries(self, kind, label, url, statements):
+        """Return the query budget and repeated query problems of a page.
+
+        ``query_budgets`` maps an interaction kind (``changelist``, ``filter``,
+        ``sort``, ``search``, ``page``, ``pagination``, ``add``, ``change``) to
+        its budget and falls back to ``max_queries``.
+        """
+        problems = []
+        budget = self.query_budgets.get(kind, self.max_queries)
+        if budget is not None and len(statements) > budget:
+            problems.append(
+                f"Query budget exceeded on {kind} {label} ({url}): "
+                f"{len(statements)} queries > {budget}\n"
+                f"{format_fingerprints(statements)}"
+            )
+        threshold = admin_tester_settings.DUPLICATE_QUERY_THRESHOLD
+        repeated = repeated_queries(statements, threshold) if threshold else []
+        if repeated:
+            details = '\n'.join(f"    {count}x {sql}" for sql, count in repeated)
+            problems.append(
+                f"Repeated queries (possible N+1) on {kind} {label} ({url}):\n"
+                f"{details}"
+            )
+        return problems
+
+    def record_url_result(
+        self, item, duration, message=None, artifacts=(), browser=None
+    ):
+        """Record the result of a ``ChangelistUrl`` as an engine checks it."""
+        self.record_interaction(
+            item.kind,
+            item.target,
+            item.label,
+            duration,
+            url=item.url,
+            model=item.model or None,
+            message=message,
+            artifacts=artifacts,
+            browser=browser,
+        )
+
+    def capture_artifacts(self, name):
+        """Capture the main browser's page for a failed check, if enabled."""
+        if not admin_tester_settings.SCREENSHOT_ON_FAILURE:
+            return ()
+        artifacts = artifact_store.capture(
+            self.selenium, f"{self.__class__.__name__}_{name}"
+        )
+        return tuple(path for path in artifacts if path)
+
+    @contextmanager
+    def timed(self, kind, target, label=''):
+        """Time the enclosed interaction and report it once it finishes.
+
+        Failure messages appended to the yielded list fail the interaction.
+        An exception fails it too and is not propagated, so the remaining
+        checks still run. The browser-side metrics of the resulting page are
+        attached when ``BROWSER_METRICS`` is on.
+        """
+        errors = []
+        start = time.perf_counter()
+        try:
+            yield errors
+        except Exception as e:
+            errors.append(f"Failed to load {kind}: {label or target} - {str(e)}")
+        duration = time.perf_counter() - start
+        message = '\n'.join(errors) or None
+        browser = None
+        if admin_tester_settings.BROWSER_METRICS and not message:
+            browser = collect_metrics(self.selenium)
+        self.record_interaction(
+            kind,
+            target,
+            label,
+            duration,
+            message=message,
+            artifacts=self.capture_artifacts(kind) if message else (),
+            browser=browser,
+        )
+
+    def fail_on_failures(self):
+        """Fail the test with the first failure messages and the result files."""
+        if not self.failure_count:
+            return
+        lines = [f"{self.failure_count} checks failed:", *self.failed_actions]
+        hidden = self.failure_count - len(self.failed_actions)
+        if hidden:
+            lines.append(f"... and {hidden} more")
+        if self.result_stream.paths:
+            lines.append(f"All results: {', '.join(self.result_stream.paths)}")
+        self.fail('\n'.join(lines))
+
+    def get_session_key(self):
+        """Return a session for the admin user, shared by all browsers."""
+        if self.session_key is None:
+            self.session_key = create_session(self.admin_user)
+        return self.session_key
+
+    def login_admin(self, driver=None):
+        driver = driver or self.selenium
+        if admin_tester_settings.LOGIN_MODE == 'session':
+            add_session_cookie(driver, self.live_server_url, self.get_session_key())
+            return
+        driver.get(f"{self.live_server_url}/admin/")
+        username_input = driver.find_element(By.NAME, "username")
+        password_input = driver.find_element(By.NAME, "password")
+        username_input.send_keys(admin_tester_settings.DEFAULT_ADMIN_USERNAME)
+        password_input.send_keys(admin_tester_settings.DEFAULT_ADMIN_PASSWORD)
+        submit = driver.find_element(By.CSS_SELECTOR, "input[type='submit']")
+        NavigationWaiter(driver).click_and_wait(submit)
+
+    def get_engine(self):
+        return self.changelist_engine or admin_tester_settings.CHANGELIST_ENGINE
+
+    def get_workers(self):
+        workers = self.parallel_workers or admin_tester_settings.PARALLEL_WORKERS
+        if workers > 1 and self.shares_database_connection():
+            logger.warning("In-memory SQLite cannot serve parallel browsers")
+            workers = 1
+        return workers
+
+    def get_changelist_urls(self):
+        return changelist_urls(
+            self.model_class,
+            self.admin_user,
+            test_filters=self.test_filters,
+            combinations=self.filter_combinations,
+        )
+
+    def check_urls(self, urls, engine, workers):
+        """Check ``urls`` with the given engine, recording failures and timings."""
+        if engine == 'client':
+            self.check_changelist_with_client(urls)
+        elif engine == 'async':
+            self.check_changelist_async(urls)
+        else:
+            self.crawl_changelist(workers, urls)
 
     def test_admin_page(self):
-        self.login_admin()
+        with self.timed('login', admin_tester_settings.LOGIN_MODE) as errors:
+            self.login_admin()
+        if errors:
+            self.fail_on_failures()
 
         app_label = self.model_class._meta.app_label
         model_name = self.model_class._meta.model_name
         url = reverse(f'admin:{app_label}_{model_name}_changelist')
-        self.selenium.get(f"{self.live_server_url}{url}")
+        with self.timed('changelist', 'load'):
+            self.selenium.get(f"{self.live_server_url}{url}")
 
-        self.test_specified_filters()
-        self.test_search()
+        engine = self.get_engine()
+        workers = self.get_workers()
+        serial = engine == 'browser' and workers <= 1
+        if serial:
+            self.test_specified_filters()
+            self.test_search()
+        else:
+            self.check_urls(None, engine, workers)
         self.test_add_form()
         self.test_list_actions()
-        self.test_sorting()
+        if serial:
+            self.test_sorting()
+        self.check_pagination()
+        self.check_forms()
+        self.check_actions()
+        self.check_indexes()
 
-        if self.failed_actions:
-            self.fail("\n".join(self.failed_actions))
+        self.record_results({self.model_class} if self.failure_count else set())
+        self.fail_on_failures()
+
+    def check_changelist_with_client(self, urls=None):
+        """Check the filter, sort and search URLs without a browser."""
+        try:
+            if urls is None:
+                urls = self.get_changelist_urls()
+            checker = ClientChecker(
+                self.model_class, self.admin_user, on_result=self.record_url_result
+            )
+            checker.check_all(urls)
+        except Exception as e:
+            self.report('client', 'check', message=f"Client check failed: {str(e)}")
+
+    def check_changelist_async(self, urls=None):
+        """Fetch the changelist URLs concurrently from the live server."""
+        try:
+            if urls is None:
+                urls = self.get_changelist_urls()
+            concurrency = 1 if self.shares_database_connection() else None
+            checker = AsyncChecker(
+                self.live_server_url,
+                self.get_session_key(),
+                concurrency,
+                on_result=self.record_url_result,
+            )
+            checker.run(urls)
+        except Exception as e:
+            self.report('async', 'check', message=f"Async check failed: {str(e)}")
+
+    def crawl_changelist(self, workers, urls=None):
+        """Check the filter, sort and search URLs on a pool of browsers."""
+        try:
+            if urls is None:
+                urls = self.get_changelist_urls()
+            with ParallelCrawler(
+                self.live_server_url,
+                self.login_admin,
+                workers=workers,
+                browser_type=self.browser_type,
+                on_result=self.record_url_result,
+                profile=self.browser_profile,
+            ) as crawler:
+                crawler.crawl(urls)
+        except Exception as e:
+            self.report('crawl', 'check', message=f"Parallel crawl failed: {str(e)}")
+
+    def check_pagination(self, model_class=None):
+        """Time the first, middle and last pages and flag slow deep pages."""
+        model_class = model_class or self.model_class
+        model = model_class._meta.label
+        try:
+            checker = PaginationChecker(
+                model_class,
+                self.admin_user,
+                self.site,
+                on_result=self.record_url_result,
+            )
+            checker.run()
+            self.report(
+                'pagination',
+                'deep pages',
+                message=checker.deep_page_problem(),
+                model=model,
+            )
+        except Exception as e:
+            self.report(
+                'pagination',
+                'pages',
+                message=f"Pagination check failed: {str(e)}",
+                model=model,
+            )
+
+    def check_forms(self, model_class=None):
+        """Weigh the add and change forms and flag selects of every related row."""
+        model_class = model_class or self.model_class
+        try:
+            checker = FormChecker(
+                model_class,
+                self.admin_user,
+                self.site,
+                on_result=self.record_url_result,
+            )
+            checker.run()
+        except Exception as e:
+            self.report(
+                'form',
+                'forms',
+                message=f"Form check failed: {str(e)}",
+                model=model_class._meta.label,
+            )
+
+    def check_actions(self, model_class=None):
+        """Run every admin action on growing selections, rolling each back."""
+        model_class = model_class or self.model_class
+        model = model_class._meta.label
+
+        def record(sample, message):
+            target = f"{sample.action} ({sample.size} rows)"
+            self.timing_report.add(
+                Interaction(
+                    model,
+                    'action',
+                    target,
+                    '',
+                    checker.url,
+                    sample.duration,
+                    queries=sample.queries,
+                )
+            )
+            self.report(
+                'action',
+                sample.action,
+                f"{sample.size} rows, peak {sample.peak_memory // 1024} KiB",
+                checker.url,
+                sample.duration,
+                message,
+                model,
+                ServerTiming(sample.duration, sample.queries),
+            )
+
+        try:
+            checker = ActionChecker(
+                model_class,
+                self.admin_user,
+                self.site,
+                sizes=self.action_sizes,
+                on_result=record,
+            )
+            checker.run()
+        except Exception as e:
+            self.report(
+                'action', 'all', message=f"Action check failed: {str(e)}", model=model
+            )
+            return
+        for action in dict.fromkeys(sample.action for sample in checker.samples):
+            samples = [sample for sample in checker.samples if sample.action == action]
+            self.report(
+                'action',
+                action,
+                'growth',
+                checker.url,
+                message=checker.growth_problem(samples),
+                model=model,
+            )
+
+    def check_indexes(self, model_class=None):
+        """EXPLAIN the changelist queries and collect index suggestions.
+
+        ``index_advice`` (or ``INDEX_ADVICE``) is ``report`` to only write
+        the suggestions to ``REPORT_DIR``, ``fail`` to also fail the test on
+        them, or ``off``.
+        """
+        mode = self.index_advice or admin_tester_settings.INDEX_ADVICE
+        if mode == 'off':
+            return
+        model_class = model_class or self.model_class
+        try:
+            advice = IndexAdvisor(model_class, self.admin_user, self.site).run()
+        except Exception as e:
+            logger.warning("Could not explain %s queries: %s", model_class, e)
+            return
+        self.index_suggestions.extend(advice)
+        if mode == 'fail':
+            for entry in advice:
+                self.report(
+                    'index',
+                    entry.attribute,
+                    ', '.join(entry.fields),
+                    entry.url,
+                    message=entry.message,
+                    model=entry.model,
+                )
 
     def test_specified_filters(self):
-        wait = WebDriverWait(self.selenium, 10)
+        """Load every planned filter combination once, straight from its URL."""
         try:
-            filters = self.selenium.find_elements(By.CLASS_NAME, "admin-filter")
-            for filter_elem in filters:
-                filter_name = filter_elem.text.split('\n')[0]
-
-                if not self.test_filters or filter_name in self.test_filters:
-                    options = filter_elem.find_elements(By.TAG_NAME, 'a')
-                    for option in options:
-                        try:
-                            wait.until(
-                                EC.element_to_be_clickable(
-                                    (By.ID, option.get_attribute('id'))
-                                )
-                            )
-                            option.click()
-                            time.sleep(0.5)
-                            error_note = self.selenium.find_elements(
-                                By.CLASS_NAME, "errornote"
-                            )
-                            if error_note:
-                                self.failed_actions.append(
-                                    f"Filter error: {filter_name} - {option.text}"
-                                )
-                        except Exception as e:
-                            self.failed_actions.append(
-                                f"Failed to click filter: {filter_name} - {option.text} - {str(e)}"
-                            )
+            for item in self.get_changelist_urls():
+                if item.kind != 'filter':
+                    continue
+                with self.timed('filter', item.target, item.label) as errors:
+                    self.selenium.get(f"{self.live_server_url}{item.url}")
+                    self.waiter.wait_for_navigation(marker=CHANGELIST_MARKER)
+                    if self.selenium.find_elements(By.CLASS_NAME, "errornote"):
+                        errors.append(f"Filter error: {item.label}")
+            path = changelist_path(self.model_class)
+            self.selenium.get(f"{self.live_server_url}{path}")
         except Exception as e:
-            self.failed_actions.append(f"Filter test failed: {str(e)}")
+            self.report('filter', 'all', message=f"Filter test failed: {str(e)}")
 
     def test_search(self):
         try:
             search_input = self.selenium.find_element(By.ID, "searchbar")
             if search_input:
                 search_input.send_keys("test")
-                search_input.submit()
-                time.sleep(0.5)
+                with self.timed('search', 'search', 'test'):
+                    self.waiter.submit_and_wait(search_input, CHANGELIST_MARKER)
         except Exception as e:
-            self.failed_actions.append(f"Search test failed: {str(e)}")
+            self.report('search', 'search', message=f"Search test failed: {str(e)}")
 
     def test_add_form(self):
         try:
             add_button = self.selenium.find_element(By.CLASS_NAME, "addlink")
             if add_button:
-                add_button.click()
-                time.sleep(0.5)
-                error_notes = self.selenium.find_elements(By.CLASS_NAME, "errornote")
-                if error_notes:
-                    self.failed_actions.append("Add form error")
+                with self.timed('add', 'add form') as errors:
+                    self.waiter.click_and_wait(add_button)
+                    if self.selenium.find_elements(By.CLASS_NAME, "errornote"):
+                        errors.append("Add form error")
+                old_page = self.selenium.find_element(By.TAG_NAME, 'html')
                 self.selenium.back()
+                self.waiter.wait_for_navigation(old_page, CHANGELIST_MARKER)
         except Exception as e:
-            self.failed_actions.append(f"Add form test failed: {str(e)}")
+            self.report('add', 'add form', message=f"Add form test failed: {str(e)}")
 
     def test_list_actions(self):
         try:
@@ -125,8 +688,11 @@ class AdminPageTest(LiveServerTestCase):
             options = action_select.options[1:]
             for option in options:
                 action_select.select_by_value(option.get_attribute("value"))
+            self.report('actions', 'select', url=self.selenium.current_url)
         except Exception as e:
-            self.failed_actions.append(f"List actions test failed: {str(e)}")
+            self.report(
+                'actions', 'select', message=f"List actions test failed: {str(e)}"
+            )
 
     def test_sorting(self):
         try:
@@ -134,10 +700,163 @@ class AdminPageTest(LiveServerTestCase):
                 By.CSS_SELECTOR, "th.sortable"
             )
             for header in sortable_headers:
-                header.click()
-                time.sleep(0.5)
-                error_notes = self.selenium.find_elements(By.CLASS_NAME, "errornote")
-                if error_notes:
-                    self.failed_actions.append(f"Sorting error: {header.text}")
+                header_text = header.text
+                with self.timed('sort', header_text) as errors:
+                    self.waiter.click_and_wait(header, CHANGELIST_MARKER)
+                    if self.selenium.find_elements(By.CLASS_NAME, "errornote"):
+                        errors.append(f"Sorting error: {header_text}")
         except Exception as e:
-            self.failed_actions.append(f"Sorting test failed: {str(e)}")
+            self.report('sort', 'all', message=f"Sorting test failed: {str(e)}")
+
+
+class AdminRegistryTest(AdminPageTest):
+    """Test every ``ModelAdmin`` registered on ``site`` in one run.
+
+    All models share the class's live server, one admin session and one pool
+    of browsers. Their URLs are queued largest table first so the slowest
+    changelists do not end up on a single worker at the end of the run.
+    """
+
+    exclude_models = []
+    # Every shard runs this class and checks its share of the admins.
+    shard_within_class = True
+
+    # The click-through checks need a single changelist; URLs cover them here.
+    test_specified_filters = test_search = test_add_form = None
+    test_list_actions = test_sorting = None
+
+    @classmethod
+    def check_configuration(cls):
+        if not cls.site._registry:
+            raise ValueError(f"No models are registered with {cls.site.name}")
+
+    @classmethod
+    def get_model_classes(cls):
+        return discover_models(cls.site, cls.exclude_models)
+
+    def failed_models(self):
+        """Return the models with a failed check; all of them if one had none."""
+        if '' in self.failed_labels:
+            return set(self.models_to_test)
+        return {
+            model_class
+            for model_class in self.models_to_test
+            if model_class._meta.label in self.failed_labels
+        }
+
+    def planned_urls(self):
+        """Return the admins this test checks and their URLs.
+
+        A sharded run splits every registered admin, whole, the same way on
+        each node, and only then drops the admins unchanged since their last
+        passing run. Nodes have different result caches, so splitting just
+        their stale admins would check some admins twice and others never.
+        Row counts are only known once the test's data is in place.
+        """
+        model_classes = discover_models(self.site, self.exclude_models)
+        shard = current_shard()
+        if shard is None:
+            model_classes = [
+                model_class
+                for model_class in model_classes
+                if model_class in self.models_to_test
+            ]
+        urls = registry_urls(model_classes, self.admin_user, self.site)
+        if shard is not None:
+            stale = {model_class._meta.label for model_class in self.models_to_test}
+            urls = [
+                item
+                for item in shard_groups(
+                    urls,
+                    shard,
+                    recorded_durations()[1],
+                    group=lambda item: item.model,
+                    key=lambda item: request_key(item.url),
+                )
+                if item.model in stale
+            ]
+            labels = {item.model for item in urls}
+            model_classes = [
+                model_class
+                for model_class in model_classes
+                if model_class._meta.label in labels
+            ]
+        return model_classes, urls
+
+    def test_admin_page(self):
+        with self.timed('login', admin_tester_settings.LOGIN_MODE) as errors:
+            self.login_admin()
+        if errors:
+            self.fail_on_failures()
+
+        model_classes, urls = self.planned_urls()
+        logger.info(
+            "Testing %d admins: %s",
+            len(model_classes),
+            ", ".join(model_class._meta.label for model_class in model_classes),
+        )
+        self.check_urls(urls, self.get_engine(), self.get_workers())
+        for model_class in model_classes:
+            self.check_pagination(model_class)
+            self.check_forms(model_class)
+            self.check_actions(model_class)
+            self.check_indexes(model_class)
+
+        self.record_results(self.failed_models(), model_classes)
+        self.fail_on_failures()
+
+
+class AdminLoadTest(LiveServerTestCase):
+    """Put the admin under load from concurrent users on the live server.
+
+    ``load_users`` users (``LOAD_USERS``), each logged in with its own
+    session, ramp up over ``LOAD_RAMP_UP`` seconds and replay the changelist,
+    filter, sort, search and add form URLs of every admin on ``site``, plus
+    the ``load_actions`` (``LOAD_ACTIONS``), until ``LOAD_DURATION`` seconds
+    have passed. The test fails when more than ``LOAD_MAX_ERROR_RATE`` of the
+    requests fail or when queries fail on a database lock.
+    """
+
+    site = admin.site
+    exclude_models = []
+    load_users = None
+    load_actions = None
+
+    @classmethod
+    def setUpClass(cls):
+        if AdminPageTest.shares_database_connection():
+            raise unittest.SkipTest(
+                "In-memory SQLite cannot serve concurrent users; "
+                "set a file for the test database"
+            )
+        super().setUpClass()
+
+    def test_load(self):
+        user = ensure_admin_user()
+        if self.load_actions is None:
+            actions = admin_tester_settings.LOAD_ACTIONS
+        else:
+            actions = self.load_actions
+        model_classes = discover_models(self.site, self.exclude_models)
+        mix = load_mix(model_classes, user, self.site, actions)
+        users = self.load_users or admin_tester_settings.LOAD_USERS
+        sessions = [create_session(user) for _ in range(users)]
+        report = LoadTester(
+            self.live_server_url, sessions, mix, monitor=LockMonitor()
+        ).run()
+
+        name = type(self).__name__
+        path = report.write_json(report_path(name, 'load'))
+        log_summary(f"{name} load from {users} users", path, report.format_summary())
+        problems = []
+        limit = admin_tester_settings.LOAD_MAX_ERROR_RATE
+        if report.error_rate > limit:
+            problems.append(
+                f"{report.error_rate:.1%} of requests failed, over {limit:.1%}"
+            )
+        lock_errors = report.lock_errors()
+        if lock_errors:
+            problems.append(f"{len(lock_errors)} queries failed on database locks:")
+            problems.extend(f"    {message}" for message in lock_errors[:5])
+        if problems:
+            self.fail('\n'.join(problems))
@@ -0,0 +1,222 @@
+import math
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, List, NamedTuple, Optional, Sequence, Type
+from django.contrib import admin
+from django.contrib.admin import helpers
+from django.db import connections, models, router, transaction
+from django.test import Client, RequestFactory
+from .changelist import changelist_path, get_model_admin
+from .fixtures import DatabaseSnapshot
+from .queries import QueryRecorder
+from .settings import admin_tester_settings
+
+# Below this wall time, growth between sizes is mostly noise and not flagged.
+ACTION_GROWTH_MIN_DURATION = 0.05
+
+
+class ActionSample(NamedTuple):
+    """The cost of running one admin action on ``size`` selected rows."""
+
+    action: str
+    size: int
+    duration: float
+    queries: int
+    peak_memory: int
+    error: Optional[str] = None
+
+
+def growth_exponent(small: ActionSample, large: ActionSample, value: str) -> float:
+    """Return ``k`` where ``value`` grows like ``size ** k`` between two samples."""
+    low, high = getattr(small, value), getattr(large, value)
+    if low <= 0 or high <= 0 or large.size <= small.size:
+        return 0.0
+    return math.log(high / low) / math.log(large.size / small.size)
+
+
+@contextmanager
+def traced_memory():
+    """Track the peak Python memory allocated inside the block.
+
+    Yields a list that receives the peak, in bytes, once the block exits.
+    When tracing is already on, its peak is reset first; Python 3.8 cannot
+    do that, so a block that stays below the earlier peak reports the
+    memory it still holds at exit instead.
+    """
+    result = []
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        baseline, earlier_peak = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+            earlier_peak = 0
+    else:
+        tracemalloc.start()
+        baseline = earlier_peak = 0
+    try:
+        yield result
+    finally:
+        current, peak = tracemalloc.get_traced_memory()
+        if peak <= earlier_peak:
+            peak = current
+        result.append(max(peak - baseline, 0))
+        if not tracing:
+            tracemalloc.stop()
+
+
+class ActionChecker:
+    """Run every admin action on growing selections and measure what it costs.
+
+    Each action, ``delete_selected`` through its confirmation page included,
+    is posted to the changelist through the test client for every size in
+    ``sizes`` (``ACTION_SIZES``); ``None`` selects all rows with "select
+    across". Every run happens in a transaction that is rolled back, or
+    between saving and restoring a ``DatabaseSnapshot`` on databases without
+    transactions, so each starts from the same rows. Wall time and queries
+    are recorded from one run and peak Python memory from a second, traced
+    run, so tracing does not slow the timed one; an action fails when its
+    time or query count grows faster than ``size ** ACTION_GROWTH_LIMIT``.
+    ``on_result(sample, message)`` is called after each run.
+    """
+
+    def __init__(
+        self,
+        model_class: Type[models.Model],
+        user,
+        site=admin.site,
+        sizes: Optional[Sequence[Optional[int]]] = None,
+        client: Optional[Client] = None,
+        on_result: Optional[Callable[..., None]] = None,
+    ):
+        self.model_class = model_class
+        self.user = user
+        self.site = site
+        self.sizes = admin_tester_settings.ACTION_SIZES if sizes is None else sizes
+        if client is None:
+            client = Client()
+            client.force_login(user)
+        self.client = client
+        self.on_result = on_result
+        self.using = router.db_for_write(model_class)
+        self.url = changelist_path(model_class, site)
+        self.samples: List[ActionSample] = []
+
+    def request(self):
+        request = RequestFactory().get(self.url)
+        request.user = self.user
+        return request
+
+    def actions(self) -> List[str]:
+        model_admin = get_model_admin(self.model_class, self.site)
+        return list(model_admin.get_actions(self.request()))
+
+    def selection_sizes(self, total: int) -> List[int]:
+        """Return the distinct selection sizes to run, capped at ``total``."""
+        sizes = []
+        for size in self.sizes:
+            size = total if size is None else min(size, total)
+            if size and size not in sizes:
+                sizes.append(size)
+        return sizes
+
+    @contextmanager
+    def isolated(self):
+        """Undo whatever the enclosed action changed in the database."""
+        if connections[self.using].features.supports_transactions:
+            with transaction.atomic(using=self.using):
+                yield
+                transaction.set_rollback(True, using=self.using)
+            return
+        snapshot = DatabaseSnapshot(
+            f"actions-{self.model_class._meta.label_lower}", self.using
+        )
+        snapshot.save(self.model_class)
+        try:
+            yield
+        finally:
+            snapshot.restore(self.model_class)
+
+    def post(self, action: str, size: int, total: int):
+        data = {'action': action, 'index': 0}
+        if size >= total:
+            data['select_across'] = 1
+        queryset = get_model_admin(self.model_class, self.site).get_queryset(
+            self.request()
+        )
+        pks = queryset.using(self.using).values_list('pk', flat=True)[:size]
+        data[helpers.ACTION_CHECKBOX_NAME] = [str(pk) for pk in pks]
+        response = self.client.post(self.url, data)
+        if action == 'delete_selected' and response.status_code == 200:
+            # The first post renders the confirmation page; confirm it.
+            response = self.client.post(self.url, {**data, 'post': 'yes'})
+        if response.status_code >= 400:
+            raise ValueError(f"HTTP {response.status_code}")
+
+    def attempt(self, action: str, size: int, total: int) -> Optional[str]:
+        """Post ``action`` and return why it failed, if it did."""
+        try:
+            self.post(action, size, total)
+        except Exception as e:
+            return f"Action {action} failed on {size} rows - {str(e)}"
+        return None
+
+    def measure(self, action: str, size: int, total: int) -> ActionSample:
+        recorder = QueryRecorder()
+        with self.isolated(), connections[self.using].execute_wrapper(recorder):
+            start = time.perf_counter()
+            error = self.attempt(action, size, total)
+            duration = time.perf_counter() - start
+        peak = [0]
+        if error is None:
+            with self.isolated(), traced_memory() as peak:
+                error = self.attempt(action, size, total)
+        return ActionSample(
+            action, size, duration, len(recorder.queries), peak[0], error
+        )
+
+    def growth_problem(self, samples: List[ActionSample]) -> Optional[str]:
+        """Describe how an action's cost grows faster than allowed, if it does."""
+        measured = [sample for sample in samples if sample.error is None]
+        if len(measured) < 2:
+            return None
+        small, large = measured[0], measured[-1]
+        limit = admin_tester_settings.ACTION_GROWTH_LIMIT
+        problems = []
+        time_growth = growth_exponent(small, large, 'duration')
+        if large.duration >= ACTION_GROWTH_MIN_DURATION and time_growth > limit:
+            problems.append(f"time grows like n^{time_growth:.2f}")
+        query_growth = growth_exponent(small, large, 'queries')
+        if query_growth > limit:
+            problems.append(f"queries grow like n^{query_growth:.2f}")
+        if not problems:
+            return None
+        costs = ', '.join(
+            f"{sample.size} rows: {sample.duration * 1000:.1f}ms, "
+            f"{sample.queries} queries"
+            for sample in measured
+        )
+        return (
+            f"Action {large.action} on {self.model_class._meta.label} scales "
+            f"badly, {' and '.join(problems)} ({costs})"
+        )
+
+    def run(self) -> List[str]:
+        """Run every action at every size and return the problems found."""
+        problems = []
+        total = self.model_class._default_manager.using(self.using).count()
+        sizes = self.selection_sizes(total)
+        for action in self.actions():
+            samples = []
+            for size in sizes:
+                sample = self.measure(action, size, total)
+                samples.append(sample)
+                self.samples.append(sample)
+                if sample.error:
+                    problems.append(sample.error)
+                if self.on_result is not None:
+                    self.on_result(sample, sample.error)
+            growth = self.growth_problem(samples)
+            if growth:
+                problems.append(growth)
+        return problems
@@ -0,0 +1,221 @@
+import atexit
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from .settings import admin_tester_settings
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Lossy WebP keeps admin screenshots legible at a fraction of the PNG size.
+WEBP_QUALITY = 80
+
+
+class Artifacts(NamedTuple):
+    """Where the artifacts of one failure are (or are about to be) written."""
+
+    screenshot: Optional[str]
+    html: Optional[str]
+    console: Optional[str]
+
+    def describe(self) -> str:
+        labels = {'screenshot': 'Screenshot', 'html': 'HTML', 'console': 'Console log'}
+        return '\n'.join(
+            f"{labels[kind]} saved to: {path}"
+            for kind, path in self._asdict().items()
+            if path
+        )
+
+
+def screenshot_extension() -> str:
+    return 'webp' if Image is not None else 'png'
+
+
+def text_extension() -> str:
+    return 'zst' if zstandard is not None else 'gz'
+
+
+def encode_screenshot(png: bytes) -> bytes:
+    """Re-encode a PNG screenshot as WebP when Pillow is installed."""
+    if Image is None:
+        return png
+    output = io.BytesIO()
+    with Image.open(io.BytesIO(png)) as image:
+        image.save(output, 'WEBP', quality=WEBP_QUALITY, method=4)
+    return output.getvalue()
+
+
+def compress_text(text: str) -> bytes:
+    """Compress text with zstd when available, gzip otherwise."""
+    data = text.encode('utf-8')
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+class ArtifactStore:
+    """Capture failure artifacts and write them from a background thread.
+
+    Only grabbing the screenshot, HTML and console log touches the browser;
+    encoding, compression and disk writes are queued to a daemon thread.
+    Screenshots are named after their content hash, so identical pages are
+    stored once. Once the directory grows beyond ``max_bytes`` the least
+    recently written or reused artifacts are deleted.
+    """
+
+    def __init__(
+        self, directory: Optional[str] = None, max_bytes: Optional[int] = None
+    ):
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._queue: 'queue.Queue[Optional[Callable[[], None]]]' = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._files: 'OrderedDict[str, int]' = OrderedDict()
+        self._scanned = False
+
+    @property
+    def directory(self) -> str:
+        return self._directory or admin_tester_settings.SCREENSHOT_DIR or 'screenshots'
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return admin_tester_settings.ARTIFACT_MAX_BYTES
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='admin-artifacts', daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                job()
+            except Exception:
+                logger.exception("Failed to write a failure artifact")
+            finally:
+                self._queue.task_done()
+
+    def _scan(self):
+        """Index existing artifacts, oldest first, the first time one is written."""
+        if self._scanned:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+        for _, path, size in sorted(entries):
+            self._files[path] = size
+        self._scanned = True
+
+    def _write(self, path: str, encode: Callable[[], bytes]):
+        self._scan()
+        if path in self._files and os.path.exists(path):
+            os.utime(path)
+            self._files.move_to_end(path)
+            return
+        data = encode()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._files[path] = len(data)
+        self._evict(keep=path)
+
+    def _evict(self, keep: str):
+        total = sum(self._files.values())
+        while total > self.max_bytes and len(self._files) > 1:
+            path, size = next(iter(self._files.items()))
+            if path == keep:
+                self._files.move_to_end(path)
+                continue
+            del self._files[path]
+            total -= size
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def submit(self, path: str, encode: Callable[[], bytes]):
+        self._ensure_started()
+        self._queue.put(lambda: self._write(path, encode))
+
+    def capture(self, driver: WebDriver, name: Optional[str] = None) -> Artifacts:
+        """Grab the page's screenshot, HTML and console log for later writing."""
+        name = name or 'screenshot'
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        directory = self.directory
+        screenshot = html = console = None
+
+        try:
+            png = driver.get_screenshot_as_png()
+        except Exception as e:
+            logger.warning("Could not take a screenshot: %s", e)
+        else:
+            digest = hashlib.sha256(png).hexdigest()[:20]
+            screenshot = os.path.join(directory, f"{digest}.{screenshot_extension()}")
+            self.submit(screenshot, lambda: encode_screenshot(png))
+
+        try:
+            source = driver.page_source
+        except Exception as e:
+            logger.warning("Could not read the page source: %s", e)
+        else:
+            html = os.path.join(directory, f"{name}_{stamp}.html.{text_extension()}")
+            self.submit(html, lambda: compress_text(source))
+
+        try:
+            entries = driver.get_log('browser')
+        except Exception:
+            # Only Chromium exposes the console log through WebDriver.
+            entries = None
+        if entries:
+            console = os.path.join(
+                directory, f"{name}_{stamp}.console.json.{text_extension()}"
+            )
+            self.submit(console, lambda: compress_text(json.dumps(entries, indent=1)))
+
+        return Artifacts(screenshot, html, console)
+
+    def flush(self):
+        """Block until every queued artifact has been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = None
+
+
+artifact_store = ArtifactStore()
+atexit.register(artifact_store.close)
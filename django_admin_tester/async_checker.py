@@ -0,0 +1,195 @@
+import asyncio
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+from django.conf import settings
+from .changelist import ChangelistUrl
+from .settings import admin_tester_settings
+
+# Responses that never carry a body, whatever their headers say.
+NO_BODY_STATUSES = (204, 304)
+
+
+class UrlResult(NamedTuple):
+    """The outcome of fetching one changelist URL."""
+
+    item: ChangelistUrl
+    status: Optional[int]
+    has_errornote: bool
+    latency: float
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or self.status != 200 or self.has_errornote
+
+    @property
+    def message(self) -> str:
+        if self.error is not None:
+            return f"Failed to load {self.item.kind}: {self.item.label} - {self.error}"
+        if self.status != 200:
+            return (
+                f"{self.item.kind.capitalize()} error: {self.item.label} "
+                f"(HTTP {self.status})"
+            )
+        return f"{self.item.kind.capitalize()} error: {self.item.label}"
+
+
+class HttpConnection:
+    """A minimal keep-alive HTTP/1.1 client connection to one server.
+
+    Requests of any method are sent one at a time, reconnecting when the
+    server has closed the connection.
+    """
+
+    def __init__(self, host: str, port: int, use_ssl: bool):
+        self.host = host
+        self.port = port
+        self.use_ssl = use_ssl
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def _open(self):
+        self.reader, self.writer = await asyncio.open_connection(
+            self.host, self.port, ssl=self.use_ssl or None
+        )
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def _read_body(
+        self, method: str, status: int, headers: Dict[str, str]
+    ) -> bytes:
+        if method == 'HEAD' or status in NO_BODY_STATUSES:
+            return b''
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    # Skip any trailer fields up to the blank line.
+                    while (await self.reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    return b''.join(chunks)
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+        if 'content-length' in headers:
+            return await self.reader.readexactly(int(headers['content-length']))
+        body = await self.reader.read()
+        self.close()
+        return body
+
+    async def request(
+        self, method: str, path: str, headers: Dict[str, str], body: bytes = b''
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """Send one request; ``Set-Cookie`` values are joined by newlines."""
+        for attempt in range(2):
+            reused = self.writer is not None
+            if not reused:
+                await self._open()
+            lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}"]
+            lines += [f"{name}: {value}" for name, value in headers.items()]
+            if body:
+                lines.append(f"Content-Length: {len(body)}")
+            head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+            self.writer.write(head + body)
+            await self.writer.drain()
+            status_line = await self.reader.readline()
+            if not status_line:
+                # The server closed an idle keep-alive connection; reconnect.
+                self.close()
+                if reused and attempt == 0:
+                    continue
+                raise ConnectionError('Connection closed by server')
+            status = int(status_line.split()[1])
+            response_headers = {}
+            while True:
+                line = await self.reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                name = name.strip().lower()
+                if name == 'set-cookie' and name in response_headers:
+                    value = f"{response_headers[name]}\n{value.strip()}"
+                response_headers[name] = value.strip()
+            response_body = await self._read_body(method, status, response_headers)
+            if response_headers.get('connection', '').lower() == 'close':
+                self.close()
+            return status, response_headers, response_body
+        raise ConnectionError('Connection closed by server')
+
+    async def get(self, path: str, headers: Dict[str, str]) -> Tuple[int, bytes]:
+        status, _, body = await self.request('GET', path, headers)
+        return status, body
+
+
+class AsyncChecker:
+    """Fetch changelist URLs concurrently against a running server.
+
+    ``concurrency`` workers each keep one connection alive and share the
+    session cookie of an already authenticated user. ``on_result(item,
+    duration, message)`` is called as each response arrives.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        session_key: str,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        on_result: Optional[Callable[..., None]] = None,
+    ):
+        parts = urlsplit(base_url)
+        self.use_ssl = parts.scheme == 'https'
+        self.host = parts.hostname
+        self.port = parts.port or (443 if self.use_ssl else 80)
+        self.prefix = parts.path.rstrip('/')
+        self.concurrency = concurrency or admin_tester_settings.ASYNC_CONCURRENCY
+        self.timeout = timeout or admin_tester_settings.WAIT_TIMEOUT
+        self.on_result = on_result
+        self.headers = {
+            'Cookie': f"{settings.SESSION_COOKIE_NAME}={session_key}",
+            'Connection': 'keep-alive',
+        }
+
+    async def fetch(self, connection: HttpConnection, item: ChangelistUrl) -> UrlResult:
+        start = time.perf_counter()
+        try:
+            status, body = await asyncio.wait_for(
+                connection.get(self.prefix + item.url, self.headers), self.timeout
+            )
+        except Exception as e:
+            connection.close()
+            return UrlResult(
+                item, None, False, time.perf_counter() - start, str(e) or repr(e)
+            )
+        return UrlResult(
+            item, status, b'class="errornote"' in body, time.perf_counter() - start
+        )
+
+    async def _worker(self, queue: asyncio.Queue, results: List[UrlResult]):
+        connection = HttpConnection(self.host, self.port, self.use_ssl)
+        try:
+            while not queue.empty():
+                index, item = queue.get_nowait()
+                result = results[index] = await self.fetch(connection, item)
+                if self.on_result is not None:
+                    message = result.message if result.failed else None
+                    self.on_result(item, result.latency, message)
+        finally:
+            connection.close()
+
+    async def check_all(self, urls: Iterable[ChangelistUrl]) -> List[UrlResult]:
+        queue: asyncio.Queue = asyncio.Queue()
+        for entry in enumerate(urls):
+            queue.put_nowait(entry)
+        results: List[UrlResult] = [None] * queue.qsize()
+        workers = min(self.concurrency, len(results))
+        await asyncio.gather(*(self._worker(queue, results) for _ in range(workers)))
+        return results
+
+    def run(self, urls: Iterable[ChangelistUrl]) -> List[UrlResult]:
+        """Fetch every URL and return the results in input order."""
+        return asyncio.run(self.check_all(urls))
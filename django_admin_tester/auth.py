@@ -0,0 +1,67 @@
+from importlib import import_module
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+    get_user_model,
+)
+from django.contrib.auth.hashers import make_password
+from selenium.webdriver.remote.webdriver import WebDriver
+from .settings import admin_tester_settings
+
+# Password hashes keyed by raw password, so PBKDF2 runs once per process.
+_password_hashes = {}
+
+
+def admin_password_hash() -> str:
+    """Return the hash of the default admin password, computing it once."""
+    password = admin_tester_settings.DEFAULT_ADMIN_PASSWORD
+    if password not in _password_hashes:
+        _password_hashes[password] = make_password(password)
+    return _password_hashes[password]
+
+
+def ensure_admin_user():
+    """Return the default superuser, creating it if the database lacks it."""
+    User = get_user_model()
+    username = admin_tester_settings.DEFAULT_ADMIN_USERNAME
+    manager = User._default_manager
+    user = manager.filter(**{User.USERNAME_FIELD: username}).first()
+    if user is None:
+        user = manager.create(
+            **{
+                User.USERNAME_FIELD: username,
+                User.get_email_field_name(): admin_tester_settings.DEFAULT_ADMIN_EMAIL,
+            },
+            password=admin_password_hash(),
+            is_staff=True,
+            is_superuser=True,
+        )
+    return user
+
+
+def create_session(user) -> str:
+    """Store an authenticated session for ``user`` and return its key."""
+    engine = import_module(settings.SESSION_ENGINE)
+    session = engine.SessionStore()
+    session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+    session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+    return session.session_key
+
+
+def delete_session(session_key: str):
+    """Remove a session stored by ``create_session``."""
+    engine = import_module(settings.SESSION_ENGINE)
+    engine.SessionStore(session_key).delete()
+
+
+def add_session_cookie(driver: WebDriver, base_url: str, session_key: str):
+    """Log ``driver`` in by setting the session cookie on ``base_url``."""
+    # Cookies can only be set for the domain of the page currently loaded.
+    driver.get(f"{base_url}/favicon.ico")
+    driver.add_cookie(
+        {'name': settings.SESSION_COOKIE_NAME, 'value': session_key, 'path': '/'}
+    )
@@ -0,0 +1,175 @@
+import datetime
+import json
+import os
+import statistics
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+import django
+from django.contrib import admin
+from django.db import models
+from django.test import Client, RequestFactory
+from django.urls import reverse
+from .auth import ensure_admin_user
+from .changelist import changelist_path, changelist_urls
+from .exceptions import AdminTesterError
+from .fixtures import seed_model
+
+# Version of the baseline file layout, bumped on incompatible changes.
+BASELINE_VERSION = 1
+
+
+def benchmark_urls(model_class: Type[models.Model], user, site=admin.site):
+    """Pick one URL per benchmarked scenario of a model's admin.
+
+    The changelist, every sortable column, the search and the add form are
+    measured once each; filters contribute their first real choice.
+    """
+    opts = model_class._meta
+    scenarios = [('changelist', changelist_path(model_class, site))]
+    seen_filters = set()
+    for item in changelist_urls(model_class, user, site=site, combinations='single'):
+        if item.kind == 'filter':
+            if item.target in seen_filters:
+                continue
+            seen_filters.add(item.target)
+        elif item.kind == 'page':
+            continue
+        scenarios.append((f"{item.kind}: {item.target}", item.url))
+    request = RequestFactory().get('/')
+    request.user = user
+    if site._registry[model_class].has_add_permission(request):
+        add_url = reverse(f'{site.name}:{opts.app_label}_{opts.model_name}_add')
+        scenarios.append(('add', add_url))
+    return scenarios
+
+
+class AdminBenchmark:
+    """Measure admin page render times for every registered admin.
+
+    Each model is seeded to every size in ``sizes`` and each scenario is
+    requested ``repeats`` times, after one warm-up request, through
+    ``django.test.Client`` so no browser is needed.
+    """
+
+    def __init__(
+        self,
+        site=admin.site,
+        sizes: Iterable[int] = (0,),
+        repeats: int = 5,
+        model_classes: Optional[Iterable[Type[models.Model]]] = None,
+    ):
+        self.site = site
+        self.sizes = list(sizes)
+        self.repeats = repeats
+        self.model_classes = list(model_classes or site._registry)
+
+    def measure(self, client: Client, url: str) -> List[float]:
+        samples = []
+        for attempt in range(self.repeats + 1):
+            start = time.perf_counter()
+            response = client.get(url)
+            duration = time.perf_counter() - start
+            if response.status_code != 200:
+                raise AdminTesterError(f"{url} returned HTTP {response.status_code}")
+            if attempt:
+                samples.append(duration)
+        return samples
+
+    def run_model(self, model_class: Type[models.Model], size: int) -> dict:
+        model_class._default_manager.all().delete()
+        if size:
+            seed_model(model_class, size)
+        user = ensure_admin_user()
+        client = Client()
+        client.force_login(user)
+        return {
+            name: self.measure(client, url)
+            for name, url in benchmark_urls(model_class, user, self.site)
+        }
+
+    def run(self) -> dict:
+        results = {}
+        for model_class in self.model_classes:
+            for size in self.sizes:
+                key = f"{model_class._meta.label}@{size}"
+                results[key] = self.run_model(model_class, size)
+        return {
+            'version': BASELINE_VERSION,
+            'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'django': django.get_version(),
+            'results': results,
+        }
+
+
+def load_baseline(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BASELINE_VERSION:
+        raise AdminTesterError(
+            f"{path} uses baseline version {baseline.get('version')}, "
+            f"expected {BASELINE_VERSION}; record a new baseline"
+        )
+    return baseline
+
+
+def save_baseline(report: dict, path: str):
+    """Write ``report`` as the new baseline, archiving the previous one."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if os.path.exists(path):
+        with open(path) as f:
+            created = json.load(f).get('created', '')
+        stamp = created.replace(':', '').replace('-', '')[:15] or 'previous'
+        root, extension = os.path.splitext(path)
+        os.replace(path, f"{root}-{stamp}{extension}")
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+
+def compare(
+    baseline: dict,
+    report: dict,
+    tolerance: float = 0.2,
+    sigma: float = 3.0,
+    min_delta: float = 0.005,
+) -> List[Tuple[str, str]]:
+    """Return ``(scenario, explanation)`` for every regressed scenario.
+
+    A scenario regresses when its median is more than ``tolerance`` slower
+    than the baseline median, lies more than ``sigma`` standard deviations
+    above the baseline mean, and is at least ``min_delta`` seconds slower.
+    """
+    regressions = []
+    for key, scenarios in report['results'].items():
+        for name, samples in scenarios.items():
+            previous = baseline['results'].get(key, {}).get(name)
+            if not previous or not samples:
+                continue
+            old_median = statistics.median(previous)
+            new_median = statistics.median(samples)
+            mean = statistics.mean(previous)
+            spread = statistics.stdev(previous) if len(previous) > 1 else 0.0
+            if (
+                new_median > old_median * (1 + tolerance)
+                and new_median > mean + sigma * spread
+                and new_median - old_median >= min_delta
+            ):
+                regressions.append(
+                    (
+                        f"{key} {name}",
+                        f"median {new_median * 1000:.1f}ms vs baseline "
+                        f"{old_median * 1000:.1f}ms "
+                        f"(+{(new_median / max(old_median, 1e-9) - 1) * 100:.0f}%)",
+                    )
+                )
+    return regressions
+
+
+def medians(report: dict) -> Dict[str, Dict[str, float]]:
+    return {
+        key: {name: statistics.median(samples) for name, samples in scenarios.items()}
+        for key, scenarios in report['results'].items()
+    }
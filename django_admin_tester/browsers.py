@@ -1,11 +1,56 @@
 from typing import Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from .devtools import enable_metrics
+from .drivers import driver_resolver
 from .settings import admin_tester_settings
-from .exceptions import AdminTesterBrowserError
+from .exceptions import AdminTesterBrowserError, AdminTesterConfigError
+
+# Named browser profiles selectable through ADMIN_TESTER_BROWSER_PROFILE.
+BROWSER_PROFILES = {
+    'default': {},
+    # Skip everything the admin tests do not look at: images, web fonts, GPU
+    # compositing, extensions, background traffic and third-party hosts.
+    'fast': {
+        'page_load_strategy': 'eager',
+        'block_third_party': True,
+        'chrome_arguments': [
+            '--blink-settings=imagesEnabled=false',
+            '--disable-remote-fonts',
+            '--disable-gpu',
+            '--disable-extensions',
+            '--disable-background-networking',
+            '--disable-component-update',
+            '--disable-default-apps',
+            '--disable-sync',
+            '--no-first-run',
+            '--mute-audio',
+        ],
+        'chrome_prefs': {
+            'profile.managed_default_content_settings.images': 2,
+        },
+        'firefox_prefs': {
+            'permissions.default.image': 2,
+            'gfx.downloadable_fonts.enabled': False,
+            'layers.acceleration.disabled': True,
+            'network.prefetch-next': False,
+            'network.dns.disablePrefetch': True,
+            'app.update.enabled': False,
+        },
+    },
+    # Full rendering with stable output for screenshots and visual checks.
+    'fidelity': {
+        'page_load_strategy': 'normal',
+        'chrome_arguments': [
+            '--force-device-scale-factor=1',
+            '--font-render-hinting=none',
+            '--hide-scrollbars',
+        ],
+    },
+}
 
 
 class BrowserFactory:
@@ -29,9 +74,35 @@ class BrowserFactory:
 
         return creator(**kwargs)
 
+    @staticmethod
+    def get_profile(name: Optional[str] = None) -> dict:
+        """Return the browser profile called ``name`` or the configured one."""
+        name = name or admin_tester_settings.BROWSER_PROFILE
+        try:
+            return BROWSER_PROFILES[name]
+        except KeyError:
+            raise AdminTesterConfigError(f"Unknown browser profile: {name}")
+
+    @staticmethod
+    def acquire_browser(
+        browser_type: Optional[str] = None, **kwargs
+    ) -> webdriver.Remote:
+        """Check a WebDriver out of the process-wide browser pool."""
+        from .pool import browser_pool
+
+        return browser_pool.acquire(browser_type, **kwargs)
+
+    @staticmethod
+    def release_browser(driver: webdriver.Remote):
+        """Return a WebDriver obtained from ``acquire_browser`` to the pool."""
+        from .pool import browser_pool
+
+        browser_pool.release(driver)
+
     @staticmethod
     def _create_chrome(**kwargs) -> webdriver.Chrome:
         """Create a Chrome WebDriver instance."""
+        profile = BrowserFactory.get_profile(kwargs.get('profile'))
         options = ChromeOptions()
 
         if admin_tester_settings.HEADLESS:
@@ -43,29 +114,50 @@ class BrowserFactory:
         window_size = admin_tester_settings.WINDOW_SIZE
         options.add_argument(f'--window-size={window_size[0]},{window_size[1]}')
 
+        for arg in profile.get('chrome_arguments', []):
+            options.add_argument(arg)
+        if profile.get('chrome_prefs'):
+            options.add_experimental_option('prefs', profile['chrome_prefs'])
+        if profile.get('page_load_strategy'):
+            options.page_load_strategy = profile['page_load_strategy']
+        if profile.get('block_third_party'):
+            excluded = ', '.join(
+                f'EXCLUDE {host}' for host in admin_tester_settings.FIRST_PARTY_HOSTS
+            )
+            options.add_argument(f'--host-resolver-rules=MAP * ~NOTFOUND, {excluded}')
+
         # Add custom Chrome options from kwargs
         for arg in kwargs.get('chrome_options', []):
             options.add_argument(arg)
 
         try:
-            return webdriver.Chrome(ChromeDriverManager().install(), options=options)
+            service = ChromeService(driver_resolver.resolve('chrome'))
+            driver = webdriver.Chrome(service=service, options=options)
         except Exception as e:
             raise AdminTesterBrowserError(
                 f"Failed to create Chrome WebDriver: {str(e)}"
             )
+        if admin_tester_settings.BROWSER_METRICS:
+            enable_metrics(driver)
+        return driver
 
     @staticmethod
     def _create_firefox(**kwargs) -> webdriver.Firefox:
         """Create a Firefox WebDriver instance."""
+        profile = BrowserFactory.get_profile(kwargs.get('profile'))
         options = FirefoxOptions()
 
         if admin_tester_settings.HEADLESS:
             options.add_argument('--headless')
 
+        for name, value in profile.get('firefox_prefs', {}).items():
+            options.set_preference(name, value)
+        if profile.get('page_load_strategy'):
+            options.page_load_strategy = profile['page_load_strategy']
+
         try:
-            return webdriver.Firefox(
-                executable_path=GeckoDriverManager().install(), options=options
-            )
+            service = FirefoxService(driver_resolver.resolve('firefox'))
+            return webdriver.Firefox(service=service, options=options)
         except Exception as e:
             raise AdminTesterBrowserError(
                 f"Failed to create Firefox WebDriver: {str(e)}"
@@ -0,0 +1,113 @@
+from typing import Iterable, List, NamedTuple, Optional, Type
+from django.contrib import admin
+from django.contrib.admin.templatetags.admin_list import result_headers
+from django.contrib.admin.views.main import ALL_VAR, PAGE_VAR, SEARCH_VAR
+from django.db import models
+from django.test import RequestFactory
+from django.urls import reverse
+from .exceptions import AdminTesterConfigError
+from .planner import FilterPlanner, filter_choices
+
+
+class ChangelistUrl(NamedTuple):
+    """A changelist URL the tester should visit."""
+
+    kind: str
+    label: str
+    url: str
+    target: str = ''
+    model: str = ''
+
+
+def changelist_path(model_class: Type[models.Model], site=admin.site) -> str:
+    """Return the path of the changelist for ``model_class``."""
+    opts = model_class._meta
+    return reverse(f'{site.name}:{opts.app_label}_{opts.model_name}_changelist')
+
+
+def get_model_admin(model_class: Type[models.Model], site=admin.site):
+    """Return the ``ModelAdmin`` registered for ``model_class`` on ``site``."""
+    try:
+        return site._registry[model_class]
+    except KeyError:
+        raise AdminTesterConfigError(
+            f"{model_class.__name__} is not registered with {site.name}"
+        )
+
+
+def get_changelist(model_class: Type[models.Model], user, site=admin.site, query=''):
+    """Build the ``ChangeList`` the admin would render for ``user``."""
+    request = RequestFactory().get(f'{changelist_path(model_class, site)}{query}')
+    request.user = user
+    return get_model_admin(model_class, site).get_changelist_instance(request)
+
+
+def changelist_urls(
+    model_class: Type[models.Model],
+    user,
+    site=admin.site,
+    test_filters: Optional[Iterable[str]] = None,
+    search_term: str = 'test',
+    combinations: Optional[str] = None,
+    combination_limit: Optional[int] = None,
+) -> List[ChangelistUrl]:
+    """Enumerate the filter, sort, pagination and search URLs of a changelist.
+
+    Filter URLs come from ``FilterPlanner``; ``combinations`` and
+    ``combination_limit`` override the ``FILTER_COMBINATIONS`` and
+    ``FILTER_COMBINATION_LIMIT`` settings.
+    """
+    path = changelist_path(model_class, site)
+    cl = get_changelist(model_class, user, site)
+    model_label = model_class._meta.label
+    urls = []
+
+    planner = FilterPlanner(
+        filter_choices(cl, test_filters), combinations, combination_limit
+    )
+    for combination in planner.plan():
+        urls.append(
+            ChangelistUrl(
+                'filter',
+                combination.label,
+                f"{path}{combination.query}",
+                combination.target,
+                model_label,
+            )
+        )
+
+    for header in result_headers(cl):
+        if header['sortable']:
+            text = str(header['text'])
+            url = path + header['url_primary']
+            urls.append(ChangelistUrl('sort', text, url, text, model_label))
+
+    if cl.multi_page:
+        # The first page index is 0 on Django < 4.0 and 1 afterwards.
+        first_page = cl.page_num
+        for number in cl.paginator.get_elided_page_range(first_page or 1):
+            if isinstance(number, int) and number > 1:
+                query = cl.get_query_string({PAGE_VAR: number - 1 + first_page})
+                urls.append(
+                    ChangelistUrl(
+                        'page', str(number), path + query, 'page', model_label
+                    )
+                )
+        if cl.can_show_all:
+            query = cl.get_query_string({ALL_VAR: ''})
+            urls.append(
+                ChangelistUrl('page', 'Show all', path + query, 'show all', model_label)
+            )
+
+    if cl.search_fields:
+        urls.append(
+            ChangelistUrl(
+                'search',
+                search_term,
+                path + cl.get_query_string({SEARCH_VAR: search_term}),
+                'search',
+                model_label,
+            )
+        )
+
+    return urls
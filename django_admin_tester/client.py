@@ -0,0 +1,79 @@
+import time
+from typing import Callable, Iterable, List, Optional, Tuple, Type
+from django.contrib import admin
+from django.db import models
+from django.test import Client
+from .changelist import ChangelistUrl, changelist_urls
+
+
+class ClientChecker:
+    """Check changelist URLs in-process with Django's test client.
+
+    Filter, sort and search pages only need to render without an error, which
+    does not require a browser: the URLs are built from the registered
+    ``ModelAdmin`` and requested through ``django.test.Client``.
+    ``model_class`` is only needed by ``run``; ``check_all`` takes any URLs.
+    ``on_result(item, duration, message)`` is called as each URL is checked.
+    """
+
+    def __init__(
+        self,
+        model_class: Optional[Type[models.Model]],
+        user,
+        site=admin.site,
+        client: Optional[Client] = None,
+        on_result: Optional[Callable[..., None]] = None,
+    ):
+        self.model_class = model_class
+        self.user = user
+        self.site = site
+        if client is None:
+            client = Client()
+            client.force_login(user)
+        self.client = client
+        self.on_result = on_result
+        self.timings: List[Tuple[ChangelistUrl, float]] = []
+
+    def check(self, item: ChangelistUrl) -> Optional[str]:
+        """Request one URL and return a failure message, or ``None`` if it passed."""
+        duration = None
+        try:
+            start = time.perf_counter()
+            response = self.client.get(item.url)
+            duration = time.perf_counter() - start
+            self.timings.append((item, duration))
+        except Exception as e:
+            message = f"Failed to load {item.kind}: {item.label} - {str(e)}"
+        else:
+            message = self.response_error(item, response)
+        if self.on_result is not None:
+            self.on_result(item, duration, message)
+        return message
+
+    @staticmethod
+    def response_error(item: ChangelistUrl, response) -> Optional[str]:
+        if response.status_code != 200:
+            return (
+                f"{item.kind.capitalize()} error: {item.label} "
+                f"(HTTP {response.status_code})"
+            )
+        if b'class="errornote"' in response.content:
+            return f"{item.kind.capitalize()} error: {item.label}"
+        return None
+
+    def run(
+        self, test_filters: Optional[Iterable[str]] = None, search_term: str = 'test'
+    ) -> List[str]:
+        """Check every filter, sort and search URL and return the failures."""
+        urls = changelist_urls(
+            self.model_class,
+            self.user,
+            site=self.site,
+            test_filters=test_filters,
+            search_term=search_term,
+        )
+        return self.check_all(urls)
+
+    def check_all(self, urls: Iterable[ChangelistUrl]) -> List[str]:
+        """Check ``urls`` in order and return the failures."""
+        return [message for message in map(self.check, urls) if message]
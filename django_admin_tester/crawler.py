@@ -0,0 +1,107 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Tuple
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from .artifacts import artifact_store
+from .browsers import BrowserFactory
+from .changelist import ChangelistUrl
+from .devtools import collect_metrics
+from .settings import admin_tester_settings
+from .waits import NavigationWaiter
+
+
+class ParallelCrawler:
+    """Visit changelist URLs concurrently on a pool of logged-in browsers.
+
+    Every worker thread lazily checks its own browser, using the browser
+    ``profile``, out of the ``BrowserFactory`` pool and logs it in with
+    ``login(driver)`` before its first URL, so sessions are never shared
+    between threads.
+    ``on_result(item, duration, message, artifacts, browser)`` is called from
+    the worker threads as each URL is checked, with the page's browser
+    metrics when ``BROWSER_METRICS`` is on; failed pages are captured with
+    the ``artifact_store`` when ``SCREENSHOT_ON_FAILURE`` is on.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        login: Callable[[WebDriver], None],
+        workers: Optional[int] = None,
+        browser_type: Optional[str] = None,
+        on_result: Optional[Callable[..., None]] = None,
+        profile: Optional[str] = None,
+    ):
+        self.base_url = base_url
+        self.login = login
+        self.workers = workers or admin_tester_settings.PARALLEL_WORKERS
+        self.browser_type = browser_type
+        self.profile = profile
+        self.on_result = on_result
+        self._local = threading.local()
+        self._drivers: List[WebDriver] = []
+        self.timings: List[Tuple[ChangelistUrl, float]] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _get_driver(self) -> WebDriver:
+        driver = getattr(self._local, 'driver', None)
+        if driver is None:
+            driver = BrowserFactory.acquire_browser(
+                self.browser_type, profile=self.profile
+            )
+            with self._lock:
+                self._drivers.append(driver)
+            self.login(driver)
+            self._local.driver = driver
+            self._local.waiter = NavigationWaiter(driver)
+        return driver
+
+    def check(self, item: ChangelistUrl) -> Optional[str]:
+        """Load one URL and return a failure message, or ``None`` if it passed."""
+        driver = None
+        duration = None
+        message = None
+        browser = None
+        try:
+            driver = self._get_driver()
+            start = time.perf_counter()
+            driver.get(f"{self.base_url}{item.url}")
+            self._local.waiter.wait_for_navigation()
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.timings.append((item, duration))
+            if self.on_result is not None and admin_tester_settings.BROWSER_METRICS:
+                browser = collect_metrics(driver)
+            if driver.find_elements(By.CLASS_NAME, 'errornote'):
+                message = f"{item.kind.capitalize()} error: {item.label}"
+        except Exception as e:
+            message = f"Failed to load {item.kind}: {item.label} - {str(e)}"
+        if self.on_result is not None:
+            artifacts = ()
+            if message and driver and admin_tester_settings.SCREENSHOT_ON_FAILURE:
+                captured = artifact_store.capture(driver, f"{item.model}_{item.kind}")
+                artifacts = tuple(path for path in captured if path)
+            self.on_result(item, duration, message, artifacts, browser)
+        return message
+
+    def crawl(self, urls: Iterable[ChangelistUrl]) -> List[str]:
+        """Check every URL and return the failure messages in input order."""
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix='admin-crawler'
+        ) as executor:
+            results = executor.map(self.check, urls)
+            return [message for message in results if message]
+
+    def close(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            BrowserFactory.release_browser(driver)
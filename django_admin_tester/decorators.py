@@ -1,7 +1,8 @@
 from functools import wraps
 from typing import Callable, Any
 from .exceptions import AdminTesterError
-from .utils import take_screenshot
+from .artifacts import artifact_store
+from .settings import admin_tester_settings
 
 
 def screenshot_on_failure(func: Callable) -> Callable:
@@ -12,13 +13,12 @@ def screenshot_on_failure(func: Callable) -> Callable:
         try:
             return func(self, *args, **kwargs)
         except Exception as e:
-            if hasattr(self, 'selenium'):
-                screenshot_path = take_screenshot(
+            capture = admin_tester_settings.SCREENSHOT_ON_FAILURE
+            if hasattr(self, 'selenium') and capture:
+                artifacts = artifact_store.capture(
                     self.selenium, f"{self.__class__.__name__}_{func.__name__}"
                 )
-                raise AdminTesterError(
-                    f"{str(e)}\nScreenshot saved to: {screenshot_path}"
-                ) from e
+                raise AdminTesterError(f"{str(e)}\n{artifacts.describe()}") from e
             raise
 
     return wrapper
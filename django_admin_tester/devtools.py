@@ -0,0 +1,172 @@
+import logging
+import os
+import weakref
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+# Records long tasks from the start of every document; the Long Tasks API
+# does not keep entries in the performance timeline for later lookup.
+LONG_TASK_OBSERVER = """
+window.__admiralLongTasks = [];
+try {
+    new PerformanceObserver(function (list) {
+        list.getEntries().forEach(function (entry) {
+            window.__admiralLongTasks.push(entry.duration);
+        });
+    }).observe({type: 'longtask', buffered: true});
+} catch (e) {}
+"""
+
+PAGE_TIMINGS = """
+var navigation = performance.getEntriesByType('navigation')[0];
+return {
+    navigation: navigation ? navigation.toJSON() : null,
+    resources: performance.getEntriesByType('resource').map(function (entry) {
+        return [entry.name, entry.initiatorType, entry.transferSize || 0];
+    }),
+    longTasks: window.__admiralLongTasks || []
+};
+"""
+
+# Performance.getMetrics counters kept per page. Counts and durations
+# accumulate over the life of the tab and are reported as the difference
+# from the previous page.
+COUNTERS = (
+    'JSHeapUsedSize',
+    'JSHeapTotalSize',
+    'Nodes',
+    'LayoutCount',
+    'RecalcStyleCount',
+    'LayoutDuration',
+    'RecalcStyleDuration',
+    'ScriptDuration',
+    'TaskDuration',
+)
+
+ASSET_TYPES = {
+    '.js': 'script',
+    '.mjs': 'script',
+    '.css': 'stylesheet',
+    '.png': 'image',
+    '.jpg': 'image',
+    '.jpeg': 'image',
+    '.gif': 'image',
+    '.svg': 'image',
+    '.webp': 'image',
+    '.ico': 'image',
+    '.woff': 'font',
+    '.woff2': 'font',
+    '.ttf': 'font',
+    '.otf': 'font',
+}
+
+_previous_counters: 'weakref.WeakKeyDictionary[WebDriver, Dict[str, float]]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def supports_cdp(driver: WebDriver) -> bool:
+    return callable(getattr(driver, 'execute_cdp_cmd', None))
+
+
+def enable_metrics(driver: WebDriver):
+    """Turn on the CDP performance domain and the long task observer."""
+    if not supports_cdp(driver):
+        return
+    try:
+        driver.execute_cdp_cmd('Performance.enable', {})
+        driver.execute_cdp_cmd(
+            'Page.addScriptToEvaluateOnNewDocument', {'source': LONG_TASK_OBSERVER}
+        )
+    except Exception as e:
+        logger.warning("Could not enable browser metrics: %s", e)
+
+
+def asset_type(url: str, initiator: str) -> str:
+    extension = os.path.splitext(urlsplit(url).path)[1].lower()
+    if extension in ASSET_TYPES:
+        return ASSET_TYPES[extension]
+    if initiator in ('xmlhttprequest', 'fetch', 'beacon'):
+        return 'xhr'
+    return 'other'
+
+
+def cdp_counters(driver: WebDriver) -> Dict[str, float]:
+    """Return this page's ``Performance.getMetrics`` counters."""
+    metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+    values = {
+        metric['name']: metric['value']
+        for metric in metrics
+        if metric['name'] in COUNTERS
+    }
+    previous = _previous_counters.get(driver, {})
+    _previous_counters[driver] = values
+    counters = {}
+    for name, value in values.items():
+        if name.endswith(('Count', 'Duration')) and value >= previous.get(name, 0):
+            value -= previous.get(name, 0)
+        counters[name] = round(value, 6)
+    return counters
+
+
+def collect_metrics(driver: WebDriver) -> Optional[Dict[str, Any]]:
+    """Collect the browser-side cost of the page ``driver`` just loaded.
+
+    Returns navigation timing (milliseconds), bytes transferred per asset
+    type and long tasks for any browser, plus the CDP performance counters
+    on Chrome; ``None`` if the page could not be measured.
+    """
+    try:
+        timings = driver.execute_script(PAGE_TIMINGS)
+    except Exception as e:
+        logger.debug("Could not read page timings: %s", e)
+        return None
+    navigation = timings.get('navigation') or {}
+    transfer = {'document': navigation.get('transferSize', 0)}
+    for url, initiator, size in timings.get('resources') or []:
+        kind = asset_type(url, initiator)
+        transfer[kind] = transfer.get(kind, 0) + size
+    long_tasks = timings.get('longTasks') or []
+    metrics = {
+        'navigation': {
+            name: round(navigation.get(key, 0), 1)
+            for name, key in (
+                ('ttfb', 'responseStart'),
+                ('response_end', 'responseEnd'),
+                ('dom_interactive', 'domInteractive'),
+                ('dom_content_loaded', 'domContentLoadedEventEnd'),
+                ('load', 'loadEventEnd'),
+            )
+        },
+        'transfer': transfer,
+        'long_tasks': {
+            'count': len(long_tasks),
+            'total_ms': round(sum(long_tasks), 1),
+            'max_ms': round(max(long_tasks, default=0), 1),
+        },
+    }
+    if supports_cdp(driver):
+        try:
+            metrics['counters'] = cdp_counters(driver)
+        except Exception as e:
+            logger.debug("Could not read CDP metrics: %s", e)
+    return metrics
+
+
+def describe_metrics(metrics: Dict[str, Any]) -> str:
+    """Summarize collected browser metrics on one line."""
+    navigation = metrics.get('navigation', {})
+    long_tasks = metrics.get('long_tasks', {})
+    parts = [
+        f"load {navigation.get('load', 0):.0f}ms",
+        f"{sum(metrics.get('transfer', {}).values()) / 1024:.1f} KiB transferred",
+        f"{long_tasks.get('count', 0)} long tasks",
+    ]
+    counters = metrics.get('counters')
+    if counters:
+        parts.append(f"script {counters.get('ScriptDuration', 0) * 1000:.0f}ms")
+        parts.append(f"heap {counters.get('JSHeapUsedSize', 0) / 1048576:.1f} MiB")
+    return ', '.join(parts)
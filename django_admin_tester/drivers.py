@@ -0,0 +1,91 @@
+import json
+import os
+import threading
+from typing import Dict, Optional
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from .exceptions import AdminTesterConfigError
+from .settings import admin_tester_settings
+
+DRIVER_MANAGERS = {
+    'chrome': ChromeDriverManager,
+    'firefox': GeckoDriverManager,
+}
+
+
+class DriverResolver:
+    """Resolve WebDriver binaries once and remember them on disk.
+
+    Paths are cached per browser version in a JSON file, so a browser
+    upgrade picks up a matching driver while every other run skips
+    ``webdriver_manager`` entirely. In offline mode nothing is downloaded or
+    probed: a binary configured in ``DRIVER_PATHS`` is used as is, otherwise
+    the last cached driver for the browser is reused.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None):
+        self._cache_path = cache_path
+        self._resolved: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache_path(self) -> str:
+        path = self._cache_path or admin_tester_settings.DRIVER_CACHE_PATH
+        return os.path.expanduser(path)
+
+    def _read_cache(self) -> dict:
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, cache: dict):
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+
+    def resolve(self, browser_type: str) -> str:
+        """Return the path of the driver binary for ``browser_type``."""
+        browser_type = browser_type.lower()
+        local_path = admin_tester_settings.DRIVER_PATHS.get(browser_type)
+        if local_path:
+            return local_path
+
+        with self._lock:
+            if browser_type not in self._resolved:
+                if admin_tester_settings.DRIVER_OFFLINE:
+                    path = self._resolve_offline(browser_type)
+                else:
+                    path = self._resolve_online(browser_type)
+                self._resolved[browser_type] = path
+            return self._resolved[browser_type]
+
+    def _resolve_offline(self, browser_type: str) -> str:
+        entry = self._read_cache().get(f'{browser_type}:latest')
+        if not entry or not os.path.exists(entry):
+            raise AdminTesterConfigError(
+                f"No cached {browser_type} driver is available offline; set "
+                f"ADMIN_TESTER_DRIVER_PATHS['{browser_type}'] to a local binary"
+            )
+        return entry
+
+    def _resolve_online(self, browser_type: str) -> str:
+        manager = DRIVER_MANAGERS[browser_type]()
+        version = manager.driver.get_browser_version_from_os()
+        key = f'{browser_type}:{version}'
+        cache = self._read_cache()
+        path = cache.get(key)
+        if not path or not os.path.exists(path):
+            path = manager.install()
+        if cache.get(key) != path or cache.get(f'{browser_type}:latest') != path:
+            cache[key] = cache[f'{browser_type}:latest'] = path
+            self._write_cache(cache)
+        return path
+
+
+driver_resolver = DriverResolver()
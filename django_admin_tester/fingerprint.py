@@ -0,0 +1,199 @@
+import datetime
+import hashlib
+import inspect
+import json
+import os
+import sys
+from typing import Dict, Iterable, Optional, Type
+import django
+from django.contrib import admin
+from django.contrib.staticfiles import finders
+from django.db import models
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.writer import MigrationWriter
+from django.template import TemplateDoesNotExist
+from django.template.loader import select_template
+from .changelist import get_model_admin
+from .settings import admin_tester_settings
+
+# Templates the admin renders for a model, most specific first.
+ADMIN_TEMPLATES = ('change_list.html', 'change_form.html', 'delete_confirmation.html')
+BASE_TEMPLATES = ('admin/base_site.html', 'admin/base.html')
+
+
+def _file_digest(path: Optional[str]) -> str:
+    if not path or not os.path.isfile(path):
+        return 'missing'
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _class_sources(cls: type) -> Iterable[str]:
+    """Yield the source files defining ``cls`` and its non-Django bases.
+
+    Whole modules are hashed rather than the class body, so module-level
+    constants such as shared ``list_display`` tuples are covered too.
+    """
+    for klass in cls.__mro__:
+        module = sys.modules.get(klass.__module__)
+        if module is None or klass.__module__.startswith(('django.', 'builtins')):
+            continue
+        try:
+            yield inspect.getsourcefile(module) or klass.__module__
+        except TypeError:
+            yield klass.__module__
+
+
+def _field_signature(field: models.Field) -> str:
+    name, path, args, kwargs = field.deconstruct()
+    try:
+        serialized, _ = MigrationWriter.serialize((path, args, kwargs))
+    except ValueError:
+        serialized = repr((path, sorted(kwargs)))
+    return f"{name}={serialized}"
+
+
+def _migration_files(app_label: str) -> Iterable[str]:
+    module_name, _ = MigrationLoader.migrations_module(app_label)
+    module = sys.modules.get(module_name)
+    if module is None or not getattr(module, '__path__', None):
+        return []
+    directory = list(module.__path__)[0]
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.endswith('.py')
+    )
+
+
+def _template_files(model_admin) -> Iterable[str]:
+    opts = model_admin.model._meta
+    candidates = [
+        [
+            custom
+            for custom in [getattr(model_admin, f"{name[:-5]}_template", None)]
+            if custom
+        ]
+        + [
+            f"admin/{opts.app_label}/{opts.model_name}/{name}",
+            f"admin/{opts.app_label}/{name}",
+            f"admin/{name}",
+        ]
+        for name in ADMIN_TEMPLATES
+    ]
+    candidates.extend([name] for name in BASE_TEMPLATES)
+    for names in candidates:
+        try:
+            template = select_template(names)
+        except TemplateDoesNotExist:
+            continue
+        yield getattr(template.origin, 'name', None) or str(template.origin)
+
+
+def _media_files(model_admin) -> Iterable[str]:
+    media = model_admin.media
+    paths = list(media._js)
+    for medium_paths in media._css.values():
+        paths.extend(medium_paths)
+    for path in paths:
+        path = str(path)
+        if '://' in path or path.startswith('/'):
+            yield path
+        else:
+            yield finders.find(path) or path
+
+
+def admin_fingerprint(
+    model_class: Type[models.Model], site=admin.site, extra: str = ''
+) -> str:
+    """Hash everything a model's admin pages depend on.
+
+    Covers the ``ModelAdmin`` source, the model's fields and migrations, the
+    admin templates in use and the ``Media`` files, plus ``extra`` (such as
+    the test case's own source) and the Django version.
+    """
+    model_admin = get_model_admin(model_class, site)
+    opts = model_class._meta
+    parts = [django.get_version(), extra]
+    parts.extend(
+        f"source:{path}:{_file_digest(path)}"
+        for path in dict.fromkeys(_class_sources(type(model_admin)))
+    )
+    parts.extend(
+        f"field:{_field_signature(field)}"
+        for field in opts.concrete_fields + opts.many_to_many
+    )
+    parts.extend(
+        f"migration:{os.path.basename(path)}:{_file_digest(path)}"
+        for path in _migration_files(opts.app_label)
+    )
+    parts.extend(
+        f"template:{path}:{_file_digest(path)}" for path in _template_files(model_admin)
+    )
+    parts.extend(
+        f"media:{path}:{_file_digest(path)}" for path in _media_files(model_admin)
+    )
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+
+class ResultCache:
+    """Remember which admins passed, and with which fingerprint.
+
+    The cache is a JSON file; ``save`` merges into whatever is on disk so
+    test processes running side by side do not drop each other's results.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or admin_tester_settings.RESULT_CACHE_PATH
+        self.entries = self._load()
+        self._changes: Dict[str, Optional[dict]] = {}
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def is_fresh(self, label: str, fingerprint: str) -> bool:
+        """Whether ``label`` passed its last run with this ``fingerprint``."""
+        entry = self.entries.get(label)
+        return bool(entry and entry.get('fingerprint') == fingerprint)
+
+    def record(self, label: str, fingerprint: str, passed: bool):
+        entry = None
+        if passed:
+            entry = {
+                'fingerprint': fingerprint,
+                'tested': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            }
+        self._changes[label] = entry
+        if entry is None:
+            self.entries.pop(label, None)
+        else:
+            self.entries[label] = entry
+
+    def merge(self, entries: Dict[str, dict]):
+        """Take over ``entries`` that were tested more recently than ours."""
+        for label, entry in entries.items():
+            current = self.entries.get(label)
+            if current is None or entry.get('tested', '') > current.get('tested', ''):
+                self.entries[label] = entry
+                self._changes[label] = entry
+
+    def save(self):
+        entries = self._load()
+        for label, entry in self._changes.items():
+            if entry is None:
+                entries.pop(label, None)
+            else:
+                entries[label] = entry
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.entries = entries
+        self._changes = {}
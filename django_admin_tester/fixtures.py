@@ -0,0 +1,368 @@
+import datetime
+import decimal
+import hashlib
+import os
+import random
+import sqlite3
+import string
+import uuid
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connections, models, transaction
+from django.utils import timezone
+from .exceptions import AdminTesterConfigError
+from .settings import admin_tester_settings
+
+# How many related primary keys are sampled for foreign key values.
+RELATED_SAMPLE_SIZE = 10000
+
+ValueFactory = Callable[[random.Random, int], Any]
+
+
+def _integer_factory(field: models.Field, connection, low=0, high=1000):
+    min_value, max_value = connection.ops.integer_field_range(
+        field.get_internal_type()
+    )
+    if min_value is not None:
+        low = max(low, min_value)
+    if max_value is not None:
+        high = min(high, max_value)
+    if field.unique:
+        return lambda rng, index: low + index
+    return lambda rng, index: rng.randint(low, high)
+
+
+def _decimal_factory(field: models.DecimalField):
+    integer_digits = field.max_digits - field.decimal_places
+    high = min(10**integer_digits - 1, 1000)
+    quantum = decimal.Decimal(1).scaleb(-field.decimal_places)
+    return lambda rng, index: decimal.Decimal(rng.uniform(0, high)).quantize(quantum)
+
+
+def _text_factory(field: models.Field):
+    max_length = field.max_length or 200
+    if isinstance(field, models.EmailField):
+        return lambda rng, index: f"user{index}@example.com"[:max_length]
+    if isinstance(field, models.URLField):
+        return lambda rng, index: f"https://example.com/{index}"[:max_length]
+    if isinstance(field, models.SlugField):
+        return lambda rng, index: f"slug-{index}"[:max_length]
+
+    def factory(rng, index):
+        length = rng.randint(1, min(max_length, 40))
+        text = ''.join(rng.choice(string.ascii_lowercase + ' ') for _ in range(length))
+        if field.unique:
+            text = f"{index}-{text}"
+        return text[:max_length]
+
+    return factory
+
+
+def _datetime_factory(field: models.Field):
+    now = timezone.now() if settings.USE_TZ else datetime.datetime.now()
+    span = 5 * 365 * 24 * 3600
+
+    def factory(rng, index):
+        moment = now - datetime.timedelta(seconds=rng.randint(0, span))
+        if isinstance(field, models.DateTimeField):
+            return moment
+        if isinstance(field, models.DateField):
+            return moment.date()
+        return moment.time()
+
+    return factory
+
+
+def _related_factory(field: models.ForeignKey, using: str):
+    related = field.related_model._default_manager.using(using)
+    pks = list(related.values_list('pk', flat=True)[:RELATED_SAMPLE_SIZE])
+    if not pks:
+        if field.null:
+            return lambda rng, index: None
+        raise AdminTesterConfigError(
+            f"Cannot generate {field.model.__name__}.{field.name}: "
+            f"{field.related_model.__name__} has no rows"
+        )
+    return lambda rng, index: rng.choice(pks)
+
+
+def _distribution_factory(distribution) -> ValueFactory:
+    if callable(distribution):
+        return distribution
+    if isinstance(distribution, tuple) and len(distribution) == 2:
+        low, high = distribution
+        if isinstance(low, int) and isinstance(high, int):
+            return lambda rng, index: rng.randint(low, high)
+        return lambda rng, index: rng.uniform(low, high)
+    values = list(distribution)
+    return lambda rng, index: rng.choice(values)
+
+
+class FixtureGenerator:
+    """Fill a model with generated rows through batched ``bulk_create``.
+
+    Values are derived from each concrete field's type. ``distributions``
+    overrides a field with a callable ``(rng, row_index) -> value``, a
+    ``(low, high)`` range or a sequence of values to pick from. Rows are
+    built one batch at a time, so memory use does not grow with ``rows``.
+    """
+
+    def __init__(
+        self,
+        model: Type[models.Model],
+        distributions: Optional[Dict[str, Any]] = None,
+        batch_size: Optional[int] = None,
+        seed: int = 0,
+        using: str = 'default',
+    ):
+        self.model = model
+        self.distributions = distributions or {}
+        self.batch_size = batch_size or admin_tester_settings.FIXTURE_BATCH_SIZE
+        self.seed = seed
+        self.using = using
+
+    def value_factories(self) -> Dict[str, ValueFactory]:
+        connection = connections[self.using]
+        factories = {}
+        for field in self.model._meta.concrete_fields:
+            name = field.attname
+            if field.name in self.distributions:
+                factories[name] = _distribution_factory(self.distributions[field.name])
+            elif field.primary_key and isinstance(field, models.AutoField):
+                continue
+            elif field.choices:
+                values = [value for value, _ in field.flatchoices]
+                factories[name] = _distribution_factory(values)
+            elif isinstance(field, models.ForeignKey):
+                factories[name] = _related_factory(field, self.using)
+            elif isinstance(field, models.BooleanField):
+                factories[name] = lambda rng, index: rng.random() < 0.5
+            elif isinstance(field, models.IntegerField):
+                factories[name] = _integer_factory(field, connection)
+            elif isinstance(field, models.DecimalField):
+                factories[name] = _decimal_factory(field)
+            elif isinstance(field, models.FloatField):
+                factories[name] = lambda rng, index: rng.uniform(0, 1000)
+            elif isinstance(field, (models.CharField, models.TextField)):
+                factories[name] = _text_factory(field)
+            elif isinstance(field, (models.DateField, models.TimeField)):
+                factories[name] = _datetime_factory(field)
+            elif isinstance(field, models.UUIDField):
+                factories[name] = lambda rng, index: uuid.UUID(
+                    int=rng.getrandbits(128)
+                )
+            elif field.has_default() or field.null:
+                continue
+            else:
+                raise AdminTesterConfigError(
+                    f"Cannot generate values for {self.model.__name__}.{field.name}; "
+                    f"add it to distributions"
+                )
+        return factories
+
+    def iter_batches(self, rows: int) -> Iterator[List[models.Model]]:
+        """Yield unsaved instances, ``batch_size`` at a time."""
+        rng = random.Random(self.seed)
+        factories = self.value_factories()
+        for start in range(0, rows, self.batch_size):
+            yield [
+                self.model(
+                    **{name: factory(rng, index) for name, factory in factories.items()}
+                )
+                for index in range(start, min(start + self.batch_size, rows))
+            ]
+
+    def generate(self, rows: int) -> int:
+        """Insert ``rows`` generated rows and return how many were created."""
+        manager = self.model._default_manager.using(self.using)
+        created = 0
+        for batch in self.iter_batches(rows):
+            with transaction.atomic(using=self.using):
+                manager.bulk_create(batch, batch_size=self.batch_size)
+            created += len(batch)
+        return created
+
+
+class DatabaseSnapshot:
+    """Save and restore seeded data so repeated runs can skip seeding.
+
+    Only the rows of the seeded model, and of its auto-created many-to-many
+    tables, are saved and restored; other tables are left alone. On SQLite,
+    including in-memory test databases, the tables are copied row for row
+    into a snapshot database file. Other backends dump and reload the rows
+    as JSON Lines.
+    """
+
+    def __init__(self, name: str, using: str = 'default'):
+        self.name = name
+        self.using = using
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    @property
+    def path(self) -> str:
+        extension = 'sqlite3' if self.connection.vendor == 'sqlite' else 'jsonl'
+        return os.path.join(
+            admin_tester_settings.FIXTURE_SNAPSHOT_DIR, f"{self.name}.{extension}"
+        )
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    @staticmethod
+    def tables(model: Type[models.Model]) -> List[str]:
+        opts = model._meta
+        return [opts.db_table] + [
+            field.remote_field.through._meta.db_table
+            for field in opts.local_many_to_many
+            if field.remote_field.through._meta.auto_created
+        ]
+
+    def save(self, model: Type[models.Model]):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        if self.connection.vendor == 'sqlite':
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            target = sqlite3.connect(tmp_path)
+            try:
+                for table in self.tables(model):
+                    self._copy_table(table, target)
+                target.commit()
+            finally:
+                target.close()
+        else:
+            call_command(
+                'dumpdata',
+                model._meta.label,
+                format='jsonl',
+                database=self.using,
+                output=tmp_path,
+            )
+        os.replace(tmp_path, self.path)
+
+    def _copy_table(self, table: str, target: sqlite3.Connection):
+        quote = self.connection.ops.quote_name
+        self.connection.ensure_connection()
+        source = self.connection.connection
+        schema = source.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+            [table],
+        ).fetchone()[0]
+        target.execute(schema)
+        columns = [
+            row[1] for row in source.execute(f"PRAGMA table_info({quote(table)})")
+        ]
+        # A unary plus drops the declared type, so Django's converters leave
+        # the stored values as they are.
+        rows = source.execute(
+            f"SELECT {', '.join(f'+{quote(column)}' for column in columns)} "
+            f"FROM {quote(table)}"
+        )
+        insert = (
+            f"INSERT INTO {quote(table)} "
+            f"({', '.join(quote(column) for column in columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        batch_size = admin_tester_settings.FIXTURE_BATCH_SIZE
+        while True:
+            batch = rows.fetchmany(batch_size)
+            if not batch:
+                break
+            target.executemany(insert, batch)
+
+    def _clear(self, model: Type[models.Model]):
+        """Delete the rows of ``tables(model)``, without cascading elsewhere."""
+        quote = self.connection.ops.quote_name
+        with self.connection.cursor() as cursor:
+            for table in reversed(self.tables(model)):
+                cursor.execute(f"DELETE FROM {quote(table)}")
+
+    def restore(self, model: Type[models.Model]):
+        # Rows of other tables may still point at the deleted rows until the
+        # same rows are loaded back.
+        with transaction.atomic(using=self.using):
+            with self.connection.constraint_checks_disabled():
+                self._clear(model)
+                if self.connection.vendor != 'sqlite':
+                    call_command(
+                        'loaddata', self.path, database=self.using, verbosity=0
+                    )
+                else:
+                    self._load_tables(model)
+
+    def _load_tables(self, model: Type[models.Model]):
+        batch_size = admin_tester_settings.FIXTURE_BATCH_SIZE
+        quote = self.connection.ops.quote_name
+        # Read raw column values, without the type converters Django installs.
+        source = sqlite3.connect(self.path)
+        try:
+            target = self.connection.connection
+            for table in self.tables(model):
+                rows = source.execute(f"SELECT * FROM {quote(table)}")
+                columns = ', '.join(quote(column[0]) for column in rows.description)
+                marks = ', '.join('?' * len(rows.description))
+                insert = f"INSERT INTO {quote(table)} ({columns}) VALUES ({marks})"
+                while True:
+                    batch = rows.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    target.executemany(insert, batch)
+        finally:
+            source.close()
+
+
+def _fingerprint(value) -> str:
+    """Describe a distribution so that changing it changes the snapshot name."""
+    code = getattr(value, '__code__', None)
+    if code is not None:
+        return f"{value.__qualname__}:{code.co_code.hex()}:{code.co_consts!r}"
+    if isinstance(value, (list, tuple)):
+        return repr([_fingerprint(item) for item in value])
+    return repr(value)
+
+
+def snapshot_name(
+    model: Type[models.Model],
+    rows: int,
+    seed: int,
+    distributions: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Name a snapshot after the model, its schema, the data requested and seed."""
+    schema = repr(
+        [(f.attname, f.get_internal_type()) for f in model._meta.concrete_fields]
+    )
+    data = repr(
+        sorted(
+            (name, _fingerprint(value))
+            for name, value in (distributions or {}).items()
+        )
+    )
+    digest = hashlib.sha1(f"{schema}{data}".encode()).hexdigest()[:10]
+    return f"{model._meta.label_lower}-{rows}-{seed}-{digest}"
+
+
+def seed_model(
+    model: Type[models.Model],
+    rows: int,
+    distributions: Optional[Dict[str, Any]] = None,
+    seed: int = 0,
+    using: str = 'default',
+) -> DatabaseSnapshot:
+    """Fill ``model`` with ``rows`` rows, restoring a snapshot when one exists.
+
+    Snapshots are keyed by model schema, ``rows``, ``distributions`` and
+    ``seed``.
+    """
+    snapshot = DatabaseSnapshot(
+        snapshot_name(model, rows, seed, distributions), using
+    )
+    if snapshot.exists():
+        snapshot.restore(model)
+    else:
+        FixtureGenerator(model, distributions, seed=seed, using=using).generate(rows)
+        snapshot.save(model)
+    return snapshot
@@ -0,0 +1,230 @@
+import time
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+from django.contrib import admin
+from django.db import connection, models
+from django.test import Client, RequestFactory
+from django.urls import reverse
+from .changelist import ChangelistUrl, get_model_admin
+from .queries import QueryRecorder
+from .settings import admin_tester_settings
+
+
+class HeavyWidget(NamedTuple):
+    """A relation rendered as a ``<select>`` listing every related row."""
+
+    name: str
+    field: str
+    related_model: str
+    options: int
+    inline: str = ''
+
+
+class FormSample(NamedTuple):
+    """What rendering one add or change form cost."""
+
+    item: ChangelistUrl
+    duration: float
+    queries: int
+    size: int
+    nodes: int
+    widgets: Tuple[HeavyWidget, ...]
+
+    @property
+    def summary(self) -> str:
+        return f"{self.size / 1024:.1f} KiB, {self.nodes} nodes"
+
+
+class FormParser(HTMLParser):
+    """Count the elements of a page and the options of each ``<select>``."""
+
+    def __init__(self):
+        super().__init__()
+        self.nodes = 0
+        self.options: Dict[str, int] = {}
+        self._select: Optional[str] = None
+
+    def handle_starttag(self, tag, attrs):
+        self.nodes += 1
+        if tag == 'select':
+            self._select = dict(attrs).get('name') or ''
+            self.options.setdefault(self._select, 0)
+        elif tag == 'option' and self._select is not None:
+            self.options[self._select] += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.nodes += 1
+
+    def handle_endtag(self, tag):
+        if tag == 'select':
+            self._select = None
+
+
+def relation_fields(model_admin) -> Dict[str, models.Field]:
+    """Return the FK and M2M fields an admin renders as plain selects.
+
+    Fields in ``raw_id_fields`` or ``autocomplete_fields`` are left out, as
+    they do not load the related rows into the page.
+    """
+    guarded = set(model_admin.raw_id_fields) | set(model_admin.autocomplete_fields)
+    opts = model_admin.model._meta
+    return {
+        field.name: field
+        for field in opts.concrete_fields + opts.many_to_many
+        if field.is_relation
+        and (field.many_to_one or field.many_to_many or field.one_to_one)
+        and field.editable
+        and field.name not in guarded
+    }
+
+
+class FormChecker:
+    """Render a model's add and change forms and weigh them.
+
+    Both views are requested through the test client; response size, DOM
+    node count, render time and queries are measured. Every ``ForeignKey``
+    or ``ManyToManyField`` select, on the form or its inlines, with at least
+    ``FORM_SELECT_LIMIT`` rendered options fails, pointing at
+    ``raw_id_fields`` or ``autocomplete_fields``.
+    ``on_result(item, duration, message)`` is called for every form.
+    """
+
+    def __init__(
+        self,
+        model_class: Type[models.Model],
+        user,
+        site=admin.site,
+        client: Optional[Client] = None,
+        on_result: Optional[Callable[..., None]] = None,
+    ):
+        self.model_class = model_class
+        self.user = user
+        self.site = site
+        if client is None:
+            client = Client()
+            client.force_login(user)
+        self.client = client
+        self.on_result = on_result
+        self.samples: List[FormSample] = []
+
+    def form_urls(self) -> List[ChangelistUrl]:
+        model_admin = get_model_admin(self.model_class, self.site)
+        request = RequestFactory().get('/')
+        request.user = self.user
+        opts = self.model_class._meta
+        prefix = f'{self.site.name}:{opts.app_label}_{opts.model_name}'
+        urls = []
+        if model_admin.has_add_permission(request):
+            urls.append(
+                ChangelistUrl(
+                    'add', 'add form', reverse(f'{prefix}_add'), 'add', opts.label
+                )
+            )
+        obj = model_admin.get_queryset(request).order_by('pk').first()
+        if obj is not None and model_admin.has_view_or_change_permission(
+            request, obj
+        ):
+            urls.append(
+                ChangelistUrl(
+                    'change',
+                    'change form',
+                    reverse(f'{prefix}_change', args=[obj.pk]),
+                    'change',
+                    opts.label,
+                )
+            )
+        return urls
+
+    def heavy_widgets(self, options: Dict[str, int]) -> List[HeavyWidget]:
+        """Match the selects of a rendered form to unguarded relation fields.
+
+        Inline form fields are named ``<prefix>-<index>-<field>``; only the
+        first form of each inline is reported.
+        """
+        model_admin = get_model_admin(self.model_class, self.site)
+        fields = {
+            name: (field, '') for name, field in relation_fields(model_admin).items()
+        }
+        inline_fields = {}
+        for inline_class in model_admin.inlines:
+            inline = inline_class(self.model_class, self.site)
+            for name, field in relation_fields(inline).items():
+                inline_fields[name] = (field, inline.model._meta.label)
+        limit = admin_tester_settings.FORM_SELECT_LIMIT
+        widgets = []
+        seen = set()
+        for name, count in options.items():
+            field_name = name.rsplit('-', 1)[-1]
+            field, inline = (inline_fields if '-' in name else fields).get(
+                field_name, (None, '')
+            )
+            if field is None or (field_name, inline) in seen:
+                continue
+            seen.add((field_name, inline))
+            # Only the rendered options count: limit_choices_to or
+            # formfield_for_foreignkey may narrow a select on a large table.
+            if count >= limit:
+                widgets.append(
+                    HeavyWidget(
+                        name, field_name, field.related_model._meta.label, count, inline
+                    )
+                )
+        return widgets
+
+    def measure(self, item: ChangelistUrl) -> FormSample:
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            start = time.perf_counter()
+            response = self.client.get(item.url)
+            duration = time.perf_counter() - start
+        if response.status_code != 200:
+            raise ValueError(f"HTTP {response.status_code}")
+        parser = FormParser()
+        parser.feed(response.content.decode(response.charset or 'utf-8'))
+        return FormSample(
+            item,
+            duration,
+            len(recorder.queries),
+            len(response.content),
+            parser.nodes,
+            tuple(self.heavy_widgets(parser.options)),
+        )
+
+    def widget_problem(self, sample: FormSample) -> Optional[str]:
+        if not sample.widgets:
+            return None
+        fixes = set()
+        lines = []
+        for widget in sample.widgets:
+            where = f" on the {widget.inline} inline" if widget.inline else ''
+            lines.append(
+                f"    {widget.field}{where} lists {widget.options} "
+                f"{widget.related_model} rows"
+            )
+            fixes.add(widget.field)
+        return (
+            f"Oversized select widgets on the {sample.item.label} of "
+            f"{self.model_class._meta.label}; add "
+            f"{', '.join(repr(name) for name in sorted(fixes))} to raw_id_fields "
+            f"or autocomplete_fields:\n" + '\n'.join(lines)
+        )
+
+    def run(self) -> List[str]:
+        """Render every form and return the problems found."""
+        problems = []
+        for item in self.form_urls():
+            try:
+                sample = self.measure(item)
+            except Exception as e:
+                message = f"Failed to load {item.label} - {str(e)}"
+                duration = None
+            else:
+                self.samples.append(sample)
+                message = self.widget_problem(sample)
+                duration = sample.duration
+                item = item._replace(label=f"{item.label} ({sample.summary})")
+            if message:
+                problems.append(message)
+            if self.on_result is not None:
+                self.on_result(item, duration, message)
+        return problems
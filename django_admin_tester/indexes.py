@@ -0,0 +1,288 @@
+import json
+import os
+import re
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Type,
+)
+from django.contrib import admin
+from django.core.exceptions import FieldDoesNotExist
+from django.db import DatabaseError, connections, models, router
+from .changelist import changelist_path, changelist_urls, get_changelist
+from .planner import parse_query
+from .registry import estimated_rows
+from .settings import admin_tester_settings
+
+# How each backend's EXPLAIN output reports a full table scan and a sort that
+# cannot use an index; ``{table}`` is replaced by the model's quoted table.
+PLAN_PATTERNS = {
+    'sqlite': {
+        'seq_scan': r'\bSCAN (?:TABLE )?{table}\b(?! USING)',
+        'filesort': r'USE TEMP B-TREE FOR (?:RIGHT PART OF )?ORDER BY',
+    },
+    'postgresql': {
+        'seq_scan': r'\bSeq Scan on {table}\b',
+        'filesort': r'^\s*(?:->\s*)?Sort\b',
+    },
+    'mysql': {
+        # Rows are joined with spaces: id, select_type, table, partitions, type.
+        'seq_scan': r'^\S+ \S+ {table} \S+ ALL\b',
+        'filesort': r'Using filesort',
+    },
+}
+
+SEARCH_PREFIXES = '^=@'
+
+
+class IndexAdvice(NamedTuple):
+    """A slow query plan behind an admin page and the index that would help."""
+
+    model: str
+    problem: str
+    attribute: str
+    fields: Tuple[str, ...]
+    url: str
+    suggestion: str
+    plan: str
+
+    @property
+    def message(self) -> str:
+        problems = {
+            'seq_scan': 'scans the whole table',
+            'filesort': 'sorts without an index',
+            'like_scan': "runs LIKE '%...%' over the whole table",
+        }
+        return (
+            f"{self.model} {self.attribute} ({', '.join(self.fields)}) "
+            f"{problems[self.problem]} on {self.url}: {self.suggestion}"
+        )
+
+
+def indexed_fields(model_class: Type[models.Model]) -> set:
+    """Return the fields that lead a single-column or composite index."""
+    opts = model_class._meta
+    leading = {
+        field.name
+        for field in opts.concrete_fields
+        if field.primary_key or field.unique or field.db_index
+    }
+    for index in opts.indexes:
+        if index.fields:
+            leading.add(index.fields[0].lstrip('-'))
+    for fields in opts.unique_together:
+        leading.add(fields[0])
+    return leading
+
+
+def plan_patterns(vendor: str, table: str) -> Dict[str, Pattern]:
+    """Compile the ``PLAN_PATTERNS`` of ``vendor`` for one table."""
+    table = re.escape(table)
+    return {
+        problem: re.compile(pattern.format(table=rf'["`]?{table}["`]?'), re.MULTILINE)
+        for problem, pattern in PLAN_PATTERNS.get(vendor, {}).items()
+    }
+
+
+def index_exists(model_class: Type[models.Model], fields: Sequence[str]) -> bool:
+    """Whether an index already starts with ``fields``, in their directions.
+
+    A single field is also covered, in either direction, by any index it leads.
+    """
+    if len(fields) == 1 and fields[0].lstrip('-') in indexed_fields(model_class):
+        return True
+    opts = model_class._meta
+    existing = [list(index.fields) for index in opts.indexes]
+    existing.extend(list(names) for names in opts.unique_together)
+    return any(names[: len(fields)] == list(fields) for names in existing)
+
+
+def local_field(model_class: Type[models.Model], path: str) -> Optional[str]:
+    """Return the concrete field of ``model_class`` a lookup path starts with."""
+    name = path.lstrip('-').split('__')[0]
+    if name == 'pk':
+        return model_class._meta.pk.name
+    try:
+        field = model_class._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    return field.name if getattr(field, 'concrete', False) else None
+
+
+def index_code(model_class: Type[models.Model], fields: Iterable[str]) -> str:
+    index = models.Index(fields=list(fields))
+    index.set_name_with_model(model_class)
+    return f"models.Index(fields={list(index.fields)!r}, name={index.name!r})"
+
+
+class IndexAdvisor:
+    """Explain the queries behind a changelist's filter, sort and search pages.
+
+    The page query of each variant is run through ``QuerySet.explain()`` and
+    its plan searched for full scans of the model's table, sorts without an
+    index and ``LIKE '%...%'`` searches. Every problem names the ``ModelAdmin``
+    attribute behind it and suggests an index. Tables below ``min_rows`` rows
+    (``INDEX_ADVICE_MIN_ROWS``) are skipped, as scanning them is cheap.
+    """
+
+    def __init__(
+        self,
+        model_class: Type[models.Model],
+        user,
+        site=admin.site,
+        min_rows: Optional[int] = None,
+    ):
+        self.model_class = model_class
+        self.user = user
+        self.site = site
+        if min_rows is None:
+            min_rows = admin_tester_settings.INDEX_ADVICE_MIN_ROWS
+        self.min_rows = min_rows
+        self.using = router.db_for_read(model_class)
+        self.vendor = connections[self.using].vendor
+        self.patterns = plan_patterns(self.vendor, model_class._meta.db_table)
+
+    def variants(self) -> Iterable[Tuple[str, Tuple[str, ...], str]]:
+        """Yield ``(attribute, fields, url)`` once per distinct query shape.
+
+        Filters are told apart by the fields they filter on, sorts by their
+        URL; the fields of sort variants come from the query's ordering.
+        """
+        cl = get_changelist(self.model_class, self.user, self.site)
+        yield 'ordering', (), changelist_path(self.model_class, self.site)
+        seen = set()
+        urls = changelist_urls(
+            self.model_class, self.user, self.site, combinations='single'
+        )
+        for item in urls:
+            if item.kind == 'filter':
+                params = parse_query(item.url.partition('?')[2])
+                names = {local_field(self.model_class, name) for name, _ in params}
+                fields = tuple(sorted(filter(None, names)))
+                key = ('list_filter', fields)
+            elif item.kind == 'sort':
+                fields = ()
+                key = ('list_display', item.url)
+            elif item.kind == 'search':
+                fields = tuple(cl.search_fields)
+                key = ('search_fields', fields)
+            else:
+                continue
+            if key not in seen:
+                seen.add(key)
+                yield key[0], fields, item.url
+
+    def explain(self, url: str) -> Tuple[str, Tuple[str, ...]]:
+        """Return the plan of the page query of ``url`` and its ordering."""
+        query = url.partition('?')[2]
+        cl = get_changelist(
+            self.model_class, self.user, self.site, f"?{query}" if query else ''
+        )
+        queryset = cl.queryset.using(self.using)
+        ordering = tuple(str(field) for field in queryset.query.order_by)
+        return queryset[: cl.list_per_page].explain(), ordering
+
+    def advise(self, attribute, fields, url, plan, ordering) -> List[IndexAdvice]:
+        label = self.model_class._meta.label
+        indexed = indexed_fields(self.model_class)
+        advice = []
+        scan = 'seq_scan' in self.patterns and self.patterns['seq_scan'].search(plan)
+        if scan and attribute == 'search_fields':
+            contains = tuple(
+                name
+                for name in fields
+                if name[0] not in SEARCH_PREFIXES and '__' not in name
+            )
+            if contains:
+                if self.vendor == 'postgresql':
+                    suggestion = (
+                        "add a trigram index, GinIndex(fields=[...], "
+                        "opclasses=['gin_trgm_ops']) per field"
+                    )
+                else:
+                    suggestion = (
+                        "prefix search_fields with '^' or '=' so an index "
+                        "can be used, or use a full-text search backend"
+                    )
+                advice.append(
+                    IndexAdvice(
+                        label, 'like_scan', attribute, contains, url, suggestion, plan
+                    )
+                )
+        elif scan and attribute == 'list_filter':
+            missing = tuple(name for name in fields if name not in indexed)
+            if missing:
+                advice.append(
+                    IndexAdvice(
+                        label,
+                        'seq_scan',
+                        attribute,
+                        missing,
+                        url,
+                        f"add {index_code(self.model_class, missing)}",
+                        plan,
+                    )
+                )
+        if 'filesort' in self.patterns and self.patterns['filesort'].search(plan):
+            # Keep the pk tie-break the changelist adds, so the index serves
+            # the whole ORDER BY.
+            pk = self.model_class._meta.pk.name
+            order = []
+            for name in ordering:
+                field = local_field(self.model_class, name)
+                if field is not None and '__' not in name:
+                    order.append(f"{'-' if name.startswith('-') else ''}{field}")
+            sorted_fields = [name for name in order if name.lstrip('-') != pk]
+            if sorted_fields and not index_exists(self.model_class, order):
+                advice.append(
+                    IndexAdvice(
+                        label,
+                        'filesort',
+                        attribute,
+                        tuple(name.lstrip('-') for name in sorted_fields),
+                        url,
+                        f"add {index_code(self.model_class, order)}",
+                        plan,
+                    )
+                )
+        return advice
+
+    def run(self) -> List[IndexAdvice]:
+        """Explain every query shape and return the advice, if the table is large."""
+        if not self.patterns or estimated_rows(self.model_class) < self.min_rows:
+            return []
+        advice = []
+        for attribute, fields, url in self.variants():
+            try:
+                plan, ordering = self.explain(url)
+            except DatabaseError:
+                continue
+            advice.extend(self.advise(attribute, fields, url, plan, ordering))
+        return advice
+
+
+def write_advice(advice: Iterable[IndexAdvice], path: str) -> str:
+    """Write ``advice`` as a JSON list for other tools to pick up."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump([entry._asdict() for entry in advice], f, indent=2)
+    return path
+
+
+def summarize_advice(advice: Iterable[IndexAdvice]) -> Dict[str, List[str]]:
+    """Group the suggestions by model, one line per distinct suggestion."""
+    summary: Dict[str, List[str]] = {}
+    for entry in advice:
+        lines = summary.setdefault(entry.model, [])
+        line = f"{entry.attribute} ({', '.join(entry.fields)}): {entry.suggestion}"
+        if line not in lines:
+            lines.append(line)
+    return summary
@@ -0,0 +1,478 @@
+import asyncio
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+import weakref
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Type
+from urllib.parse import urlencode, urlsplit
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin import helpers
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections, models
+from django.db.backends.signals import connection_created
+from django.test import RequestFactory
+from .async_checker import HttpConnection
+from .changelist import ChangelistUrl, changelist_path, get_model_admin
+from .registry import registry_urls
+from .settings import admin_tester_settings
+from .timing import percentile
+
+logger = logging.getLogger(__name__)
+
+# Database errors raised when a query gave up waiting for a lock.
+LOCK_ERROR = re.compile(
+    r'database (?:table )?is locked|deadlock|lock wait timeout|'
+    r'could not obtain lock|lock timeout',
+    re.I,
+)
+
+# Lock statistics polled during a run: sessions currently waiting on a lock
+# on PostgreSQL, InnoDB row lock waits since the server started on MySQL.
+LOCK_QUERIES = {
+    'postgresql': "SELECT count(*) FROM pg_locks WHERE NOT granted",
+    'mysql': "SHOW GLOBAL STATUS LIKE 'Innodb_row_lock_waits'",
+}
+CUMULATIVE_LOCK_COUNTERS = {'mysql'}
+
+CSRF_TOKEN = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+
+class LoadRequest(NamedTuple):
+    """One entry of the request mix; ``data`` holds the fields of a POST."""
+
+    item: ChangelistUrl
+    data: Optional[Tuple[Tuple[str, str], ...]] = None
+
+    @property
+    def method(self) -> str:
+        return 'GET' if self.data is None else 'POST'
+
+
+class LoadSample(NamedTuple):
+    """One request made by a simulated user, timed from the start of the run."""
+
+    user: int
+    label: str
+    start: float
+    latency: float
+    status: Optional[int]
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or self.status is None or self.status >= 400
+
+
+class LoadWindow(NamedTuple):
+    """Throughput, latency and errors over one interval of a load run."""
+
+    start: float
+    users: int
+    requests: int
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+    errors: int
+    error_rate: float
+    lock_waits: Optional[int]
+    lock_errors: int
+
+
+def ramp_schedule(users: int, ramp_up: float) -> List[float]:
+    """Return the second at which each user starts, evenly over ``ramp_up``."""
+    return [ramp_up * index / users for index in range(users)]
+
+
+def latency_percentiles(latencies: List[float]) -> Tuple[float, float, float]:
+    if not latencies:
+        return 0.0, 0.0, 0.0
+    return tuple(percentile(latencies, percent) for percent in (50, 95, 99))
+
+
+def load_mix(
+    model_classes: Iterable[Type[models.Model]],
+    user,
+    site=admin.site,
+    actions: Iterable[str] = (),
+    action_rows: int = 10,
+) -> List[LoadRequest]:
+    """Build the request mix replayed by every simulated user.
+
+    Every changelist, filter, sort, search and add form URL the tester
+    generates is requested, plus each action named in ``actions`` posted on
+    the first ``action_rows`` rows of its changelist. ``delete_selected``
+    only renders its confirmation page and deletes nothing.
+    """
+    model_classes = list(model_classes)
+    mix = [LoadRequest(item) for item in registry_urls(model_classes, user, site)]
+    request = RequestFactory().get('/')
+    request.user = user
+    for model_class in model_classes:
+        model_admin = get_model_admin(model_class, site)
+        names = [name for name in model_admin.get_actions(request) if name in actions]
+        if not names:
+            continue
+        pks = model_admin.get_queryset(request).values_list('pk', flat=True)
+        selected = [
+            (helpers.ACTION_CHECKBOX_NAME, str(pk)) for pk in pks[:action_rows]
+        ]
+        label = model_class._meta.label
+        path = changelist_path(model_class, site)
+        for name in names:
+            item = ChangelistUrl('action', f"{label} {name}", path, name, label)
+            mix.append(LoadRequest(item, (('action', name), ('index', '0'), *selected)))
+    return mix
+
+
+class LockMonitor:
+    """Watch the database for lock contention during a load run.
+
+    A background thread polls ``LOCK_QUERIES`` every ``interval`` seconds.
+    Queries failing on a lock, such as SQLite's "database is locked",
+    deadlocks and lock wait timeouts, are counted when they run in this
+    process, i.e. when the load goes to the live server. Use it as a
+    context manager around the run.
+    """
+
+    def __init__(self, using: str = DEFAULT_DB_ALIAS, interval: float = 0.5):
+        self.using = using
+        self.interval = interval
+        self.vendor = connections[using].vendor
+        self.waits: List[Tuple[float, int]] = []
+        self.errors: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._wrapped = weakref.WeakSet()
+
+    def __call__(self, execute, sql, params, many, context):
+        try:
+            return execute(sql, params, many, context)
+        except DatabaseError as e:
+            if LOCK_ERROR.search(str(e)):
+                with self._lock:
+                    self.errors.append((time.perf_counter(), f"{e}: {sql[:200]}"))
+            raise
+
+    def _wrap(self, connection, **kwargs):
+        if connection.alias == self.using and connection not in self._wrapped:
+            connection.execute_wrappers.append(self)
+            self._wrapped.add(connection)
+
+    def _poll(self):
+        query = LOCK_QUERIES[self.vendor]
+        try:
+            while True:
+                with connections[self.using].cursor() as cursor:
+                    cursor.execute(query)
+                    row = cursor.fetchone()
+                with self._lock:
+                    self.waits.append((time.perf_counter(), int(row[-1]) if row else 0))
+                if self._stop.wait(self.interval):
+                    break
+        except DatabaseError as e:
+            logger.warning("Could not read lock statistics: %s", e)
+        finally:
+            connections[self.using].close()
+
+    def __enter__(self):
+        connection_created.connect(self._wrap)
+        self._wrap(connections[self.using])
+        if self.vendor in LOCK_QUERIES:
+            self._thread = threading.Thread(target=self._poll, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        connection_created.disconnect(self._wrap)
+        for connection in list(self._wrapped):
+            if self in connection.execute_wrappers:
+                connection.execute_wrappers.remove(self)
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def between(self, start: float, end: float) -> Tuple[Optional[int], int]:
+        """Return the lock waits and lock errors seen from ``start`` to ``end``.
+
+        Lock waits are the most sessions seen waiting at once on PostgreSQL
+        and the row lock waits begun on MySQL; ``None`` elsewhere.
+        """
+        with self._lock:
+            errors = sum(start <= moment < end for moment, _ in self.errors)
+            if self.vendor not in LOCK_QUERIES:
+                return None, errors
+            inside = [value for moment, value in self.waits if start <= moment < end]
+            if self.vendor not in CUMULATIVE_LOCK_COUNTERS:
+                return max(inside, default=0), errors
+            before = [value for moment, value in self.waits if moment < start]
+            baseline = before[-1] if before else (self.waits[0][1] if self.waits else 0)
+        return (inside[-1] - baseline if inside else 0), errors
+
+
+class LoadReport:
+    """Collect the samples of a load run and summarise them per window."""
+
+    def __init__(
+        self,
+        schedule: Sequence[float],
+        duration: float,
+        interval: float,
+        started: float = 0.0,
+        monitor: Optional[LockMonitor] = None,
+    ):
+        self.schedule = list(schedule)
+        self.duration = duration
+        self.interval = interval
+        self.started = started
+        self.monitor = monitor
+        self.samples: List[LoadSample] = []
+
+    def add(self, sample: LoadSample):
+        self.samples.append(sample)
+
+    def window(self, start: float, end: float, samples: List[LoadSample]) -> LoadWindow:
+        latencies = [sample.latency for sample in samples if sample.status is not None]
+        errors = sum(sample.failed for sample in samples)
+        lock_waits, lock_errors = None, 0
+        if self.monitor is not None:
+            lock_waits, lock_errors = self.monitor.between(
+                self.started + start, self.started + end
+            )
+        return LoadWindow(
+            start,
+            sum(offset < end for offset in self.schedule),
+            len(samples),
+            len(samples) / (end - start) if end > start else 0.0,
+            *latency_percentiles(latencies),
+            errors,
+            errors / len(samples) if samples else 0.0,
+            lock_waits,
+            lock_errors,
+        )
+
+    def windows(self) -> List[LoadWindow]:
+        count = max(math.ceil(self.duration / self.interval), 1)
+        buckets = [[] for _ in range(count)]
+        for sample in self.samples:
+            buckets[min(int(sample.start // self.interval), count - 1)].append(sample)
+        windows = []
+        for number, bucket in enumerate(buckets):
+            start = number * self.interval
+            end = min(start + self.interval, self.duration)
+            windows.append(self.window(start, end, bucket))
+        return windows
+
+    def totals(self) -> LoadWindow:
+        return self.window(0.0, self.duration, self.samples)
+
+    @property
+    def error_rate(self) -> float:
+        return self.totals().error_rate
+
+    def lock_errors(self) -> List[str]:
+        if self.monitor is None:
+            return []
+        return [message for _, message in self.monitor.errors]
+
+    def by_label(self) -> Dict[str, dict]:
+        """Return the request count, p95 latency and errors per request."""
+        grouped = defaultdict(list)
+        for sample in self.samples:
+            grouped[sample.label].append(sample)
+        return {
+            label: {
+                'count': len(samples),
+                'p95': latency_percentiles(
+                    [sample.latency for sample in samples if sample.status is not None]
+                )[1],
+                'errors': sum(sample.failed for sample in samples),
+            }
+            for label, samples in grouped.items()
+        }
+
+    def as_dict(self) -> dict:
+        return {
+            'users': len(self.schedule),
+            'duration': self.duration,
+            'interval': self.interval,
+            'totals': self.totals()._asdict(),
+            'windows': [window._asdict() for window in self.windows()],
+            'requests': self.by_label(),
+            'lock_errors': self.lock_errors(),
+        }
+
+    def write_json(self, path: str) -> str:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(), f, indent=2)
+        return path
+
+    def format_summary(self) -> str:
+        lines = [
+            f"{'window':>8} {'users':>5} {'req/s':>8} {'p50':>8} {'p95':>8} "
+            f"{'p99':>8} {'errors':>7} {'locks':>6}"
+        ]
+        rows = [(f"{window.start:g}s", window) for window in self.windows()]
+        rows.append(('total', self.totals()))
+        for name, window in rows:
+            locks = window.lock_errors + (window.lock_waits or 0)
+            lines.append(
+                f"{name:>8} {window.users:>5} {window.throughput:>8.1f} "
+                f"{window.p50:>8.3f} {window.p95:>8.3f} {window.p99:>8.3f} "
+                f"{window.error_rate:>7.1%} {locks:>6}"
+            )
+        return '\n'.join(lines)
+
+
+class LoadTester:
+    """Replay an admin request mix with concurrent authenticated users.
+
+    Each simulated user has its own session from ``session_keys`` and its
+    own keep-alive connection from the async client, and cycles through
+    ``requests`` from its own starting point so users spread over the mix.
+    Users start one by one over ``ramp_up`` seconds (``LOAD_RAMP_UP``) and
+    all stop ``duration`` seconds (``LOAD_DURATION``) after the run began,
+    pausing ``think_time`` seconds between requests. Actions post the CSRF
+    token read from the changelist, as a browser would.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        session_keys: Sequence[str],
+        requests: Sequence[LoadRequest],
+        ramp_up: Optional[float] = None,
+        duration: Optional[float] = None,
+        interval: Optional[float] = None,
+        think_time: Optional[float] = None,
+        timeout: Optional[float] = None,
+        monitor: Optional[LockMonitor] = None,
+    ):
+        parts = urlsplit(base_url)
+        self.base_url = f"{parts.scheme}://{parts.netloc}"
+        self.use_ssl = parts.scheme == 'https'
+        self.host = parts.hostname
+        self.port = parts.port or (443 if self.use_ssl else 80)
+        self.prefix = parts.path.rstrip('/')
+        self.session_keys = list(session_keys)
+        self.requests = list(requests)
+        if ramp_up is None:
+            ramp_up = admin_tester_settings.LOAD_RAMP_UP
+        self.schedule = ramp_schedule(len(self.session_keys), ramp_up)
+        self.duration = duration or admin_tester_settings.LOAD_DURATION
+        self.interval = interval or admin_tester_settings.LOAD_INTERVAL
+        if think_time is None:
+            think_time = admin_tester_settings.LOAD_THINK_TIME
+        self.think_time = think_time
+        self.timeout = timeout or admin_tester_settings.WAIT_TIMEOUT
+        self.monitor = monitor
+
+    async def send(
+        self,
+        connection: HttpConnection,
+        request: LoadRequest,
+        headers: Dict[str, str],
+        csrf_token: str = '',
+    ) -> Tuple[Optional[int], Dict[str, str], bytes, Optional[str]]:
+        path = self.prefix + request.item.url
+        body = b''
+        if request.data is not None:
+            body = urlencode(
+                [*request.data, ('csrfmiddlewaretoken', csrf_token)]
+            ).encode()
+            headers = {
+                **headers,
+                'Content-Type': 'application/x-www-form-urlencoded',
+                'Referer': self.base_url + path,
+            }
+        try:
+            status, response_headers, content = await asyncio.wait_for(
+                connection.request(request.method, path, headers, body), self.timeout
+            )
+        except Exception as e:
+            connection.close()
+            return None, {}, b'', str(e) or repr(e)
+        return status, response_headers, content, None
+
+    async def csrf_token(
+        self, connection: HttpConnection, request: LoadRequest, headers: Dict[str, str]
+    ) -> Optional[str]:
+        """Load the changelist of an action and keep its CSRF cookie and token.
+
+        Returns ``None`` when the page has no token, e.g. because it failed to
+        load, so the next action asks again.
+        """
+        status, response_headers, content, _ = await self.send(
+            connection, LoadRequest(request.item), headers
+        )
+        match = CSRF_TOKEN.search(content.decode('utf-8', 'replace'))
+        if status != 200 or not match:
+            return None
+        cookie_name = settings.CSRF_COOKIE_NAME
+        for cookie in response_headers.get('set-cookie', '').splitlines():
+            name, _, value = cookie.split(';')[0].partition('=')
+            if name.strip() == cookie_name:
+                headers['Cookie'] += f"; {cookie_name}={value.strip()}"
+        return match.group(1)
+
+    async def user(self, index: int, report: LoadReport, started: float):
+        await asyncio.sleep(self.schedule[index])
+        connection = HttpConnection(self.host, self.port, self.use_ssl)
+        headers = {
+            'Cookie': f"{settings.SESSION_COOKIE_NAME}={self.session_keys[index]}",
+            'Connection': 'keep-alive',
+        }
+        csrf_token = None
+        position = index * len(self.requests) // len(self.session_keys)
+        try:
+            while time.perf_counter() - started < self.duration:
+                request = self.requests[position % len(self.requests)]
+                position += 1
+                if request.data is not None and csrf_token is None:
+                    csrf_token = await self.csrf_token(connection, request, headers)
+                start = time.perf_counter()
+                status, _, _, error = await self.send(
+                    connection, request, headers, csrf_token or ''
+                )
+                report.add(
+                    LoadSample(
+                        index,
+                        request.item.label,
+                        start - started,
+                        time.perf_counter() - start,
+                        status,
+                        error,
+                    )
+                )
+                if self.think_time:
+                    await asyncio.sleep(self.think_time)
+        finally:
+            connection.close()
+
+    async def run_users(self, report: LoadReport):
+        started = report.started = time.perf_counter()
+        await asyncio.gather(
+            *(self.user(index, report, started) for index in range(len(self.schedule)))
+        )
+
+    def run(self) -> LoadReport:
+        """Run the load and return its report."""
+        report = LoadReport(self.schedule, self.duration, self.interval)
+        if not self.requests or not self.session_keys:
+            return report
+        if self.monitor is None:
+            asyncio.run(self.run_users(report))
+            return report
+        report.monitor = self.monitor
+        with self.monitor:
+            asyncio.run(self.run_users(report))
+        return report
@@ -0,0 +1,103 @@
+import json
+import os
+from django.apps import apps
+from django.contrib import admin
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django_admin_tester.benchmarks import (
+    AdminBenchmark,
+    compare,
+    load_baseline,
+    medians,
+    save_baseline,
+)
+from django_admin_tester.settings import admin_tester_settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark every registered ModelAdmin on a throwaway test database and "
+        "compare the results with the stored baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models',
+            nargs='*',
+            help="Limit the run to these models (app_label.ModelName).",
+        )
+        parser.add_argument(
+            '--sizes',
+            nargs='+',
+            type=int,
+            default=[0, 1000, 10000],
+            help="Dataset sizes to seed each model with.",
+        )
+        parser.add_argument('--repeats', type=int, default=5)
+        parser.add_argument(
+            '--baseline',
+            default=os.path.join(
+                admin_tester_settings.REPORT_DIR, 'benchmark-baseline.json'
+            ),
+        )
+        parser.add_argument('--output', help="Also write this run's results here.")
+        parser.add_argument(
+            '--update-baseline',
+            action='store_true',
+            help="Store this run as the new baseline instead of comparing.",
+        )
+        parser.add_argument('--tolerance', type=float, default=0.2)
+        parser.add_argument('--sigma', type=float, default=3.0)
+        parser.add_argument('--min-delta', type=float, default=0.005)
+
+    def handle(self, *args, **options):
+        model_classes = [apps.get_model(label) for label in options['models']]
+        for model_class in model_classes:
+            if model_class not in admin.site._registry:
+                raise CommandError(f"{model_class._meta.label} has no ModelAdmin")
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            report = AdminBenchmark(
+                sizes=options['sizes'],
+                repeats=options['repeats'],
+                model_classes=model_classes or None,
+            ).run()
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        for key, scenarios in medians(report).items():
+            self.stdout.write(key)
+            for name, median in scenarios.items():
+                self.stdout.write(f"  {name:<50} {median * 1000:>9.1f}ms")
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+
+        if options['update_baseline']:
+            save_baseline(report, options['baseline'])
+            self.stdout.write(f"Baseline written to {options['baseline']}")
+            return
+
+        baseline = load_baseline(options['baseline'])
+        if baseline is None:
+            self.stdout.write("No baseline found; run with --update-baseline first")
+            return
+
+        regressions = compare(
+            baseline,
+            report,
+            tolerance=options['tolerance'],
+            sigma=options['sigma'],
+            min_delta=options['min_delta'],
+        )
+        if regressions:
+            raise CommandError(
+                "Admin performance regressions:\n"
+                + "\n".join(f"  {name}: {detail}" for name, detail in regressions)
+            )
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline"))
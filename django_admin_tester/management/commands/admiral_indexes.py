@@ -0,0 +1,55 @@
+from django.apps import apps
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django_admin_tester.indexes import IndexAdvisor, summarize_advice, write_advice
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN the filter, sort and search queries of every registered "
+        "ModelAdmin on the configured database and suggest missing indexes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models',
+            nargs='*',
+            help="Limit the analysis to these models (app_label.ModelName).",
+        )
+        parser.add_argument(
+            '--min-rows',
+            type=int,
+            help="Skip tables with fewer rows (default: INDEX_ADVICE_MIN_ROWS).",
+        )
+        parser.add_argument('--json', help="Also write the advice to this file.")
+        parser.add_argument(
+            '--fail',
+            action='store_true',
+            help="Exit with an error when there is any advice.",
+        )
+
+    def handle(self, *args, **options):
+        model_classes = [apps.get_model(label) for label in options['models']]
+        for model_class in model_classes:
+            if model_class not in admin.site._registry:
+                raise CommandError(f"{model_class._meta.label} has no ModelAdmin")
+        # An unsaved superuser sees every admin without touching the database.
+        user = get_user_model()(is_active=True, is_staff=True, is_superuser=True)
+
+        advice = []
+        for model_class in model_classes or list(admin.site._registry):
+            advisor = IndexAdvisor(model_class, user, min_rows=options['min_rows'])
+            advice.extend(advisor.run())
+
+        for model, lines in summarize_advice(advice).items():
+            self.stdout.write(model)
+            for line in lines:
+                self.stdout.write(f"    {line}")
+        if options['json']:
+            path = write_advice(advice, options['json'])
+            self.stdout.write(f"Advice written to {path}")
+        if options['fail'] and advice:
+            raise CommandError(f"{len(advice)} queries could use an index")
+        if not advice:
+            self.stdout.write("No index suggestions")
@@ -0,0 +1,100 @@
+from django.apps import apps
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django_admin_tester.auth import create_session, delete_session
+from django_admin_tester.load import LoadTester, LockMonitor, load_mix
+from django_admin_tester.settings import admin_tester_settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay the admin URL mix with concurrent users against a running "
+        "server and report throughput, latency and errors over time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('base_url', help="URL of the server, e.g. http://host:8000")
+        parser.add_argument(
+            'models',
+            nargs='*',
+            help="Limit the mix to these models (app_label.ModelName).",
+        )
+        parser.add_argument(
+            '--username',
+            default=admin_tester_settings.DEFAULT_ADMIN_USERNAME,
+            help="Existing staff user every simulated user logs in as.",
+        )
+        parser.add_argument('--users', type=int, help="Concurrent users.")
+        parser.add_argument('--ramp-up', type=float, help="Seconds to start them.")
+        parser.add_argument('--duration', type=float, help="Seconds to run.")
+        parser.add_argument('--interval', type=float, help="Seconds per window.")
+        parser.add_argument('--think-time', type=float)
+        parser.add_argument(
+            '--action',
+            action='append',
+            dest='actions',
+            help="Also post this admin action; it changes the data it selects.",
+        )
+        parser.add_argument('--json', help="Also write the report to this file.")
+        parser.add_argument(
+            '--max-error-rate',
+            type=float,
+            default=admin_tester_settings.LOAD_MAX_ERROR_RATE,
+        )
+
+    def handle(self, *args, **options):
+        model_classes = [apps.get_model(label) for label in options['models']]
+        for model_class in model_classes:
+            if model_class not in admin.site._registry:
+                raise CommandError(f"{model_class._meta.label} has no ModelAdmin")
+        User = get_user_model()
+        user = User._default_manager.filter(
+            **{User.USERNAME_FIELD: options['username']}, is_staff=True
+        ).first()
+        if user is None:
+            raise CommandError(f"No staff user named {options['username']!r}")
+
+        if options['actions'] is None:
+            actions = admin_tester_settings.LOAD_ACTIONS
+        else:
+            actions = options['actions']
+        model_classes = model_classes or list(admin.site._registry)
+        mix = load_mix(model_classes, user, actions=actions)
+        users = options['users'] or admin_tester_settings.LOAD_USERS
+        sessions = [create_session(user) for _ in range(users)]
+        try:
+            report = LoadTester(
+                options['base_url'],
+                sessions,
+                mix,
+                ramp_up=options['ramp_up'],
+                duration=options['duration'],
+                interval=options['interval'],
+                think_time=options['think_time'],
+                monitor=LockMonitor(),
+            ).run()
+        finally:
+            for session_key in sessions:
+                delete_session(session_key)
+
+        self.stdout.write(report.format_summary())
+        slowest = sorted(
+            report.by_label().items(), key=lambda entry: entry[1]['p95'], reverse=True
+        )
+        self.stdout.write("Slowest requests (p95):")
+        for label, stats in slowest[:10]:
+            self.stdout.write(
+                f"  {label[:60]:<60} {stats['p95']:>8.3f} "
+                f"{stats['count']:>6} requests, {stats['errors']} errors"
+            )
+        for message in report.lock_errors()[:5]:
+            self.stdout.write(f"Lock error: {message}")
+        if options['json']:
+            path = report.write_json(options['json'])
+            self.stdout.write(f"Report written to {path}")
+        if report.error_rate > options['max_error_rate']:
+            raise CommandError(
+                f"{report.error_rate:.1%} of requests failed, "
+                f"over {options['max_error_rate']:.1%}"
+            )
@@ -0,0 +1,75 @@
+import json
+import os
+from django.core.management.base import BaseCommand, CommandError
+from django_admin_tester.fingerprint import ResultCache
+from django_admin_tester.settings import admin_tester_settings
+from django_admin_tester.sharding import (
+    merge_artifacts,
+    merge_results,
+    merge_timing_reports,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Merge the timing reports, check results, result caches and failure "
+        "artifacts of sharded runs (--shard i/N) into one report."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'report_dirs',
+            nargs='+',
+            help="The REPORT_DIR of every shard.",
+        )
+        parser.add_argument('--output', default=admin_tester_settings.REPORT_DIR)
+        parser.add_argument(
+            '--results',
+            nargs='*',
+            default=[],
+            help="Result cache files of the shards, merged into RESULT_CACHE_PATH.",
+        )
+        parser.add_argument(
+            '--artifacts',
+            nargs='*',
+            default=[],
+            help="Failure artifact directories of the shards.",
+        )
+        parser.add_argument(
+            '--artifact-output',
+            default=admin_tester_settings.SCREENSHOT_DIR or 'screenshots',
+        )
+
+    def handle(self, *args, **options):
+        for directory in options['report_dirs'] + options['artifacts']:
+            if not os.path.isdir(directory):
+                raise CommandError(f"{directory} is not a directory")
+
+        reports = merge_timing_reports(options['report_dirs'])
+        for name, report in sorted(reports.items()):
+            path = report.write_json(
+                os.path.join(options['output'], f"{name}-timings.json")
+            )
+            self.stdout.write(
+                f"{name}: {len(report.interactions)} interactions, written to {path}"
+            )
+            if report.interactions:
+                self.stdout.write(report.format_summary())
+
+        results = merge_results(options['report_dirs'], options['output'])
+        for name, paths in sorted(results.items()):
+            self.stdout.write(f"{name}: check results written to {', '.join(paths)}")
+
+        if options['results']:
+            cache = ResultCache()
+            for path in options['results']:
+                with open(path) as f:
+                    cache.merge(json.load(f))
+            cache.save()
+            self.stdout.write(f"Results merged into {cache.path}")
+
+        if options['artifacts']:
+            copied = merge_artifacts(options['artifacts'], options['artifact_output'])
+            self.stdout.write(
+                f"{copied} artifacts copied to {options['artifact_output']}"
+            )
@@ -0,0 +1,71 @@
+import itertools
+from django.core.management.base import BaseCommand, CommandError
+from django_admin_tester.devtools import describe_metrics
+from django_admin_tester.reporting import OUTCOMES, read_results
+
+
+class Command(BaseCommand):
+    help = (
+        "List the check results of admin tester runs (the *-results.jsonl files "
+        "in REPORT_DIR), filtered by check kind, model or outcome."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help="JSON Lines result files.")
+        parser.add_argument(
+            '--kind',
+            action='append',
+            help="Only show these check kinds, such as filter or sort.",
+        )
+        parser.add_argument(
+            '--model',
+            action='append',
+            help="Only show these models (app_label.ModelName).",
+        )
+        parser.add_argument('--outcome', action='append', choices=OUTCOMES)
+        parser.add_argument(
+            '--failed', action='store_true', help="Only show failed checks."
+        )
+        parser.add_argument(
+            '--slowest',
+            type=int,
+            metavar='N',
+            help="Show the N slowest checks, slowest first.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            records = [
+                record
+                for record in itertools.chain.from_iterable(
+                    map(read_results, options['paths'])
+                )
+                if (not options['kind'] or record.kind in options['kind'])
+                and (not options['model'] or record.model in options['model'])
+                and (not options['outcome'] or record.outcome in options['outcome'])
+                and (not options['failed'] or record.failed)
+            ]
+        except OSError as e:
+            raise CommandError(str(e))
+
+        if options['slowest']:
+            records = sorted(
+                (record for record in records if record.duration is not None),
+                key=lambda record: record.duration,
+                reverse=True,
+            )[: options['slowest']]
+
+        for record in records:
+            duration = '' if record.duration is None else f"{record.duration:.3f}s"
+            queries = '' if record.queries is None else f"{record.queries}q"
+            self.stdout.write(
+                f"{record.outcome:<7} {duration:>9} {queries:>5} {record.model} "
+                f"{record.kind}: {record.label or record.target} {record.url}"
+            )
+            if record.browser:
+                self.stdout.write(f"    browser: {describe_metrics(record.browser)}")
+            if record.failed:
+                for line in [*record.message.splitlines(), *record.artifacts]:
+                    self.stdout.write(f"    {line}")
+        failed = sum(record.failed for record in records)
+        self.stdout.write(f"{len(records)} checks, {failed} failed")
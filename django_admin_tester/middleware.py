@@ -0,0 +1,30 @@
+import time
+from django.db import connection
+from .queries import QueryRecorder
+from .timing import ServerTiming, server_timings
+
+
+class ServerTimingMiddleware:
+    """Record how long each request took on the server and which queries ran.
+
+    Measurements are published to ``timing.server_timings`` so the test
+    thread can attach them to the interaction that caused the request.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+        server_timings.add(
+            request.get_full_path(),
+            ServerTiming(
+                time.perf_counter() - start,
+                len(recorder.queries),
+                tuple(query.sql for query in recorder.queries),
+            ),
+        )
+        return response
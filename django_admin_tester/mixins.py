@@ -13,10 +13,10 @@ class AdminTestMixin:
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        cls.selenium = BrowserFactory.create_browser(cls.browser_type)
+        cls.selenium = BrowserFactory.acquire_browser(cls.browser_type)
 
     @classmethod
     def tearDownClass(cls):
         if hasattr(cls, 'selenium'):
-            cls.selenium.quit()
+            BrowserFactory.release_browser(cls.selenium)
         super().tearDownClass()
@@ -0,0 +1,181 @@
+import re
+import statistics
+import time
+from typing import Callable, List, NamedTuple, Optional, Type
+from django.contrib import admin
+from django.contrib.admin.views.main import ALL_VAR, PAGE_VAR
+from django.db import connection, models
+from django.test import Client
+from .changelist import ChangelistUrl, changelist_path, get_changelist
+from .queries import QueryRecorder
+from .settings import admin_tester_settings
+
+_COUNT = re.compile(r'\bCOUNT\s*\(', re.I)
+
+# Deep pages must be at least this much slower than the first page to be
+# flagged, so small absolute differences on tiny tables are ignored.
+DEEP_PAGE_MIN_DELTA = 0.02
+
+
+class PageProbe(NamedTuple):
+    """A changelist page to measure and the row offset it starts at."""
+
+    item: ChangelistUrl
+    offset: int
+
+
+class PageSample(NamedTuple):
+    """How a changelist page performed."""
+
+    probe: PageProbe
+    duration: float
+    queries: int
+    count_queries: int
+    count_duration: float
+
+
+def pagination_probes(
+    model_class: Type[models.Model], user, site=admin.site
+) -> List[PageProbe]:
+    """Return the first, middle and last changelist pages and "Show all".
+
+    Pages that coincide on short changelists are only listed once; "Show
+    all" is only listed when ``list_max_show_all`` allows it.
+    """
+    path = changelist_path(model_class, site)
+    cl = get_changelist(model_class, user, site)
+    model_label = model_class._meta.label
+    per_page = cl.list_per_page
+    # The first page index is 0 on Django < 4.0 and 1 afterwards.
+    first_page = cl.page_num
+    last = cl.paginator.num_pages
+    probes = []
+    for label, number in (('first', 1), ('middle', (last + 1) // 2), ('last', last)):
+        offset = (number - 1) * per_page
+        if any(probe.offset == offset for probe in probes):
+            continue
+        query = cl.get_query_string({PAGE_VAR: number - 1 + first_page})
+        item = ChangelistUrl(
+            'pagination', label, path + query, f"page {number}", model_label
+        )
+        probes.append(PageProbe(item, offset))
+    if cl.multi_page and cl.can_show_all:
+        query = cl.get_query_string({ALL_VAR: ''})
+        item = ChangelistUrl('pagination', 'show all', path + query, 'all', model_label)
+        probes.append(PageProbe(item, 0))
+    return probes
+
+
+class PaginationChecker:
+    """Measure changelist pages at increasing offsets with the test client.
+
+    Each page is requested ``repeats`` times after one warm-up request and
+    its median render time is kept. Admins fail when the last page is more
+    than ``DEEP_PAGE_RATIO`` times slower than the first, which points at
+    ``OFFSET`` scans growing with the page number, or when the ``COUNT``
+    queries of a page (the paginator's count, plus the unfiltered one from
+    ``show_full_result_count``) take over ``COUNT_QUERY_THRESHOLD`` seconds.
+    ``on_result(item, duration, message)`` is called for every page.
+    """
+
+    def __init__(
+        self,
+        model_class: Type[models.Model],
+        user,
+        site=admin.site,
+        client: Optional[Client] = None,
+        repeats: Optional[int] = None,
+        on_result: Optional[Callable[..., None]] = None,
+    ):
+        self.model_class = model_class
+        self.user = user
+        self.site = site
+        if client is None:
+            client = Client()
+            client.force_login(user)
+        self.client = client
+        self.repeats = repeats or admin_tester_settings.PAGINATION_REPEATS
+        self.on_result = on_result
+        self.samples: List[PageSample] = []
+
+    def measure(self, probe: PageProbe) -> PageSample:
+        durations = []
+        for attempt in range(self.repeats + 1):
+            recorder = QueryRecorder()
+            with connection.execute_wrapper(recorder):
+                start = time.perf_counter()
+                response = self.client.get(probe.item.url)
+                duration = time.perf_counter() - start
+            if response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code}")
+            if attempt:
+                durations.append(duration)
+        counts = [query for query in recorder.queries if _COUNT.search(query.sql)]
+        return PageSample(
+            probe,
+            statistics.median(durations),
+            len(recorder.queries),
+            len(counts),
+            sum(query.duration for query in counts),
+        )
+
+    def count_problem(self, sample: PageSample) -> Optional[str]:
+        threshold = admin_tester_settings.COUNT_QUERY_THRESHOLD
+        if not sample.count_queries or sample.count_duration < threshold:
+            return None
+        model_admin = self.site._registry[self.model_class]
+        hint = (
+            "set show_full_result_count = False"
+            if model_admin.show_full_result_count
+            else "use an estimated count in the paginator"
+        )
+        return (
+            f"Expensive COUNT queries on {sample.probe.item.label} page of "
+            f"{self.model_class._meta.label}: {sample.count_queries} queries took "
+            f"{sample.count_duration * 1000:.1f}ms ({hint})"
+        )
+
+    def deep_page_problem(self) -> Optional[str]:
+        pages = [
+            sample
+            for sample in self.samples
+            if sample.probe.item.label in ('first', 'middle', 'last')
+        ]
+        if len(pages) < 2:
+            return None
+        first, last = pages[0], pages[-1]
+        ratio = admin_tester_settings.DEEP_PAGE_RATIO
+        if (
+            last.duration < first.duration * ratio
+            or last.duration - first.duration < DEEP_PAGE_MIN_DELTA
+        ):
+            return None
+        slope = (last.duration - first.duration) / last.probe.offset * 1000
+        return (
+            f"Deep pages of {self.model_class._meta.label} slow down with the "
+            f"offset: {last.probe.item.target} (offset {last.probe.offset}) took "
+            f"{last.duration * 1000:.1f}ms vs {first.duration * 1000:.1f}ms for "
+            f"page 1, +{slope * 1000:.2f}ms per 1000 rows"
+        )
+
+    def run(self) -> List[str]:
+        """Measure every probed page and return the problems found."""
+        problems = []
+        for probe in pagination_probes(self.model_class, self.user, self.site):
+            try:
+                sample = self.measure(probe)
+            except Exception as e:
+                message = f"Failed to load pagination: {probe.item.label} - {str(e)}"
+                duration = None
+            else:
+                self.samples.append(sample)
+                message = self.count_problem(sample)
+                duration = sample.duration
+            if message:
+                problems.append(message)
+            if self.on_result is not None:
+                self.on_result(probe.item, duration, message)
+        deep = self.deep_page_problem()
+        if deep:
+            problems.append(deep)
+        return problems
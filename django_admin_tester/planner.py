@@ -0,0 +1,196 @@
+import itertools
+import logging
+import math
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode
+from .exceptions import AdminTesterConfigError
+from .settings import admin_tester_settings
+
+logger = logging.getLogger(__name__)
+
+COMBINATION_MODES = ('single', 'pairwise', 'full')
+
+Params = Tuple[Tuple[str, str], ...]
+
+
+class FilterChoice(NamedTuple):
+    """One option of a list filter and the query parameters it applies."""
+
+    title: str
+    display: str
+    params: Params
+
+
+class FilterCombination(NamedTuple):
+    """A set of filter choices applied together, as a normalized query string."""
+
+    choices: Tuple[FilterChoice, ...]
+    query: str
+
+    @property
+    def label(self) -> str:
+        return ' + '.join(
+            f"{choice.title} - {choice.display}" for choice in self.choices
+        )
+
+    @property
+    def target(self) -> str:
+        return ' + '.join(choice.title for choice in self.choices)
+
+
+def parse_query(query: str) -> Params:
+    """Return the parameters of ``query`` as sorted ``(name, value)`` pairs."""
+    return tuple(sorted(set(parse_qsl(query.lstrip('?'), keep_blank_values=True))))
+
+
+def normalize_query(params: Iterable[Tuple[str, str]]) -> str:
+    """Build a canonical query string, so equal filters give equal URLs."""
+    pairs = sorted(set(params))
+    return f"?{urlencode(pairs)}" if pairs else ''
+
+
+def matches_filters(spec, test_filters: Optional[Iterable[str]]) -> bool:
+    """Whether a filter spec is selected by ``test_filters`` (all if empty)."""
+    if not test_filters:
+        return True
+    names = {
+        str(spec.title),
+        getattr(spec, 'field_path', None),
+        getattr(spec, 'parameter_name', None),
+    }
+    return bool(names.intersection(test_filters))
+
+
+def filter_choices(cl, test_filters=None) -> List[List[FilterChoice]]:
+    """Collect the choices of every selected filter on an unfiltered changelist.
+
+    "All" choices, which apply no parameters, are left out; leaving a filter
+    out of a combination has the same effect.
+    """
+    groups = []
+    for spec in cl.filter_specs:
+        if not matches_filters(spec, test_filters):
+            continue
+        choices = []
+        seen = set()
+        for choice in spec.choices(cl):
+            params = parse_query(choice['query_string'])
+            if params and params not in seen:
+                seen.add(params)
+                choices.append(
+                    FilterChoice(str(spec.title), str(choice['display']), params)
+                )
+        if choices:
+            groups.append(choices)
+    return groups
+
+
+def compatible(first: FilterChoice, second: FilterChoice) -> bool:
+    """Whether two choices can be applied together without a clashing parameter."""
+    values = dict(first.params)
+    return all(values.get(name, value) == value for name, value in second.params)
+
+
+class FilterPlanner:
+    """Plan which filter combinations a changelist is checked with.
+
+    ``single`` applies each choice on its own. ``pairwise`` greedily builds
+    URLs until every pair of choices from two different filters has been
+    applied together at least once. ``full`` takes the whole cross product
+    while it stays within ``limit`` URLs and falls back to pairwise beyond it.
+    Pairwise plans are cut off at ``limit`` URLs as well.
+    """
+
+    def __init__(
+        self,
+        groups: Sequence[Sequence[FilterChoice]],
+        mode: Optional[str] = None,
+        limit: Optional[int] = None,
+    ):
+        self.groups = [list(group) for group in groups]
+        self.mode = mode or admin_tester_settings.FILTER_COMBINATIONS
+        if self.mode not in COMBINATION_MODES:
+            raise AdminTesterConfigError(
+                f"Unknown filter combination mode {self.mode!r}, "
+                f"expected one of {', '.join(COMBINATION_MODES)}"
+            )
+        self.limit = limit or admin_tester_settings.FILTER_COMBINATION_LIMIT
+
+    def single(self) -> Iterator[Tuple[FilterChoice, ...]]:
+        for group in self.groups:
+            for choice in group:
+                yield (choice,)
+
+    def pairwise(self) -> Iterator[Tuple[FilterChoice, ...]]:
+        groups = self.groups
+        if len(groups) < 2:
+            yield from self.single()
+            return
+        pending = [
+            (i, a, j, b)
+            for i, j in itertools.combinations(range(len(groups)), 2)
+            for a, first in enumerate(groups[i])
+            for b, second in enumerate(groups[j])
+            if compatible(first, second)
+        ]
+        uncovered = set(pending)
+
+        def pair(k, c, m, d):
+            return (k, c, m, d) if k < m else (m, d, k, c)
+
+        for i, a, j, b in pending:
+            if (i, a, j, b) not in uncovered:
+                continue
+            row = {i: a, j: b}
+            for k, group in enumerate(groups):
+                if k in row:
+                    continue
+                candidates = [
+                    c
+                    for c, choice in enumerate(group)
+                    if all(compatible(choice, groups[m][d]) for m, d in row.items())
+                ]
+                if candidates:
+                    row[k] = max(
+                        candidates,
+                        key=lambda c: sum(
+                            pair(k, c, m, d) in uncovered for m, d in row.items()
+                        ),
+                    )
+            for (k, c), (m, d) in itertools.combinations(sorted(row.items()), 2):
+                uncovered.discard((k, c, m, d))
+            yield tuple(groups[k][c] for k, c in sorted(row.items()))
+
+    def full(self) -> Iterator[Tuple[FilterChoice, ...]]:
+        total = math.prod(len(group) for group in self.groups)
+        if total > self.limit:
+            logger.warning(
+                "%d filter combinations exceed the limit of %d, testing pairs",
+                total,
+                self.limit,
+            )
+            yield from self.pairwise()
+            return
+        for row in itertools.product(*self.groups):
+            if all(compatible(a, b) for a, b in itertools.combinations(row, 2)):
+                yield row
+
+    def plan(self) -> List[FilterCombination]:
+        """Return the planned combinations, each with a distinct query string."""
+        combinations = []
+        seen = set()
+        for row in getattr(self, self.mode)():
+            query = normalize_query(
+                itertools.chain.from_iterable(choice.params for choice in row)
+            )
+            if not query or query in seen:
+                continue
+            if self.mode != 'single' and len(combinations) >= self.limit:
+                logger.warning(
+                    "Stopped planning filter combinations at the limit of %d",
+                    self.limit,
+                )
+                break
+            seen.add(query)
+            combinations.append(FilterCombination(row, query))
+        return combinations
@@ -0,0 +1,124 @@
+import atexit
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Hashable, List, Optional, Tuple
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from .browsers import BrowserFactory
+from .settings import admin_tester_settings
+
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class BrowserPool:
+    """Process-wide pool of WebDriver sessions keyed by browser type and options.
+
+    Released browsers have their cookies and storage wiped and wait in the
+    pool until the next checkout with the same key. Browsers that fail a
+    health check are replaced, and browsers idle for longer than
+    ``POOL_IDLE_TIMEOUT`` seconds are quit.
+    """
+
+    def __init__(self, idle_timeout: Optional[float] = None):
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[Hashable, List[Tuple[float, WebDriver]]] = defaultdict(list)
+        self._checked_out: Dict[int, Tuple[Hashable, WebDriver]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(browser_type: str, options: dict) -> Hashable:
+        return browser_type.lower(), repr(sorted(options.items()))
+
+    def acquire(self, browser_type: Optional[str] = None, **kwargs) -> WebDriver:
+        """Check a browser out of the pool, starting one if none is idle."""
+        browser_type = browser_type or admin_tester_settings.BROWSER
+        profile = kwargs.get('profile') or admin_tester_settings.BROWSER_PROFILE
+        kwargs['profile'] = profile
+        key = self.make_key(browser_type, kwargs)
+        self.evict_idle()
+
+        while True:
+            with self._lock:
+                idle = self._idle[key]
+                driver = idle.pop()[1] if idle else None
+            if driver is None:
+                driver = BrowserFactory.create_browser(browser_type, **kwargs)
+                break
+            if self.is_healthy(driver):
+                break
+            self._quit(driver)
+
+        with self._lock:
+            self._checked_out[id(driver)] = (key, driver)
+        return driver
+
+    def release(self, driver: WebDriver):
+        """Return a browser to the pool after wiping its session state."""
+        with self._lock:
+            key, _ = self._checked_out.pop(id(driver), (None, None))
+        if key is None:
+            self._quit(driver)
+            return
+        try:
+            self.reset(driver)
+        except WebDriverException:
+            self._quit(driver)
+            return
+        with self._lock:
+            self._idle[key].append((time.monotonic(), driver))
+
+    @staticmethod
+    def reset(driver: WebDriver):
+        """Clear cookies, web storage and waits left behind by the last user."""
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        driver.delete_all_cookies()
+        if hasattr(driver, 'execute_cdp_cmd'):
+            # Clears cookies of every domain, not only the current one.
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.implicitly_wait(0)
+        driver.get('about:blank')
+
+    @staticmethod
+    def is_healthy(driver: WebDriver) -> bool:
+        try:
+            driver.current_window_handle
+        except WebDriverException:
+            return False
+        return True
+
+    def evict_idle(self):
+        """Quit browsers that have been idle for longer than the idle timeout."""
+        timeout = self.idle_timeout or admin_tester_settings.POOL_IDLE_TIMEOUT
+        deadline = time.monotonic() - timeout
+        expired = []
+        with self._lock:
+            for key, idle in self._idle.items():
+                expired.extend(driver for since, driver in idle if since < deadline)
+                idle[:] = [entry for entry in idle if entry[0] >= deadline]
+        for driver in expired:
+            self._quit(driver)
+
+    def shutdown(self):
+        """Quit every browser owned by the pool."""
+        with self._lock:
+            drivers = [driver for idle in self._idle.values() for _, driver in idle]
+            drivers += [driver for _, driver in self._checked_out.values()]
+            self._idle.clear()
+            self._checked_out.clear()
+        for driver in drivers:
+            self._quit(driver)
+
+    @staticmethod
+    def _quit(driver: WebDriver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+browser_pool = BrowserPool()
+atexit.register(browser_pool.shutdown)
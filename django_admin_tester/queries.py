@@ -0,0 +1,53 @@
+import re
+import time
+from collections import Counter
+from typing import Any, Iterable, List, NamedTuple, Tuple
+
+_IN_LIST = re.compile(r'\bIN\s*\((?:\s*(?:%s|\?)\s*,?)+\)', re.I)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_WHITESPACE = re.compile(r'\s+')
+
+
+class RecordedQuery(NamedTuple):
+    sql: str
+    params: Any
+    duration: float
+
+
+def fingerprint(sql: str) -> str:
+    """Normalise ``sql`` so queries differing only in their values compare equal."""
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _IN_LIST.sub('IN (...)', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+class QueryRecorder:
+    """``connection.execute_wrapper`` hook that records executed queries."""
+
+    def __init__(self):
+        self.queries: List[RecordedQuery] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                RecordedQuery(sql, params, time.perf_counter() - start)
+            )
+
+
+def repeated_queries(
+    statements: Iterable[str], threshold: int
+) -> List[Tuple[str, int]]:
+    """Return fingerprints run at least ``threshold`` times, most frequent first."""
+    counts = Counter(fingerprint(sql) for sql in statements)
+    return [(sql, count) for sql, count in counts.most_common() if count >= threshold]
+
+
+def format_fingerprints(statements: Iterable[str], limit: int = 5) -> str:
+    """List the most frequent query fingerprints, one per line."""
+    counts = Counter(fingerprint(sql) for sql in statements)
+    return '\n'.join(f"    {count}x {sql}" for sql, count in counts.most_common(limit))
@@ -0,0 +1,79 @@
+from typing import Iterable, List, Type
+from django.contrib import admin
+from django.db import DatabaseError, models
+from django.test import RequestFactory
+from django.urls import reverse
+from .changelist import (
+    ChangelistUrl,
+    changelist_path,
+    changelist_urls,
+    get_model_admin,
+)
+
+
+def estimated_rows(model_class: Type[models.Model]) -> int:
+    """Return the number of rows in ``model_class``'s table, or 0 if unknown."""
+    try:
+        return model_class._default_manager.count()
+    except DatabaseError:
+        return 0
+
+
+def discover_models(
+    site=admin.site, exclude: Iterable[str] = ()
+) -> List[Type[models.Model]]:
+    """Return the models registered on ``site``, largest table first.
+
+    ``exclude`` holds ``app_label.ModelName`` labels to leave out. Starting
+    with the largest tables keeps the slowest pages from landing on one
+    worker at the end of a run.
+    """
+    excluded = {label.lower() for label in exclude}
+    model_classes = [
+        model_class
+        for model_class in site._registry
+        if model_class._meta.label_lower not in excluded
+    ]
+    return sorted(model_classes, key=estimated_rows, reverse=True)
+
+
+def add_form_url(model_class: Type[models.Model], user, site=admin.site):
+    """Return the add form URL, or ``None`` if ``user`` may not add objects."""
+    request = RequestFactory().get('/')
+    request.user = user
+    if not get_model_admin(model_class, site).has_add_permission(request):
+        return None
+    opts = model_class._meta
+    return ChangelistUrl(
+        'add',
+        'add form',
+        reverse(f'{site.name}:{opts.app_label}_{opts.model_name}_add'),
+        'add form',
+        opts.label,
+    )
+
+
+def registry_urls(
+    model_classes: Iterable[Type[models.Model]],
+    user,
+    site=admin.site,
+    search_term: str = 'test',
+) -> List[ChangelistUrl]:
+    """Enumerate the changelist and add form URLs of several admins.
+
+    URLs keep the order of ``model_classes`` and their labels are prefixed
+    with the model label so failures can be told apart.
+    """
+    urls = []
+    for model_class in model_classes:
+        label = model_class._meta.label
+        path = changelist_path(model_class, site)
+        items = [ChangelistUrl('changelist', 'load', path, 'load', label)]
+        items.extend(
+            changelist_urls(model_class, user, site=site, search_term=search_term)
+        )
+        add_url = add_form_url(model_class, user, site)
+        if add_url is not None:
+            items.append(add_url)
+        urls.extend(item._replace(label=f"{label} {item.label}") for item in items)
+    return urls
@@ -0,0 +1,157 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape, quoteattr
+from .settings import admin_tester_settings
+
+OUTCOMES = ('passed', 'failed', 'error', 'skipped')
+
+
+class ResultRecord(NamedTuple):
+    """The outcome of one check of one admin page."""
+
+    model: str
+    kind: str
+    target: str
+    label: str
+    url: str
+    outcome: str
+    duration: Optional[float] = None
+    server_duration: Optional[float] = None
+    queries: Optional[int] = None
+    message: str = ''
+    artifacts: Tuple[str, ...] = ()
+    timestamp: float = 0.0
+    browser: Optional[Dict[str, Any]] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.outcome in ('failed', 'error')
+
+
+class JsonLinesReporter:
+    """Append one JSON object per record and flush it straight away."""
+
+    extension = 'jsonl'
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def write(self, record: ResultRecord):
+        self._file.write(json.dumps(record._asdict()) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class JUnitReporter:
+    """Stream records as JUnit XML ``<testcase>`` elements.
+
+    Suite totals are left out because they are unknown until the end; CI
+    servers count the test cases themselves.
+    """
+
+    extension = 'xml'
+
+    def __init__(self, path: str, name: str = 'django-admiral'):
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write('<?xml version="1.0" encoding="utf-8"?>\n<testsuites>\n')
+        self._file.write(f'  <testsuite name={quoteattr(name)}>\n')
+        self._file.flush()
+
+    def write(self, record: ResultRecord):
+        name = f"{record.kind}: {record.label or record.target}"
+        attributes = (
+            f"classname={quoteattr(record.model)} name={quoteattr(name)} "
+            f'time="{record.duration or 0:.3f}"'
+        )
+        body = ''
+        if record.outcome == 'skipped':
+            body = f"<skipped message={quoteattr(record.message)}/>"
+        elif record.failed:
+            tag = 'failure' if record.outcome == 'failed' else 'error'
+            summary = record.message.splitlines()[0] if record.message else ''
+            details = '\n'.join([record.url, record.message, *record.artifacts])
+            body = f"<{tag} message={quoteattr(summary)}>{escape(details)}</{tag}>"
+        if body:
+            self._file.write(f"    <testcase {attributes}>{body}</testcase>\n")
+        else:
+            self._file.write(f"    <testcase {attributes}/>\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.write('  </testsuite>\n</testsuites>\n')
+        self._file.close()
+
+
+REPORTERS = {'jsonl': JsonLinesReporter, 'junit': JUnitReporter}
+
+
+class ResultStream:
+    """Write result records to every configured reporter as they arrive.
+
+    Only failure counts are kept in memory, so long runs do not grow with the
+    number of checks. Safe to use from crawler worker threads.
+    """
+
+    def __init__(self, base_path: str, formats: Optional[Sequence[str]] = None):
+        formats = admin_tester_settings.RESULT_FORMATS if formats is None else formats
+        directory = os.path.dirname(base_path)
+        if formats and directory:
+            os.makedirs(directory, exist_ok=True)
+        self.reporters = [
+            REPORTERS[name](f"{base_path}.{REPORTERS[name].extension}")
+            for name in formats
+        ]
+        self.paths = [reporter.path for reporter in self.reporters]
+        self.checks = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def write(self, record: ResultRecord) -> ResultRecord:
+        if not record.timestamp:
+            record = record._replace(timestamp=time.time())
+        with self._lock:
+            self.checks += 1
+            self.failures += record.failed
+            for reporter in self.reporters:
+                reporter.write(record)
+        return record
+
+    def close(self):
+        with self._lock:
+            for reporter in self.reporters:
+                reporter.close()
+            self.reporters = []
+
+
+def read_results(path: str) -> Iterator[ResultRecord]:
+    """Read the records of a JSON Lines result file, skipping a torn last line."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                data = json.loads(line)
+            except ValueError:
+                continue
+            data['artifacts'] = tuple(data.get('artifacts') or ())
+            yield ResultRecord(**data)
+
+
+def write_results(
+    records: Iterable[ResultRecord],
+    base_path: str,
+    formats: Optional[Sequence[str]] = None,
+):
+    """Write ``records`` to a new set of result files and return their paths."""
+    stream = ResultStream(base_path, formats)
+    try:
+        for record in records:
+            stream.write(record)
+        return stream.paths
+    finally:
+        stream.close()
@@ -0,0 +1,42 @@
+import unittest
+from django.test.runner import DiscoverRunner
+from .settings import admin_tester_settings
+from .sharding import current_shard, shard_tests
+
+
+class ShardedTestRunner(DiscoverRunner):
+    """Run one shard of the test suite: ``manage.py test --shard 2/4``.
+
+    Test classes are dealt out evenly by count, or balanced by the durations
+    in ``SHARD_TIMINGS`` when every node shares those timing reports; a
+    node's own ``REPORT_DIR`` is never used, so all shards agree on the split.
+    The shard can also be given through the ``ADMIN_TESTER_SHARD`` setting or
+    environment variable.
+    """
+
+    def __init__(self, shard=None, **kwargs):
+        super().__init__(**kwargs)
+        self.shard = shard
+
+    @classmethod
+    def add_arguments(cls, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--shard',
+            help="Only run shard i of N of the suite, e.g. 2/4.",
+        )
+
+    def test_suite(self, tests=()):
+        tests = list(tests)
+        shard = current_shard()
+        if shard is not None:
+            kept = shard_tests(tests, shard)
+            self.log(f"Shard {shard.index}/{shard.total}: {len(kept)} of {len(tests)}")
+            tests = kept
+        return unittest.TestSuite(tests)
+
+    def run_tests(self, *args, **kwargs):
+        if not self.shard:
+            return super().run_tests(*args, **kwargs)
+        with admin_tester_settings.override(SHARD=self.shard):
+            return super().run_tests(*args, **kwargs)
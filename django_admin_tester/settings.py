@@ -1,54 +1,302 @@
+import os
+import re
+import threading
+from collections.abc import Mapping
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Dict, List
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from .exceptions import AdminTesterConfigError
 
+PREFIX = 'ADMIN_TESTER_'
 
-class AdminTesterSettings:
+DEFAULTS: Dict[str, Any] = {
+    'WAIT_TIMEOUT': 10,
+    'IMPLICIT_WAIT': 10,
+    'BROWSER': 'chrome',
+    'HEADLESS': True,
+    'WINDOW_SIZE': (1920, 1080),
+    'SCREENSHOT_ON_FAILURE': True,
+    'SCREENSHOT_DIR': None,
+    'ARTIFACT_MAX_BYTES': 500 * 1024 * 1024,
+    'DEFAULT_ADMIN_USERNAME': 'admin',
+    'DEFAULT_ADMIN_EMAIL': 'admin@example.com',
+    'DEFAULT_ADMIN_PASSWORD': 'admin123',
+    'CUSTOM_WAIT_CONDITIONS': {},
+    'PARALLEL_WORKERS': 1,
+    'CHANGELIST_ENGINE': 'browser',
+    'ASYNC_CONCURRENCY': 10,
+    'LOGIN_MODE': 'session',
+    'POOL_IDLE_TIMEOUT': 300,
+    'DRIVER_CACHE_PATH': os.path.join(
+        os.path.expanduser('~'), '.cache', 'django-admiral', 'drivers.json'
+    ),
+    'DRIVER_OFFLINE': False,
+    'DRIVER_PATHS': {},
+    'REPORT_DIR': 'admin_tester_reports',
+    'DUPLICATE_QUERY_THRESHOLD': 5,
+    'FIXTURE_BATCH_SIZE': 1000,
+    'FIXTURE_SNAPSHOT_DIR': '.admin_tester_snapshots',
+    'BROWSER_PROFILE': 'default',
+    'FIRST_PARTY_HOSTS': ('localhost', '127.0.0.1'),
+    'FILTER_COMBINATIONS': 'single',
+    'FILTER_COMBINATION_LIMIT': 500,
+    'INCREMENTAL': True,
+    'FORCE_FULL_RUN': False,
+    'RESULT_CACHE_PATH': '.admin_tester_results.json',
+    'SHARD': None,
+    'SHARD_TIMINGS': None,
+    'RESULT_FORMATS': ('jsonl',),
+    'PAGINATION_REPEATS': 3,
+    'DEEP_PAGE_RATIO': 3.0,
+    'COUNT_QUERY_THRESHOLD': 0.1,
+    'INDEX_ADVICE': 'report',
+    'INDEX_ADVICE_MIN_ROWS': 1000,
+    'ACTION_SIZES': (10, 1000, None),
+    'ACTION_GROWTH_LIMIT': 1.3,
+    'FORM_SELECT_LIMIT': 100,
+    'BROWSER_METRICS': True,
+    'LOAD_USERS': 10,
+    'LOAD_RAMP_UP': 10,
+    'LOAD_DURATION': 60,
+    'LOAD_INTERVAL': 5,
+    'LOAD_THINK_TIME': 0.0,
+    'LOAD_ACTIONS': (),
+    'LOAD_MAX_ERROR_RATE': 0.01,
+}
+
+CHOICES = {
+    'BROWSER': ('chrome', 'firefox'),
+    'CHANGELIST_ENGINE': ('browser', 'client', 'async'),
+    'LOGIN_MODE': ('session', 'form'),
+    'FILTER_COMBINATIONS': ('single', 'pairwise', 'full'),
+    'INDEX_ADVICE': ('off', 'report', 'fail'),
+}
+
+# Numeric settings that must be at least 1; all others must not be negative.
+POSITIVE = {
+    'PARALLEL_WORKERS',
+    'ASYNC_CONCURRENCY',
+    'FIXTURE_BATCH_SIZE',
+    'FILTER_COMBINATION_LIMIT',
+    'PAGINATION_REPEATS',
+    'DEEP_PAGE_RATIO',
+    'FORM_SELECT_LIMIT',
+    'LOAD_USERS',
+    'LOAD_DURATION',
+    'LOAD_INTERVAL',
+}
+
+# Settings that can also be set through an environment variable, e.g. on CI.
+ENVIRONMENT = {
+    'FORCE_FULL_RUN': 'ADMIN_TESTER_FORCE_FULL_RUN',
+    'SHARD': 'ADMIN_TESTER_SHARD',
+    'SHARD_TIMINGS': 'ADMIN_TESTER_SHARD_TIMINGS',
+}
 
-    @property
-    def WAIT_TIMEOUT(self):
-        return getattr(settings, 'ADMIN_TESTER_WAIT_TIMEOUT', 10)
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+FALSE_VALUES = ('0', 'false', 'no', 'off')
 
-    @property
-    def IMPLICIT_WAIT(self):
-        return getattr(settings, 'ADMIN_TESTER_IMPLICIT_WAIT', 10)
+RESULT_FORMATS = ('jsonl', 'junit')
 
-    @property
-    def BROWSER(self):
-        return getattr(settings, 'ADMIN_TESTER_BROWSER', 'chrome')
+SHARD_PATTERN = re.compile(r'^\s*(\d+)\s*/\s*(\d+)\s*$')
 
-    @property
-    def HEADLESS(self):
-        return getattr(settings, 'ADMIN_TESTER_HEADLESS', True)
 
-    @property
-    def WINDOW_SIZE(self):
-        return getattr(settings, 'ADMIN_TESTER_WINDOW_SIZE', (1920, 1080))
+def _freeze(value):
+    if isinstance(value, Mapping):
+        return MappingProxyType(dict(value))
+    if isinstance(value, list):
+        return tuple(value)
+    return value
 
-    @property
-    def SCREENSHOT_ON_FAILURE(self):
-        return getattr(settings, 'ADMIN_TESTER_SCREENSHOT_ON_FAILURE', True)
 
-    @property
-    def SCREENSHOT_DIR(self):
-        return getattr(settings, 'ADMIN_TESTER_SCREENSHOT_DIR', None)
+def from_environment(name: str, raw: str):
+    """Convert the environment variable value ``raw`` to the type of ``name``.
+
+    The result still goes through ``validate``; only the conversion from a
+    string happens here.
+    """
+    default = DEFAULTS[name]
+    variable = ENVIRONMENT.get(name, PREFIX + name)
+    text = raw.strip()
+    if isinstance(default, bool):
+        if text.lower() in TRUE_VALUES:
+            return True
+        if text.lower() in FALSE_VALUES:
+            return False
+        raise AdminTesterConfigError(
+            f"Invalid {variable} {raw!r}, "
+            f"expected one of {', '.join(TRUE_VALUES + FALSE_VALUES)}"
+        )
+    if isinstance(default, (int, float)):
+        try:
+            return type(default)(text)
+        except ValueError:
+            expected = 'an integer' if isinstance(default, int) else 'a number'
+            raise AdminTesterConfigError(
+                f"Invalid {variable} {raw!r}, expected {expected}"
+            ) from None
+    if isinstance(default, (list, tuple)):
+        return tuple(part.strip() for part in text.split(',') if part.strip())
+    return text
 
-    @property
-    def DEFAULT_ADMIN_USERNAME(self):
-        return getattr(settings, 'ADMIN_TESTER_DEFAULT_ADMIN_USERNAME', 'admin')
 
-    @property
-    def DEFAULT_ADMIN_EMAIL(self):
-        return getattr(
-            settings, 'ADMIN_TESTER_DEFAULT_ADMIN_EMAIL', 'admin@example.com'
+def validate(name: str, value):
+    """Raise ``AdminTesterConfigError`` if ``value`` is not valid for ``name``."""
+    default = DEFAULTS[name]
+    if default is None:
+        valid = value is None or isinstance(value, str)
+    elif isinstance(default, bool):
+        valid = isinstance(value, bool)
+    elif isinstance(default, (int, float)):
+        minimum = 1 if name in POSITIVE else 0
+        valid = (
+            isinstance(value, (int, float))
+            and not isinstance(value, bool)
+            and value >= minimum
+        )
+    elif isinstance(default, (list, tuple)):
+        valid = isinstance(value, (list, tuple))
+    elif isinstance(default, Mapping):
+        valid = isinstance(value, Mapping)
+    else:
+        valid = isinstance(value, type(default))
+    if not valid:
+        raise AdminTesterConfigError(f"Invalid {PREFIX}{name}: {value!r}")
+    if name in CHOICES and value not in CHOICES[name]:
+        raise AdminTesterConfigError(
+            f"Invalid {PREFIX}{name} {value!r}, "
+            f"expected one of {', '.join(CHOICES[name])}"
+        )
+    if name == 'WINDOW_SIZE' and not (
+        len(value) == 2 and all(isinstance(size, int) and size > 0 for size in value)
+    ):
+        raise AdminTesterConfigError(
+            f"Invalid {PREFIX}WINDOW_SIZE {value!r}, expected (width, height)"
         )
+    if name == 'RESULT_FORMATS' and not set(value) <= set(RESULT_FORMATS):
+        raise AdminTesterConfigError(
+            f"Invalid {PREFIX}RESULT_FORMATS {value!r}, "
+            f"expected any of {', '.join(RESULT_FORMATS)}"
+        )
+    if name == 'ACTION_SIZES' and not all(
+        size is None or (isinstance(size, int) and size > 0) for size in value
+    ):
+        raise AdminTesterConfigError(
+            f"Invalid {PREFIX}ACTION_SIZES {value!r}, "
+            f"expected row counts or None for all rows"
+        )
+    if name == 'SHARD' and value is not None:
+        match = SHARD_PATTERN.match(value)
+        if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+            raise AdminTesterConfigError(
+                f"Invalid {PREFIX}SHARD {value!r}, expected i/N such as 2/4"
+            )
+
+
+class AdminTesterSettings:
+    """An immutable, validated snapshot of the ``ADMIN_TESTER_*`` settings.
+
+    Each value is taken from the keyword arguments, then the flat
+    ``ADMIN_TESTER_<NAME>`` setting, then the nested ``ADMIN_TESTER_SETTINGS``
+    dict, then the default. A non-empty environment variable listed in
+    ``ENVIRONMENT`` takes precedence over the Django settings, in either
+    direction for booleans.
+    """
+
+    __slots__ = tuple(DEFAULTS)
+
+    def __init__(self, **overrides):
+        nested = getattr(settings, f'{PREFIX}SETTINGS', {})
+        if not isinstance(nested, Mapping):
+            raise AdminTesterConfigError(f"{PREFIX}SETTINGS must be a dict")
+        unknown = (set(nested) | set(overrides)) - set(DEFAULTS)
+        if unknown:
+            raise AdminTesterConfigError(
+                f"Unknown admin tester settings: {', '.join(sorted(unknown))}"
+            )
+        for name, default in DEFAULTS.items():
+            if name in overrides:
+                value = overrides[name]
+            else:
+                value = getattr(settings, PREFIX + name, nested.get(name, default))
+                environ = os.environ.get(ENVIRONMENT.get(name, ''), '')
+                if environ.strip():
+                    value = from_environment(name, environ)
+            validate(name, value)
+            object.__setattr__(self, name, _freeze(value))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Admin tester settings are read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("Admin tester settings are read-only")
+
+    def __repr__(self):
+        return f"AdminTesterSettings({self.as_dict()!r})"
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def replace(self, **changes) -> 'AdminTesterSettings':
+        """Return a copy with ``changes`` applied."""
+        return AdminTesterSettings(**{**self.as_dict(), **changes})
+
+
+class LazyAdminTesterSettings:
+    """Resolve the settings snapshot on first use and rebuild it when needed.
+
+    The snapshot is dropped whenever an ``ADMIN_TESTER_*`` setting changes,
+    for example under ``override_settings``. ``override`` swaps in changed
+    values for a block or test without touching ``django.conf.settings``.
+    """
+
+    def __init__(self):
+        self._wrapped = None
+        self._overrides: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _setup(self) -> AdminTesterSettings:
+        with self._lock:
+            if self._wrapped is None:
+                merged = {}
+                for changes in self._overrides:
+                    merged.update(changes)
+                self._wrapped = AdminTesterSettings(**merged)
+            return self._wrapped
+
+    def __getattr__(self, name):
+        wrapped = self._wrapped or self._setup()
+        return getattr(wrapped, name)
+
+    def reload(self):
+        """Drop the snapshot; the next read resolves and validates again."""
+        self._wrapped = None
+
+    def validate(self):
+        """Resolve the settings now so configuration errors surface early."""
+        self._setup()
 
-    @property
-    def DEFAULT_ADMIN_PASSWORD(self):
-        return getattr(settings, 'ADMIN_TESTER_DEFAULT_ADMIN_PASSWORD', 'admin123')
+    @contextmanager
+    def override(self, **changes):
+        """Apply ``changes`` for the duration of a ``with`` block or test."""
+        self._overrides.append(changes)
+        self.reload()
+        try:
+            self._setup()
+            yield self
+        finally:
+            self._overrides.pop()
+            self.reload()
 
-    @property
-    def CUSTOM_WAIT_CONDITIONS(self):
-        return getattr(settings, 'ADMIN_TESTER_CUSTOM_WAIT_CONDITIONS', {})
 
+admin_tester_settings = LazyAdminTesterSettings()
+override_admin_tester_settings = admin_tester_settings.override
 
-admin_tester_settings = AdminTesterSettings()
 
+@receiver(setting_changed)
+def reload_admin_tester_settings(setting, **kwargs):
+    if setting.startswith(PREFIX):
+        admin_tester_settings.reload()
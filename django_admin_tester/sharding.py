@@ -0,0 +1,277 @@
+import glob
+import os
+import re
+import shutil
+import statistics
+import unittest
+from collections import defaultdict
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+from .exceptions import AdminTesterConfigError
+from .reporting import read_results, write_results
+from .settings import SHARD_PATTERN, admin_tester_settings
+from .timing import TimingReport, request_key
+
+T = TypeVar('T')
+
+REPORT_FILE = r'^(?P<name>.+)-{kind}(?P<shard>-shard\d+of\d+)?\.{extension}$'
+
+
+class Shard(NamedTuple):
+    """Shard ``index`` (1-based) of ``total``."""
+
+    index: int
+    total: int
+
+    @property
+    def suffix(self) -> str:
+        return f"-shard{self.index}of{self.total}"
+
+
+def parse_shard(value: str) -> Shard:
+    """Parse ``'i/N'`` into a ``Shard``."""
+    match = SHARD_PATTERN.match(value)
+    if not match:
+        raise AdminTesterConfigError(f"Invalid shard {value!r}, expected i/N")
+    shard = Shard(int(match.group(1)), int(match.group(2)))
+    if not 1 <= shard.index <= shard.total:
+        raise AdminTesterConfigError(f"Shard {value!r} is out of range")
+    return shard
+
+
+def current_shard() -> Optional[Shard]:
+    """Return the shard this process runs, from the ``SHARD`` setting."""
+    value = admin_tester_settings.SHARD
+    return parse_shard(value) if value else None
+
+
+def report_path(name: str, kind: str, extension: Optional[str] = 'json') -> str:
+    """Return where report ``kind`` of test class ``name`` is written.
+
+    Sharded runs add the shard to the file name so merged directories do
+    not collide.
+    """
+    shard = current_shard()
+    filename = f"{name}-{kind}{shard.suffix if shard else ''}"
+    if extension:
+        filename = f"{filename}.{extension}"
+    return os.path.join(admin_tester_settings.REPORT_DIR, filename)
+
+
+def timings_path(name: str) -> str:
+    """Return where the timing report of test class ``name`` is written."""
+    return report_path(name, 'timings')
+
+
+def report_files(
+    directories: Iterable[str],
+    sharded: bool = False,
+    kind: str = 'timings',
+    extension: str = 'json',
+) -> Dict[str, List[str]]:
+    """Group the reports of one kind in ``directories`` by test class name.
+
+    A class's merged (or unsharded) reports are preferred over its per-shard
+    ones, or the other way around when ``sharded`` is true, so no run is
+    counted twice.
+    """
+    pattern = re.compile(REPORT_FILE.format(kind=kind, extension=extension))
+    found = defaultdict(lambda: ([], []))
+    for directory in directories:
+        paths = glob.glob(os.path.join(directory, f'*-{kind}*.{extension}'))
+        for path in sorted(paths):
+            match = pattern.match(os.path.basename(path))
+            if match:
+                found[match.group('name')][bool(match.group('shard'))].append(path)
+    return {
+        name: (shard_paths or whole_paths) if sharded else (whole_paths or shard_paths)
+        for name, (whole_paths, shard_paths) in found.items()
+    }
+
+
+def recorded_durations(
+    path: Optional[str] = None,
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Return the seconds earlier runs spent per test class and per URL.
+
+    Durations come only from ``path``, by default the ``SHARD_TIMINGS`` timing
+    report or directory of reports, which every node must share (committed to
+    the repository or downloaded from a previous run). A node's own
+    ``REPORT_DIR`` is never used, as it differs between nodes. Without shared
+    timings both dicts are empty and shards are split evenly by count.
+    """
+    by_class: Dict[str, float] = defaultdict(float)
+    by_url: Dict[str, float] = defaultdict(float)
+    path = path or admin_tester_settings.SHARD_TIMINGS
+    if not path:
+        return by_class, by_url
+    if os.path.isfile(path):
+        match = re.match(
+            REPORT_FILE.format(kind='timings', extension='json'),
+            os.path.basename(path),
+        )
+        name = match.group('name') if match else os.path.basename(path)
+        files = {name: [path]}
+    elif os.path.isdir(path):
+        files = report_files([path])
+    else:
+        # Splitting without them here but with them elsewhere would lose tests.
+        raise AdminTesterConfigError(f"Shard timings {path!r} do not exist")
+    for name, paths in files.items():
+        for file_path in paths:
+            try:
+                report = TimingReport.load(file_path)
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+            for interaction in report.interactions:
+                by_class[name] += interaction.duration
+                by_url[request_key(interaction.url)] += interaction.duration
+    return by_class, by_url
+
+
+def split_weighted(
+    items: Sequence[T], weight: Callable[[T], float], total: int
+) -> List[List[T]]:
+    """Split ``items`` into ``total`` buckets of about equal weight.
+
+    Items are placed heaviest first onto the lightest bucket (longest
+    processing time first) and keep their original order within a bucket.
+    Ties are broken by position, so every node computes the same split.
+    """
+    weights = [weight(item) for item in items]
+    loads = [0.0] * total
+    assigned: List[List[int]] = [[] for _ in range(total)]
+    for position in sorted(range(len(items)), key=lambda i: (-weights[i], i)):
+        bucket = min(range(total), key=lambda b: (loads[b], b))
+        assigned[bucket].append(position)
+        loads[bucket] += weights[position]
+    return [[items[position] for position in sorted(bucket)] for bucket in assigned]
+
+
+def shard_items(
+    items: Sequence[T],
+    shard: Shard,
+    durations: Dict[Hashable, float],
+    key: Callable[[T], Hashable] = lambda item: item,
+) -> List[T]:
+    """Return this shard's share of ``items``, balanced by recorded durations.
+
+    Items without a recorded duration count as the median recorded one.
+    """
+    default = _default_duration(durations)
+    buckets = split_weighted(
+        items, lambda item: durations.get(key(item)) or default, shard.total
+    )
+    return buckets[shard.index - 1]
+
+
+def shard_groups(
+    items: Sequence[T],
+    shard: Shard,
+    durations: Dict[Hashable, float],
+    group: Callable[[T], Hashable],
+    key: Callable[[T], Hashable] = lambda item: item,
+) -> List[T]:
+    """Return this shard's share of ``items``, keeping each group on one shard.
+
+    A group weighs the recorded durations of its items, counting items
+    without one as the median recorded duration.
+    """
+    default = _default_duration(durations)
+    weights: Dict[Hashable, float] = {}
+    for item in items:
+        name = group(item)
+        weights[name] = weights.get(name, 0.0) + (durations.get(key(item)) or default)
+    buckets = split_weighted(list(weights), weights.__getitem__, shard.total)
+    mine = set(buckets[shard.index - 1])
+    return [item for item in items if group(item) in mine]
+
+
+def _default_duration(durations: Dict[Hashable, float]) -> float:
+    known = [duration for duration in durations.values() if duration > 0]
+    return statistics.median(known) if known else 1.0
+
+
+def iter_tests(suite: Iterable) -> Iterable[unittest.TestCase]:
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_tests(test)
+        else:
+            yield test
+
+
+def shard_tests(
+    tests: Iterable[unittest.TestCase],
+    shard: Shard,
+    durations: Optional[Dict[str, float]] = None,
+) -> List[unittest.TestCase]:
+    """Keep the test classes assigned to ``shard``.
+
+    Classes are split whole, by their recorded duration. Classes with a true
+    ``shard_within_class`` attribute run on every shard and split their own
+    work, as ``AdminRegistryTest`` does with its admins.
+    """
+    if durations is None:
+        durations = recorded_durations()[0]
+    by_class: Dict[type, List[unittest.TestCase]] = defaultdict(list)
+    for test in tests:
+        by_class[type(test)].append(test)
+    shared = [cls for cls in by_class if getattr(cls, 'shard_within_class', False)]
+    split = [cls for cls in by_class if cls not in shared]
+    mine = set(shard_items(split, shard, durations, key=lambda cls: cls.__name__))
+    return [
+        test
+        for cls, class_tests in by_class.items()
+        if cls in mine or cls in shared
+        for test in class_tests
+    ]
+
+
+def merge_timing_reports(directories: Iterable[str]) -> Dict[str, TimingReport]:
+    """Combine the per-shard timing reports of each test class."""
+    reports = {}
+    for name, paths in report_files(directories, sharded=True).items():
+        report = TimingReport()
+        for path in paths:
+            report.extend(TimingReport.load(path).interactions)
+        reports[name] = report
+    return reports
+
+
+def merge_artifacts(directories: Iterable[str], output: str) -> int:
+    """Copy the artifacts of every shard into ``output`` and return how many.
+
+    Screenshots are named by content hash, so a file that already exists
+    under the same name is skipped.
+    """
+    os.makedirs(output, exist_ok=True)
+    copied = 0
+    for directory in directories:
+        if os.path.abspath(directory) == os.path.abspath(output):
+            continue
+        for entry in os.scandir(directory):
+            target = os.path.join(output, entry.name)
+            if entry.is_file() and not os.path.exists(target):
+                shutil.copy2(entry.path, target)
+                copied += 1
+    return copied
+
+
+def merge_results(directories: Iterable[str], output: str) -> Dict[str, List[str]]:
+    """Combine the per-shard result streams of each test class into ``output``."""
+    merged = {}
+    files = report_files(directories, sharded=True, kind='results', extension='jsonl')
+    for name, paths in files.items():
+        records = (record for path in paths for record in read_results(path))
+        merged[name] = write_results(records, os.path.join(output, f"{name}-results"))
+    return merged
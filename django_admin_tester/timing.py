@@ -0,0 +1,140 @@
+import json
+import math
+import os
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class ServerTiming(NamedTuple):
+    """Server-side cost of one request, measured by ``ServerTimingMiddleware``."""
+
+    duration: float
+    queries: int
+    statements: Tuple[str, ...] = ()
+
+
+class Interaction(NamedTuple):
+    """One timed interaction of the admin tester with a page."""
+
+    model: str
+    kind: str
+    target: str
+    label: str
+    url: str
+    duration: float
+    server_duration: Optional[float] = None
+    queries: Optional[int] = None
+
+
+def request_key(url: str) -> str:
+    """Return the path and query string of ``url``, as seen by the server."""
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+class ServerTimingStore:
+    """Hand server timings from the live server threads to the test thread.
+
+    Only the most recent ``max_entries`` requests are kept, so requests
+    nobody asks about cannot grow the store without bound.
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._timings: 'OrderedDict[str, ServerTiming]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key: str, timing: ServerTiming):
+        with self._lock:
+            self._timings.pop(key, None)
+            self._timings[key] = timing
+            while len(self._timings) > self.max_entries:
+                self._timings.popitem(last=False)
+
+    def pop(self, url: str) -> Optional[ServerTiming]:
+        with self._lock:
+            return self._timings.pop(request_key(url), None)
+
+
+server_timings = ServerTimingStore()
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Return the nearest-rank percentile of ``values``."""
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    return {
+        'count': len(values),
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'max': max(values),
+    }
+
+
+class TimingReport:
+    """Collect interactions and summarise their latency."""
+
+    def __init__(self):
+        self.interactions: List[Interaction] = []
+        self._lock = threading.Lock()
+
+    def add(self, interaction: Interaction):
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def extend(self, interactions: Iterable[Interaction]):
+        with self._lock:
+            self.interactions.extend(interactions)
+
+    def summary(self) -> dict:
+        """Return p50/p95/max latency per model and per model target."""
+        by_model = defaultdict(list)
+        by_target = defaultdict(list)
+        for interaction in self.interactions:
+            by_model[interaction.model].append(interaction.duration)
+            key = f"{interaction.model} {interaction.kind}: {interaction.target}"
+            by_target[key].append(interaction.duration)
+        return {
+            'models': {key: summarize(values) for key, values in by_model.items()},
+            'targets': {key: summarize(values) for key, values in by_target.items()},
+        }
+
+    @classmethod
+    def load(cls, path: str) -> 'TimingReport':
+        """Read a report written by ``write_json``."""
+        with open(path) as f:
+            data = json.load(f)
+        report = cls()
+        report.extend(Interaction(**entry) for entry in data['interactions'])
+        return report
+
+    def as_dict(self) -> dict:
+        return {
+            'interactions': [entry._asdict() for entry in self.interactions],
+            'summary': self.summary(),
+        }
+
+    def write_json(self, path: str) -> str:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(), f, indent=2)
+        return path
+
+    def format_summary(self) -> str:
+        lines = [f"{'':<60} {'n':>5} {'p50':>8} {'p95':>8} {'max':>8}"]
+        summary = self.summary()
+        for section in ('models', 'targets'):
+            for key, stats in sorted(summary[section].items()):
+                lines.append(
+                    f"{key[:60]:<60} {stats['count']:>5} {stats['p50']:>8.3f} "
+                    f"{stats['p95']:>8.3f} {stats['max']:>8.3f}"
+                )
+        return '\n'.join(lines)
@@ -0,0 +1,96 @@
+import time
+from typing import Optional
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from .exceptions import AdminTesterTimeoutError
+from .settings import admin_tester_settings
+
+# The fixed delay the tester used to sleep after every interaction.
+LEGACY_SLEEP = 0.5
+
+# Elements that mark a fully rendered admin page.
+CHANGELIST_MARKER = (By.ID, 'changelist')
+PAGE_MARKER = (By.ID, 'content')
+
+
+def document_ready(driver: WebDriver) -> bool:
+    """Expected condition: the current document has finished loading.
+
+    Drivers using the ``eager`` page load strategy only wait for the DOM to
+    be parsed, so an ``interactive`` document is ready for them too.
+    """
+    state = driver.execute_script('return document.readyState')
+    if state == 'complete':
+        return True
+    capabilities = getattr(driver, 'capabilities', None) or {}
+    return state == 'interactive' and capabilities.get('pageLoadStrategy') == 'eager'
+
+
+class NavigationWaiter:
+    """Wait for admin navigations to finish instead of sleeping a fixed time."""
+
+    def __init__(self, driver: WebDriver, timeout: Optional[float] = None):
+        self.driver = driver
+        self.timeout = timeout or admin_tester_settings.WAIT_TIMEOUT
+        self.navigations = 0
+        self.elapsed = 0.0
+
+    def current_result_list(self) -> Optional[WebElement]:
+        """Return the ``#result_list`` table of the current page, if any."""
+        elements = self.driver.find_elements(By.ID, 'result_list')
+        return elements[0] if elements else None
+
+    def wait_for_navigation(
+        self, old_element: Optional[WebElement] = None, marker=PAGE_MARKER
+    ) -> float:
+        """Block until the page replacing ``old_element`` is ready.
+
+        Returns the number of seconds spent waiting.
+        """
+        wait = WebDriverWait(self.driver, self.timeout)
+        start = time.perf_counter()
+        try:
+            if old_element is not None:
+                wait.until(EC.staleness_of(old_element))
+            wait.until(document_ready)
+            wait.until(EC.presence_of_element_located(marker))
+        except TimeoutException as e:
+            raise AdminTesterTimeoutError(
+                f"Page did not finish loading within {self.timeout}s: "
+                f"{self.driver.current_url}"
+            ) from e
+        finally:
+            duration = time.perf_counter() - start
+            self.navigations += 1
+            self.elapsed += duration
+        return duration
+
+    def click_and_wait(self, element: WebElement, marker=PAGE_MARKER) -> float:
+        """Click ``element`` and wait for the resulting navigation."""
+        old_element = self.current_result_list() or self.driver.find_element(
+            By.TAG_NAME, 'html'
+        )
+        element.click()
+        return self.wait_for_navigation(old_element, marker)
+
+    def submit_and_wait(self, element: WebElement, marker=PAGE_MARKER) -> float:
+        """Submit the form containing ``element`` and wait for the new page."""
+        old_element = self.driver.find_element(By.TAG_NAME, 'html')
+        element.submit()
+        return self.wait_for_navigation(old_element, marker)
+
+    @property
+    def time_saved(self) -> float:
+        """Seconds saved compared with sleeping ``LEGACY_SLEEP`` per navigation."""
+        return self.navigations * LEGACY_SLEEP - self.elapsed
+
+    def report(self) -> str:
+        return (
+            f"{self.navigations} navigations waited {self.elapsed:.2f}s in total, "
+            f"{self.time_saved:.2f}s saved compared with fixed "
+            f"{LEGACY_SLEEP}s sleeps"
+        )
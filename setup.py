@@ -62,6 +62,10 @@ setup(
             'mypy>=1.0.0',
             'pre-commit>=3.0.0',
         ],
+        'artifacts': [
+            'Pillow>=9.0.0',
+            'zstandard>=0.20.0',
+        ],
         'docs': [
             'sphinx>=6.0.0',
             'sphinx-rtd-theme>=1.2.0',
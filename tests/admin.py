@@ -0,0 +1,20 @@
+from django.contrib import admin
+from .models import Author, Book, Tag
+
+
+@admin.register(Author)
+class AuthorAdmin(admin.ModelAdmin):
+    list_display = ('name', 'active')
+    list_filter = ('active',)
+    search_fields = ('name',)
+
+
+@admin.register(Book)
+class BookAdmin(admin.ModelAdmin):
+    list_display = ('title', 'author', 'pages', 'status')
+    list_filter = ('status', 'author')
+    search_fields = ('title',)
+    raw_id_fields = ('tags',)
+
+
+admin.site.register(Tag)
@@ -0,0 +1,22 @@
+from django.db import models
+
+
+class Author(models.Model):
+    name = models.CharField(max_length=100)
+    active = models.BooleanField(default=True)
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=50)
+
+
+class Book(models.Model):
+    title = models.CharField(max_length=200)
+    author = models.ForeignKey(Author, on_delete=models.CASCADE)
+    tags = models.ManyToManyField(Tag, blank=True)
+    pages = models.IntegerField(default=0)
+    status = models.CharField(
+        max_length=10,
+        choices=[('draft', 'Draft'), ('published', 'Published')],
+        default='draft',
+    )
@@ -0,0 +1,57 @@
+import tracemalloc
+import pytest
+from django.contrib.auth import get_user_model
+from django_admin_tester.actions import (
+    ActionChecker,
+    ActionSample,
+    growth_exponent,
+    traced_memory,
+)
+from .models import Author
+
+
+def sample(size, duration, queries=1):
+    return ActionSample('delete_selected', size, duration, queries, 0)
+
+
+def test_growth_exponent():
+    assert growth_exponent(sample(10, 0.1), sample(1000, 10.0), 'duration') == (
+        pytest.approx(1.0)
+    )
+    assert growth_exponent(sample(10, 0.1), sample(100, 10.0), 'duration') == (
+        pytest.approx(2.0)
+    )
+    assert growth_exponent(sample(10, 1.0, 5), sample(1000, 1.0, 5), 'queries') == 0.0
+
+
+def test_growth_exponent_without_growth_to_measure():
+    assert growth_exponent(sample(10, 0.0), sample(100, 1.0), 'duration') == 0.0
+    assert growth_exponent(sample(100, 0.1), sample(100, 1.0), 'duration') == 0.0
+
+
+def test_traced_memory_measures_only_the_block():
+    tracemalloc.start()
+    try:
+        earlier = [bytearray(4 * 1024 * 1024)]
+        del earlier
+        with traced_memory() as peak:
+            data = bytearray(64 * 1024)
+        assert 64 * 1024 <= peak[0] < 1024 * 1024
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    with traced_memory() as peak:
+        data = bytearray(256 * 1024)
+    assert peak[0] >= 256 * 1024
+    assert data and not tracemalloc.is_tracing()
+
+
+@pytest.mark.django_db
+def test_measure_leaves_the_rows_in_place():
+    user = get_user_model().objects.create_superuser('admin', 'a@example.com', 'pw')
+    Author.objects.bulk_create(Author(name=f'author {i}') for i in range(5))
+    checker = ActionChecker(Author, user, sizes=(2,))
+    result = checker.measure('delete_selected', 2, 5)
+    assert result.error is None
+    assert result.queries > 0 and result.duration > 0 and result.peak_memory > 0
+    assert Author.objects.count() == 5
@@ -0,0 +1,58 @@
+import threading
+import pytest
+from django.contrib.auth import get_user_model
+import app
+from django_admin_tester.reporting import ResultStream
+from django_admin_tester.settings import override_admin_tester_settings
+from .models import Author, Book, Tag
+
+
+def test_report_counts_failures_from_many_threads(tmp_path):
+    test = app.AdminPageTest.__new__(app.AdminPageTest)
+    test.model_class = None
+    test.result_stream = ResultStream(str(tmp_path / 'results'), formats=[])
+    test.failed_actions = []
+    test.failure_count = 0
+    test.failed_labels = set()
+    test.failure_lock = threading.Lock()
+
+    def worker(number):
+        for check in range(100):
+            test.report('load', check, message='failed', model=f'app.M{number}')
+
+    threads = [threading.Thread(target=worker, args=(number,)) for number in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert test.failure_count == 800
+    assert test.result_stream.failures == 800
+    assert test.failed_labels == {f'app.M{number}' for number in range(8)}
+    assert len(test.failed_actions) == app.MAX_FAILURE_MESSAGES
+
+
+@pytest.mark.django_db
+def test_registry_shards_split_every_admin_before_dropping_fresh_ones():
+    test = app.AdminRegistryTest.__new__(app.AdminRegistryTest)
+    test.admin_user = get_user_model().objects.create_superuser(
+        'admin', 'admin@example.com', 'pw'
+    )
+    registered = [Author, Book, Tag]
+
+    def plan(shard, models_to_test):
+        test.models_to_test = models_to_test
+        with override_admin_tester_settings(SHARD=shard):
+            return test.planned_urls()
+
+    whole = [set(plan(f'{i}/2', registered)[0]) for i in (1, 2)]
+    assert whole[0] | whole[1] == set(registered) and not whole[0] & whole[1]
+    # A node that finds Book fresh keeps the same share, minus Book.
+    for i in (1, 2):
+        model_classes, urls = plan(f'{i}/2', [Author, Tag])
+        assert set(model_classes) == whole[i - 1] - {Book}
+        assert {item.model for item in urls} == {
+            model_class._meta.label for model_class in model_classes
+        }
+    model_classes, _ = plan(None, [Book])
+    assert model_classes == [Book]
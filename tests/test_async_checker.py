@@ -0,0 +1,126 @@
+import asyncio
+from django_admin_tester.async_checker import HttpConnection
+
+
+def serve(responses):
+    """Run ``coroutine(connection)`` against a server replaying ``responses``.
+
+    Each accepted socket answers its requests with the next entries of
+    ``responses``; ``None`` closes the socket instead of answering.
+    """
+    requests = []
+    connections = []
+
+    async def handle(reader, writer):
+        connections.append(writer)
+        while responses:
+            head = await reader.readuntil(b'\r\n\r\n')
+            length = 0
+            for line in head.split(b'\r\n'):
+                if line.lower().startswith(b'content-length:'):
+                    length = int(line.split(b':')[1])
+            body = await reader.readexactly(length) if length else b''
+            requests.append((head.split(b'\r\n')[0].decode(), body))
+            response = responses.pop(0)
+            if response is None:
+                writer.close()
+                return
+            writer.write(response)
+            await writer.drain()
+        writer.close()
+
+    def run(coroutine):
+        async def main():
+            server = await asyncio.start_server(handle, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            connection = HttpConnection('127.0.0.1', port, False)
+            try:
+                return await asyncio.wait_for(coroutine(connection), 5)
+            finally:
+                connection.close()
+                server.close()
+                await server.wait_closed()
+
+        return asyncio.run(main())
+
+    return run, requests, connections
+
+
+def test_content_length_body():
+    run, requests, _ = serve([b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nhello'])
+    status, body = run(lambda connection: connection.get('/a', {}))
+    assert (status, body) == (200, b'hello')
+    assert requests == [('GET /a HTTP/1.1', b'')]
+
+
+def test_chunked_body_with_trailer():
+    run, _, _ = serve(
+        [
+            b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+            b'5;ext=1\r\nhello\r\n6\r\n world\r\n0\r\nX-Trailer: 1\r\n\r\n',
+            b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok',
+        ]
+    )
+
+    async def two_gets(connection):
+        # The second response only parses if the trailer was consumed.
+        return [await connection.get('/a', {}), await connection.get('/b', {})]
+
+    assert run(two_gets) == [(200, b'hello world'), (200, b'ok')]
+
+
+def test_keep_alive_reuses_connection():
+    ok = b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok'
+    run, requests, connections = serve([ok, ok])
+
+    async def two_gets(connection):
+        return [await connection.get('/a', {}), await connection.get('/b', {})]
+
+    assert run(two_gets) == [(200, b'ok'), (200, b'ok')]
+    assert len(connections) == 1
+    assert [line for line, _ in requests] == ['GET /a HTTP/1.1', 'GET /b HTTP/1.1']
+
+
+def test_reconnects_when_server_closed_idle_connection():
+    ok = b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok'
+    run, requests, connections = serve([ok, None, ok])
+
+    async def two_gets(connection):
+        return [await connection.get('/a', {}), await connection.get('/b', {})]
+
+    assert run(two_gets) == [(200, b'ok'), (200, b'ok')]
+    assert len(connections) == 2
+
+
+def test_responses_without_body_do_not_wait_for_close():
+    run, _, _ = serve(
+        [
+            b'HTTP/1.1 204 No Content\r\n\r\n',
+            b'HTTP/1.1 304 Not Modified\r\nETag: "x"\r\n\r\n',
+            b'HTTP/1.1 200 OK\r\nContent-Length: 9\r\n\r\n',
+        ]
+    )
+
+    async def requests(connection):
+        return [
+            await connection.get('/a', {}),
+            await connection.get('/b', {}),
+            (await connection.request('HEAD', '/c', {}))[::2],
+        ]
+
+    assert run(requests) == [(204, b''), (304, b''), (200, b'')]
+
+
+def test_post_sends_body_and_collects_cookies():
+    run, requests, _ = serve(
+        [
+            b'HTTP/1.1 302 Found\r\nSet-Cookie: a=1; Path=/\r\n'
+            b'Set-Cookie: b=2\r\nContent-Length: 0\r\n\r\n'
+        ]
+    )
+    status, headers, body = run(
+        lambda connection: connection.request('POST', '/p', {}, b'x=1')
+    )
+    assert (status, body) == (302, b'')
+    assert headers['set-cookie'].splitlines() == ['a=1; Path=/', 'b=2']
+    assert requests == [('POST /p HTTP/1.1', b'x=1')]
@@ -0,0 +1,13 @@
+from unittest import mock
+from django_admin_tester.crawler import ParallelCrawler
+
+
+def test_workers_acquire_browsers_with_the_profile():
+    crawler = ParallelCrawler(
+        'http://testserver', mock.Mock(), browser_type='chrome', profile='fast'
+    )
+    with mock.patch(
+        'django_admin_tester.crawler.BrowserFactory.acquire_browser'
+    ) as acquire:
+        crawler._get_driver()
+    acquire.assert_called_once_with('chrome', profile='fast')
@@ -0,0 +1,71 @@
+from unittest import mock
+from django_admin_tester.devtools import (
+    asset_type,
+    cdp_counters,
+    collect_metrics,
+    describe_metrics,
+)
+
+
+def chrome(*pages):
+    driver = mock.Mock()
+    driver.execute_cdp_cmd.side_effect = [
+        {'metrics': [{'name': name, 'value': value} for name, value in page.items()]}
+        for page in pages
+    ]
+    return driver
+
+
+def test_asset_type():
+    assert asset_type('http://host/static/admin/js/core.js?v=1', 'script') == 'script'
+    assert asset_type('http://host/static/admin/css/base.CSS', 'link') == 'stylesheet'
+    assert asset_type('http://host/static/fonts/Roboto.woff2', 'css') == 'font'
+    assert asset_type('http://host/admin/jsi18n/', 'fetch') == 'xhr'
+    assert asset_type('http://host/admin/jsi18n/', 'script') == 'other'
+
+
+def test_cdp_counters_report_the_difference_from_the_previous_page():
+    driver = chrome(
+        {'Nodes': 500, 'LayoutCount': 4, 'ScriptDuration': 0.25, 'Frames': 3},
+        {'Nodes': 300, 'LayoutCount': 7, 'ScriptDuration': 0.5},
+        # The tab was replaced, so its accumulated counters started over.
+        {'Nodes': 100, 'LayoutCount': 2, 'ScriptDuration': 0.1},
+    )
+    assert cdp_counters(driver) == {
+        'Nodes': 500,
+        'LayoutCount': 4,
+        'ScriptDuration': 0.25,
+    }
+    # Gauges such as Nodes are reported as they are.
+    second, third = cdp_counters(driver), cdp_counters(driver)
+    assert second == {'Nodes': 300, 'LayoutCount': 3, 'ScriptDuration': 0.25}
+    assert third == {'Nodes': 100, 'LayoutCount': 2, 'ScriptDuration': 0.1}
+
+
+def test_collect_metrics_without_cdp():
+    driver = mock.Mock(spec=['execute_script'])
+    driver.execute_script.return_value = {
+        'navigation': {
+            'transferSize': 2048,
+            'responseStart': 12.34,
+            'loadEventEnd': 99,
+        },
+        'resources': [
+            ['http://host/a.js', 'script', 1024],
+            ['http://host/b.js', 'script', 1024],
+            ['http://host/api', 'fetch', 512],
+        ],
+        'longTasks': [60.0, 120.04],
+    }
+    metrics = collect_metrics(driver)
+    assert metrics['navigation']['ttfb'] == 12.3
+    assert metrics['transfer'] == {'document': 2048, 'script': 2048, 'xhr': 512}
+    assert metrics['long_tasks'] == {'count': 2, 'total_ms': 180.0, 'max_ms': 120.0}
+    assert 'counters' not in metrics
+    assert describe_metrics(metrics) == 'load 99ms, 4.5 KiB transferred, 2 long tasks'
+
+
+def test_collect_metrics_of_an_unreadable_page():
+    driver = mock.Mock(spec=['execute_script'])
+    driver.execute_script.side_effect = RuntimeError('no page')
+    assert collect_metrics(driver) is None
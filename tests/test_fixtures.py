@@ -0,0 +1,78 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django_admin_tester.fixtures import DatabaseSnapshot, seed_model, snapshot_name
+from django_admin_tester.settings import override_admin_tester_settings
+from .models import Author, Book
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path):
+    with override_admin_tester_settings(FIXTURE_SNAPSHOT_DIR=str(tmp_path)):
+        yield tmp_path
+
+
+@pytest.mark.django_db
+def test_restore_only_touches_the_seeded_table(snapshot_dir):
+    seed_model(Author, 20)
+    seeded = list(Author.objects.order_by('pk').values_list('pk', 'name', 'active'))
+    assert len(seeded) == 20
+
+    user = get_user_model().objects.create(username='created-after-seeding')
+    Author.objects.filter(pk__in=[pk for pk, _, _ in seeded[:5]]).delete()
+    Author.objects.create(name='extra')
+
+    snapshot = seed_model(Author, 20)
+
+    assert snapshot.exists()
+    assert get_user_model().objects.filter(pk=user.pk).exists()
+    restored = list(Author.objects.order_by('pk').values_list('pk', 'name', 'active'))
+    assert restored == seeded
+
+
+@pytest.mark.django_db
+def test_restore_keeps_rows_of_related_models(snapshot_dir):
+    Author.objects.create(name='a')
+    seed_model(Book, 10)
+    later = Author.objects.create(name='b')
+    Book.objects.all().delete()
+
+    seed_model(Book, 10)
+
+    assert Book.objects.count() == 10
+    assert Author.objects.filter(pk=later.pk).exists()
+
+
+def test_snapshot_name_changes_with_distributions():
+    base = snapshot_name(Author, 10, 0)
+    names = {
+        base,
+        snapshot_name(Author, 10, 0, {'name': ['a', 'b']}),
+        snapshot_name(Author, 10, 0, {'name': ['a', 'c']}),
+        snapshot_name(Author, 10, 0, {'name': lambda rng, index: 'x'}),
+        snapshot_name(Author, 10, 0, {'name': lambda rng, index: 'y'}),
+        snapshot_name(Author, 11, 0),
+        snapshot_name(Author, 10, 1),
+    }
+    assert len(names) == 7
+    assert snapshot_name(Author, 10, 0, {}) == base
+    assert snapshot_name(Author, 10, 0, {'name': ('a', 'b')}) == snapshot_name(
+        Author, 10, 0, {'name': ('a', 'b')}
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('vendor', ['sqlite', 'other'])
+def test_restore_does_not_cascade_into_other_tables(snapshot_dir, monkeypatch, vendor):
+    # Other vendors dump and load JSON Lines, which SQLite can run as well.
+    monkeypatch.setattr(connections['default'], 'vendor', vendor)
+    authors = [Author.objects.create(name=f'author {i}') for i in range(3)]
+    snapshot = DatabaseSnapshot('authors')
+    snapshot.save(Author)
+    book = Book.objects.create(title='kept', author=authors[0], pages=10)
+    Author.objects.create(name='extra')
+
+    snapshot.restore(Author)
+
+    assert list(Author.objects.order_by('pk')) == authors
+    assert Book.objects.get(pk=book.pk).author == authors[0]
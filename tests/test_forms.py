@@ -0,0 +1,63 @@
+import pytest
+from django.contrib import admin
+from django.test import Client
+from django_admin_tester.forms import FormChecker, FormParser, HeavyWidget
+from django_admin_tester.settings import override_admin_tester_settings
+from .admin import BookAdmin
+from .models import Author, Book
+
+site = admin.AdminSite(name='forms')
+
+
+class BookInline(admin.TabularInline):
+    model = Book
+
+
+@admin.register(Author, site=site)
+class AuthorAdmin(admin.ModelAdmin):
+    inlines = [BookInline]
+
+
+site.register(Book, BookAdmin)
+
+
+def checker(model_class):
+    return FormChecker(model_class, user=None, site=site, client=Client())
+
+
+@pytest.mark.django_db
+def test_heavy_widgets_flags_large_selects():
+    with override_admin_tester_settings(FORM_SELECT_LIMIT=3):
+        widgets = checker(Book).heavy_widgets({'author': 5, 'status': 50})
+    assert widgets == [HeavyWidget('author', 'author', 'tests.Author', 5)]
+
+
+@pytest.mark.django_db
+def test_heavy_widgets_count_rendered_options_and_skip_guarded_fields():
+    Author.objects.bulk_create(Author(name=f'author {i}') for i in range(10))
+    with override_admin_tester_settings(FORM_SELECT_LIMIT=3):
+        # A select narrowed to fewer options than the table has rows is fine.
+        assert checker(Book).heavy_widgets({'author': 2}) == []
+        # Tags are in raw_id_fields, so a select for them is never flagged.
+        widgets = checker(Book).heavy_widgets({'author': 11, 'tags': 10})
+        assert widgets == [HeavyWidget('author', 'author', 'tests.Author', 11)]
+
+
+@pytest.mark.django_db
+def test_heavy_widgets_reports_an_inline_once():
+    options = {'book_set-0-tags': 10, 'book_set-1-tags': 10, 'name': 10}
+    with override_admin_tester_settings(FORM_SELECT_LIMIT=3):
+        widgets = checker(Author).heavy_widgets(options)
+    assert widgets == [
+        HeavyWidget('book_set-0-tags', 'tags', 'tests.Tag', 10, 'tests.Book')
+    ]
+
+
+def test_form_parser_counts_nodes_and_options():
+    parser = FormParser()
+    parser.feed(
+        '<form><select name="author"><option>a</option><option>b</option></select>'
+        '<input name="title"/><select name="tags"></select></form>'
+    )
+    assert parser.options == {'author': 2, 'tags': 0}
+    assert parser.nodes == 6
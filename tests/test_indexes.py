@@ -0,0 +1,86 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django_admin_tester.indexes import IndexAdvisor, index_exists, plan_patterns
+from .models import Author, Book
+
+MYSQL_PLAN = (
+    '1 SIMPLE tests_book None ALL None None None None 1200 10.0 '
+    'Using where; Using filesort'
+)
+
+
+def test_mysql_full_scan_and_filesort():
+    patterns = plan_patterns('mysql', 'tests_book')
+    assert patterns['seq_scan'].search(MYSQL_PLAN)
+    assert patterns['filesort'].search(MYSQL_PLAN)
+    indexed = '1 SIMPLE tests_book None ref status status 82 const 12 100.0 None'
+    assert not patterns['seq_scan'].search(indexed)
+    assert not plan_patterns('mysql', 'tests_author')['seq_scan'].search(MYSQL_PLAN)
+
+
+def test_postgresql_full_scan_and_sort():
+    plan = (
+        'Limit  (cost=1.1..1.2 rows=100 width=8)\n'
+        '  ->  Sort  (cost=1.1..1.2 rows=1200 width=8)\n'
+        '        ->  Seq Scan on tests_book  (cost=0.0..1.0 rows=1200 width=8)'
+    )
+    patterns = plan_patterns('postgresql', 'tests_book')
+    assert patterns['seq_scan'].search(plan)
+    assert patterns['filesort'].search(plan)
+    assert not patterns['filesort'].search('Index Scan using tests_book_pkey')
+
+
+def test_sqlite_full_scan_and_temp_b_tree():
+    patterns = plan_patterns('sqlite', 'tests_book')
+    assert patterns['seq_scan'].search('5 0 0 SCAN tests_book')
+    assert patterns['seq_scan'].search('2 0 0 SCAN TABLE "tests_book"')
+    assert not patterns['seq_scan'].search(
+        '6 0 0 SCAN tests_book USING INDEX tests_book_author_id_6cd27928'
+    )
+    right_part = '36 0 0 USE TEMP B-TREE FOR RIGHT PART OF ORDER BY'
+    assert patterns['filesort'].search(right_part)
+    assert plan_patterns('oracle', 'tests_book') == {}
+
+
+@pytest.mark.django_db
+def test_sort_on_an_indexed_field_suggests_the_tie_break_too():
+    advisor = IndexAdvisor(Book, admin_user(), min_rows=0)
+    sorts = {
+        url: advisor.advise(attribute, fields, url, *advisor.explain(url))
+        for attribute, fields, url in advisor.variants()
+        if attribute == 'list_display'
+    }
+    # Column 2 is the author foreign key, already indexed on its own.
+    (advice,) = sorts['/admin/tests/book/?o=2']
+    assert advice.problem == 'filesort' and advice.fields == ('author',)
+    assert "fields=['author', '-id']" in advice.suggestion
+    assert "fields=['title', '-id']" in sorts['/admin/tests/book/?o=1'][0].suggestion
+
+
+@pytest.mark.django_db
+def test_filters_and_searches_that_scan_the_table():
+    advisor = IndexAdvisor(Book, admin_user(), min_rows=0)
+    advice = {
+        attribute: advisor.advise(attribute, fields, url, *advisor.explain(url))
+        for attribute, fields, url in advisor.variants()
+        if attribute != 'list_display'
+    }
+    assert advice['ordering'] == []
+    (scan,) = advice['list_filter']
+    assert (scan.problem, scan.fields) == ('seq_scan', ('status',))
+    assert "models.Index(fields=['status']" in scan.suggestion
+    (like,) = advice['search_fields']
+    assert (like.problem, like.fields) == ('like_scan', ('title',))
+
+
+def test_no_advice_when_an_index_serves_the_sort():
+    advisor = IndexAdvisor(Book, None, min_rows=0)
+    plan = '36 0 0 USE TEMP B-TREE FOR RIGHT PART OF ORDER BY'
+    assert advisor.advise('list_display', (), '/', plan, ('-pk',)) == []
+    assert index_exists(Book, ['author'])
+    assert index_exists(Author, ['-id'])
+    assert not index_exists(Book, ['author', '-id'])
+
+
+def admin_user():
+    return get_user_model().objects.create_superuser('admin', 'a@example.com', 'pw')
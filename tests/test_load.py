@@ -0,0 +1,56 @@
+import pytest
+from django_admin_tester.changelist import ChangelistUrl
+from django_admin_tester.load import LoadReport, LoadRequest, LoadSample, LoadTester
+from .test_async_checker import serve
+
+ACTION = LoadRequest(
+    ChangelistUrl('action', 'delete_selected', '/admin/tests/author/', 'delete'),
+    (('action', 'delete_selected'),),
+)
+
+
+def test_windows_split_samples_by_start():
+    report = LoadReport([0.0, 4.0], duration=10, interval=4)
+    report.add(LoadSample(0, 'a', 0.5, 0.1, 200))
+    report.add(LoadSample(0, 'a', 3.9, 0.3, 500))
+    report.add(LoadSample(1, 'a', 4.5, 0.2, 200))
+    report.add(LoadSample(1, 'a', 9.5, 1.0, None, 'timed out'))
+    # Samples finishing after the run count towards the last window.
+    report.add(LoadSample(1, 'a', 10.5, 0.4, 200))
+
+    first, second, last = report.windows()
+    assert (first.start, first.users, first.requests, first.errors) == (0, 1, 2, 1)
+    assert first.throughput == pytest.approx(0.5)
+    assert (first.p50, first.p99) == (0.1, 0.3)
+    assert (second.start, second.users, second.requests, second.errors) == (4, 2, 1, 0)
+    assert (last.start, last.requests, last.errors) == (8, 2, 1)
+    # The last window is cut short at the end of the run.
+    assert last.throughput == pytest.approx(1.0)
+    assert last.p50 == 0.4
+    assert report.totals().error_rate == pytest.approx(0.4)
+
+
+def test_windows_of_a_short_run():
+    assert len(LoadReport([0.0], duration=1, interval=5).windows()) == 1
+
+
+def test_csrf_token_is_retried_after_a_failed_fetch():
+    run, _, _ = serve(
+        [
+            b'HTTP/1.1 500 Internal Server Error\r\nContent-Length: 0\r\n\r\n',
+            b'HTTP/1.1 200 OK\r\nSet-Cookie: csrftoken=abc; Path=/\r\n'
+            b'Content-Length: 49\r\n\r\n'
+            b'<input name="csrfmiddlewaretoken" value="token1">',
+        ]
+    )
+    tester = LoadTester('http://127.0.0.1', ['key'], [ACTION], ramp_up=0)
+    headers = {'Cookie': 'sessionid=key'}
+
+    async def fetch_twice(connection):
+        return [
+            await tester.csrf_token(connection, ACTION, headers),
+            await tester.csrf_token(connection, ACTION, headers),
+        ]
+
+    assert run(fetch_twice) == [None, 'token1']
+    assert headers['Cookie'] == 'sessionid=key; csrftoken=abc'
@@ -0,0 +1,73 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django_admin_tester.changelist import ChangelistUrl
+from django_admin_tester.pagination import (
+    PageProbe,
+    PageSample,
+    PaginationChecker,
+    pagination_probes,
+)
+from django_admin_tester.settings import override_admin_tester_settings
+from .models import Author
+
+
+def admin_user():
+    return get_user_model().objects.create_superuser('admin', 'a@example.com', 'pw')
+
+
+def probes(rows):
+    Author.objects.bulk_create(Author(name=f'author {i}') for i in range(rows))
+    return {
+        probe.item.label: (probe.item.url, probe.offset)
+        for probe in pagination_probes(Author, admin_user())
+    }
+
+
+@pytest.mark.django_db
+def test_probes_of_a_long_changelist():
+    assert probes(250) == {
+        'first': ('/admin/tests/author/?p=1', 0),
+        'middle': ('/admin/tests/author/?p=2', 100),
+        'last': ('/admin/tests/author/?p=3', 200),
+    }
+
+
+@pytest.mark.django_db
+def test_probes_skip_coinciding_pages_and_allow_show_all():
+    assert probes(150) == {
+        'first': ('/admin/tests/author/?p=1', 0),
+        'last': ('/admin/tests/author/?p=2', 100),
+        'show all': ('/admin/tests/author/?all=', 0),
+    }
+
+
+@pytest.mark.django_db
+def test_probes_of_an_empty_changelist():
+    assert list(probes(0)) == ['first']
+
+
+def sample(label, offset, duration):
+    item = ChangelistUrl('pagination', label, '/', f"page {offset // 100 + 1}")
+    return PageSample(PageProbe(item, offset), duration, 3, 1, 0.001)
+
+
+def checker(*samples):
+    checker = PaginationChecker(Author, None, client=object())
+    checker.samples = list(samples)
+    return checker
+
+
+def test_deep_page_problem():
+    slow = checker(sample('first', 0, 0.01), sample('last', 10000, 0.05))
+    with override_admin_tester_settings(DEEP_PAGE_RATIO=3.0):
+        message = slow.deep_page_problem()
+        assert 'page 101 (offset 10000) took 50.0ms vs 10.0ms' in message
+        assert '+4.00ms per 1000 rows' in message
+    # Below the ratio, or by less than DEEP_PAGE_MIN_DELTA, is not flagged.
+    # "Show all" is not a deep page, and one page cannot be compared.
+    for pages in (
+        (sample('first', 0, 0.1), sample('last', 100, 0.2)),
+        (sample('first', 0, 0.001), sample('last', 100, 0.01)),
+        (sample('first', 0, 0.01), sample('show all', 0, 1.0)),
+    ):
+        assert checker(*pages).deep_page_problem() is None
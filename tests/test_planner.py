@@ -0,0 +1,77 @@
+import itertools
+import pytest
+from django_admin_tester.exceptions import AdminTesterConfigError
+from django_admin_tester.planner import (
+    FilterChoice,
+    FilterPlanner,
+    compatible,
+    normalize_query,
+    parse_query,
+)
+
+
+def group(title, count, parameter=None):
+    parameter = parameter or title
+    return [
+        FilterChoice(title, f"{title} {value}", ((parameter, str(value)),))
+        for value in range(count)
+    ]
+
+
+def test_single_applies_each_choice_alone():
+    planner = FilterPlanner([group('a', 2), group('b', 3)], 'single')
+    assert [combination.query for combination in planner.plan()] == [
+        '?a=0',
+        '?a=1',
+        '?b=0',
+        '?b=1',
+        '?b=2',
+    ]
+
+
+def test_pairwise_covers_every_pair():
+    groups = [group('a', 3), group('b', 3), group('c', 2), group('d', 2)]
+    plan = FilterPlanner(groups, 'pairwise').plan()
+    covered = {
+        pair
+        for combination in plan
+        for pair in itertools.combinations(combination.choices, 2)
+    }
+    for first, second in itertools.combinations(groups, 2):
+        for pair in itertools.product(first, second):
+            assert pair in covered
+    assert len(plan) < 3 * 3 * 2 * 2
+
+
+def test_pairwise_skips_clashing_parameters():
+    # Both filters set the same parameter, so they cannot be combined.
+    groups = [group('a', 2, 'status'), group('b', 2, 'status')]
+    plan = FilterPlanner(groups, 'pairwise').plan()
+    assert {combination.query for combination in plan} == {
+        '?status=0',
+        '?status=1',
+    }
+
+
+def test_full_falls_back_to_pairwise_over_the_limit():
+    groups = [group('a', 3), group('b', 3), group('c', 3)]
+    assert len(FilterPlanner(groups, 'full', limit=100).plan()) == 27
+    assert len(FilterPlanner(groups, 'full', limit=20).plan()) < 27
+
+
+def test_plans_stop_at_the_limit():
+    groups = [group('a', 5), group('b', 5)]
+    assert len(FilterPlanner(groups, 'pairwise', limit=4).plan()) == 4
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(AdminTesterConfigError):
+        FilterPlanner([], 'some')
+
+
+def test_queries_are_normalized():
+    assert parse_query('?b=2&a=1&a=1') == (('a', '1'), ('b', '2'))
+    assert normalize_query([('b', '2'), ('a', '1')]) == '?a=1&b=2'
+    assert normalize_query([]) == ''
+    first, second = group('a', 2)
+    assert compatible(first, first) and not compatible(first, second)
@@ -0,0 +1,134 @@
+import pytest
+from django.test import override_settings
+from django_admin_tester.exceptions import AdminTesterConfigError
+from django_admin_tester.settings import (
+    AdminTesterSettings,
+    admin_tester_settings,
+    from_environment,
+    override_admin_tester_settings,
+    validate,
+)
+
+
+@pytest.mark.parametrize(
+    'name, value',
+    [
+        ('WAIT_TIMEOUT', 10),
+        ('COUNT_QUERY_THRESHOLD', 0),
+        ('SCREENSHOT_DIR', None),
+        ('BROWSER', 'firefox'),
+        ('WINDOW_SIZE', [800, 600]),
+        ('RESULT_FORMATS', ('jsonl', 'junit')),
+        ('ACTION_SIZES', (10, None)),
+        ('SHARD', '1/1'),
+        ('CUSTOM_WAIT_CONDITIONS', {}),
+    ],
+)
+def test_valid_settings(name, value):
+    validate(name, value)
+
+
+@pytest.mark.parametrize(
+    'name, value',
+    [
+        ('WAIT_TIMEOUT', -1),
+        ('WAIT_TIMEOUT', '10'),
+        ('PARALLEL_WORKERS', 0),
+        ('HEADLESS', 1),
+        ('BROWSER', 'safari'),
+        ('WINDOW_SIZE', (800,)),
+        ('RESULT_FORMATS', ('xml',)),
+        ('ACTION_SIZES', (0,)),
+        ('SHARD', '3/2'),
+        ('CUSTOM_WAIT_CONDITIONS', []),
+    ],
+)
+def test_invalid_settings(name, value):
+    with pytest.raises(AdminTesterConfigError):
+        validate(name, value)
+
+
+def test_settings_are_read_in_order():
+    nested = {'WAIT_TIMEOUT': 3, 'IMPLICIT_WAIT': 4}
+    with override_settings(ADMIN_TESTER_SETTINGS=nested, ADMIN_TESTER_WAIT_TIMEOUT=5):
+        resolved = AdminTesterSettings(PARALLEL_WORKERS=2)
+    assert (resolved.WAIT_TIMEOUT, resolved.IMPLICIT_WAIT) == (5, 4)
+    assert resolved.PARALLEL_WORKERS == 2
+    assert resolved.WINDOW_SIZE == (1920, 1080)
+
+
+def test_unknown_and_invalid_settings_are_rejected():
+    with override_settings(ADMIN_TESTER_SETTINGS={'WAIT_TIMOUT': 3}):
+        with pytest.raises(AdminTesterConfigError, match='WAIT_TIMOUT'):
+            AdminTesterSettings()
+    with override_settings(ADMIN_TESTER_BROWSER='safari'):
+        with pytest.raises(AdminTesterConfigError, match='BROWSER'):
+            admin_tester_settings.validate()
+
+
+def test_settings_are_read_only_and_frozen():
+    resolved = AdminTesterSettings(FIRST_PARTY_HOSTS=['localhost'])
+    assert resolved.FIRST_PARTY_HOSTS == ('localhost',)
+    with pytest.raises(AttributeError):
+        resolved.WAIT_TIMEOUT = 1
+    with pytest.raises(TypeError):
+        resolved.CUSTOM_WAIT_CONDITIONS['x'] = None
+    assert resolved.replace(WAIT_TIMEOUT=1).WAIT_TIMEOUT == 1
+
+
+def test_override_and_reload():
+    default = admin_tester_settings.WAIT_TIMEOUT
+    with override_admin_tester_settings(WAIT_TIMEOUT=1):
+        with override_admin_tester_settings(IMPLICIT_WAIT=2):
+            assert admin_tester_settings.WAIT_TIMEOUT == 1
+            assert admin_tester_settings.IMPLICIT_WAIT == 2
+    assert admin_tester_settings.WAIT_TIMEOUT == default
+    with override_settings(ADMIN_TESTER_WAIT_TIMEOUT=7):
+        assert admin_tester_settings.WAIT_TIMEOUT == 7
+    assert admin_tester_settings.WAIT_TIMEOUT == default
+
+
+@pytest.mark.parametrize('raw', ['1', 'true', 'Yes', ' on '])
+def test_environment_turns_boolean_on(monkeypatch, raw):
+    monkeypatch.setenv('ADMIN_TESTER_FORCE_FULL_RUN', raw)
+    assert AdminTesterSettings().FORCE_FULL_RUN is True
+
+
+@pytest.mark.parametrize('raw', ['0', 'false', 'No', 'off'])
+def test_environment_turns_boolean_off(monkeypatch, raw):
+    monkeypatch.setenv('ADMIN_TESTER_FORCE_FULL_RUN', raw)
+    with override_settings(ADMIN_TESTER_FORCE_FULL_RUN=True):
+        assert AdminTesterSettings().FORCE_FULL_RUN is False
+
+
+def test_empty_environment_keeps_the_setting(monkeypatch):
+    monkeypatch.setenv('ADMIN_TESTER_FORCE_FULL_RUN', '')
+    with override_settings(ADMIN_TESTER_FORCE_FULL_RUN=True):
+        assert AdminTesterSettings().FORCE_FULL_RUN is True
+
+
+def test_invalid_environment_boolean_is_rejected(monkeypatch):
+    monkeypatch.setenv('ADMIN_TESTER_FORCE_FULL_RUN', 'maybe')
+    with pytest.raises(AdminTesterConfigError, match='ADMIN_TESTER_FORCE_FULL_RUN'):
+        AdminTesterSettings()
+
+
+def test_environment_string_is_validated(monkeypatch):
+    monkeypatch.setenv('ADMIN_TESTER_SHARD', '2/4')
+    assert AdminTesterSettings().SHARD == '2/4'
+    monkeypatch.setenv('ADMIN_TESTER_SHARD', '5/4')
+    with pytest.raises(AdminTesterConfigError, match='SHARD'):
+        AdminTesterSettings()
+
+
+def test_environment_values_are_coerced():
+    assert from_environment('PARALLEL_WORKERS', ' 4 ') == 4
+    assert from_environment('DEEP_PAGE_RATIO', '2.5') == 2.5
+    assert from_environment('LOAD_ACTIONS', 'delete_selected, ') == ('delete_selected',)
+    with pytest.raises(AdminTesterConfigError, match='expected an integer'):
+        from_environment('PARALLEL_WORKERS', 'many')
+
+
+def test_explicit_overrides_beat_the_environment(monkeypatch):
+    monkeypatch.setenv('ADMIN_TESTER_FORCE_FULL_RUN', '1')
+    assert AdminTesterSettings(FORCE_FULL_RUN=False).FORCE_FULL_RUN is False
@@ -0,0 +1,116 @@
+import unittest
+import pytest
+from django_admin_tester.exceptions import AdminTesterConfigError
+from django_admin_tester.settings import override_admin_tester_settings
+from django_admin_tester.sharding import (
+    Shard,
+    parse_shard,
+    recorded_durations,
+    shard_groups,
+    shard_items,
+    shard_tests,
+    split_weighted,
+)
+from django_admin_tester.timing import Interaction, TimingReport
+
+
+def write_timings(path, durations):
+    report = TimingReport()
+    for url, duration in durations.items():
+        report.add(Interaction('app.Model', 'load', url, url, url, duration))
+    return report.write_json(str(path))
+
+
+def test_split_weighted_balances_heaviest_first():
+    weights = {'a': 5, 'b': 4, 'c': 3, 'd': 3, 'e': 1}
+    buckets = split_weighted(list(weights), weights.__getitem__, 2)
+    assert buckets == [['a', 'd'], ['b', 'c', 'e']]
+    assert sorted(item for bucket in buckets for item in bucket) == sorted(weights)
+
+
+def test_split_weighted_breaks_ties_by_position():
+    items = list(range(7))
+    assert split_weighted(items, lambda item: 1.0, 3) == [[0, 3, 6], [1, 4], [2, 5]]
+    assert split_weighted([], lambda item: 1.0, 2) == [[], []]
+
+
+def test_shard_items_covers_every_item_exactly_once():
+    items = [f'/admin/app/model{i}/' for i in range(10)]
+    durations = {items[0]: 9.0, items[1]: 0.5, items[2]: 0.5}
+    shards = [shard_items(items, Shard(i, 3), durations) for i in (1, 2, 3)]
+    assert sorted(item for shard in shards for item in shard) == sorted(items)
+    # Unknown items weigh the median of the recorded ones, so the slow one is alone.
+    assert shards[0] == [items[0]]
+
+
+def test_shard_groups_keeps_each_group_on_one_shard():
+    items = [(model, f'/admin/{model}/?{i}') for model in 'abcd' for i in range(3)]
+    durations = {'/admin/a/?0': 10.0, '/admin/b/?0': 1.0, '/admin/c/?0': 1.0}
+    shards = [
+        shard_groups(
+            items,
+            Shard(i, 2),
+            durations,
+            group=lambda item: item[0],
+            key=lambda item: item[1],
+        )
+        for i in (1, 2)
+    ]
+    assert shards[0] == [item for item in items if item[0] == 'a']
+    assert shards[1] == [item for item in items if item[0] != 'a']
+
+
+def test_parse_shard():
+    assert parse_shard(' 2/4 ') == Shard(2, 4)
+    assert parse_shard('2/4').suffix == '-shard2of4'
+    for value in ('0/4', '5/4', 'two'):
+        with pytest.raises(AdminTesterConfigError):
+            parse_shard(value)
+
+
+def test_durations_without_shared_timings_are_empty(tmp_path):
+    write_timings(tmp_path / 'AdminTest-timings.json', {'/admin/': 2.0})
+    with override_admin_tester_settings(REPORT_DIR=str(tmp_path)):
+        assert recorded_durations() == ({}, {})
+
+
+def test_durations_come_from_shared_timings(tmp_path):
+    write_timings(tmp_path / 'AdminTest-timings.json', {'/admin/?o=1': 2.0})
+    write_timings(tmp_path / 'Other-timings-shard1of2.json', {'/other/': 1.0})
+    with override_admin_tester_settings(SHARD_TIMINGS=str(tmp_path)):
+        by_class, by_url = recorded_durations()
+    assert by_class == {'AdminTest': 2.0, 'Other': 1.0}
+    assert by_url == {'/admin/?o=1': 2.0, '/other/': 1.0}
+    single = str(tmp_path / 'AdminTest-timings.json')
+    assert recorded_durations(single)[0] == {'AdminTest': 2.0}
+
+
+def test_missing_shared_timings_are_an_error(tmp_path):
+    with pytest.raises(AdminTesterConfigError):
+        recorded_durations(str(tmp_path / 'missing'))
+
+
+
+def test_shard_tests_splits_classes_and_shares_the_rest():
+    class Fast(unittest.TestCase):
+        def test_one(self):
+            pass
+
+        def test_two(self):
+            pass
+
+    class Slow(unittest.TestCase):
+        def test_one(self):
+            pass
+
+    class Shared(unittest.TestCase):
+        shard_within_class = True
+
+        def test_one(self):
+            pass
+
+    tests = [Fast('test_one'), Fast('test_two'), Slow('test_one'), Shared('test_one')]
+    durations = {'Fast': 1.0, 'Slow': 5.0}
+    first, second = (shard_tests(tests, Shard(i, 2), durations) for i in (1, 2))
+    assert first == [Slow('test_one'), Shared('test_one')]
+    assert second == [Fast('test_one'), Fast('test_two'), Shared('test_one')]
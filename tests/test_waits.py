@@ -0,0 +1,19 @@
+from unittest import mock
+from django_admin_tester.waits import document_ready
+
+
+def driver(state, strategy='normal'):
+    fake = mock.Mock(capabilities={'pageLoadStrategy': strategy})
+    fake.execute_script.return_value = state
+    return fake
+
+
+def test_complete_document_is_ready():
+    assert document_ready(driver('complete'))
+    assert document_ready(driver('complete', 'eager'))
+
+
+def test_interactive_document_is_ready_only_for_eager_loading():
+    assert not document_ready(driver('interactive'))
+    assert document_ready(driver('interactive', 'eager'))
+    assert not document_ready(driver('loading', 'eager'))